@@ -145,6 +145,8 @@ from config.settings.jwt import *  # noqa
 from config.settings.logging import *  # noqa
 from config.settings.oauth import *  # noqa
 from config.settings.celery import *  # noqa
+from config.settings.cache import *  # noqa
+from config.settings.reservations import *  # noqa
 from config.settings.slack import *  # noqa
 
 from config.settings.debug_toolbar.settings import *  # noqa
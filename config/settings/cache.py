@@ -0,0 +1,24 @@
+from config.env import env
+
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("REDIS_CACHE_URL", default="redis://localhost:6379/1"),
+    }
+}
+
+# 반려동물 유치원 예약 캘린더(휴무일, 정원 초과일) 캐시
+PET_KINDERGARDEN_CALENDAR_CACHE_HORIZON_DAYS = env.int("PET_KINDERGARDEN_CALENDAR_CACHE_HORIZON_DAYS", default=365)
+PET_KINDERGARDEN_CALENDAR_CACHE_FRESH_TIMEOUT = env.int("PET_KINDERGARDEN_CALENDAR_CACHE_FRESH_TIMEOUT", default=60)
+PET_KINDERGARDEN_CALENDAR_CACHE_STALE_TIMEOUT = env.int(
+    "PET_KINDERGARDEN_CALENDAR_CACHE_STALE_TIMEOUT", default=60 * 60 * 24
+)
+
+# 여러 프로세스가 동시에 같은 캘린더를 생성하지 않도록 Redis 잠금 사용 여부
+PET_KINDERGARDEN_CALENDAR_CACHE_BUILD_LOCK_ENABLED = env.bool(
+    "PET_KINDERGARDEN_CALENDAR_CACHE_BUILD_LOCK_ENABLED", default=True
+)
+
+# 캘린더 캐시 예열 시 하나의 테스크가 처리할 반려동물 유치원 수
+PET_KINDERGARDEN_CALENDAR_CACHE_WARM_CHUNK_SIZE = env.int("PET_KINDERGARDEN_CALENDAR_CACHE_WARM_CHUNK_SIZE", default=50)
@@ -0,0 +1,27 @@
+from config.env import env
+
+# 일별 예약 현황(DailyReservation) 샤딩
+# 지정한 반려동물 유치원은 하루 예약 현황을 여러 행으로 나누어 증가시키고, 조회 시 합산합니다.
+DAILY_RESERVATION_SHARD_COUNT = env.int("DAILY_RESERVATION_SHARD_COUNT", default=8)
+DAILY_RESERVATION_SHARDED_PET_KINDERGARDEN_IDS = env.list(
+    "DAILY_RESERVATION_SHARDED_PET_KINDERGARDEN_IDS", cast=int, default=[]
+)
+# 샤딩할 유치원이 없으면 샤드 컬럼(DailyReservation.shard)을 사용하는 코드(DB 함수의 샤드 분기, 샤드 압축)를 사용하지 않음
+DAILY_RESERVATION_SHARDING_ENABLED = DAILY_RESERVATION_SHARD_COUNT > 1 and bool(
+    DAILY_RESERVATION_SHARDED_PET_KINDERGARDEN_IDS
+)
+
+# 시간권/종일권 예약의 쓰기 단계를 DB 함수(migrate 시 생성)로 처리할지 여부
+RESERVATION_BOOKING_FUNCTION_ENABLED = env.bool("RESERVATION_BOOKING_FUNCTION_ENABLED", default=False)
+
+# 고객 티켓 낙관적 락 충돌 시 재시도 횟수와 재시도 대기 시간(초, 재시도마다 두 배로 증가하는 범위에서 임의로 대기)
+CUSTOMER_TICKET_LOCK_MAX_RETRIES = env.int("CUSTOMER_TICKET_LOCK_MAX_RETRIES", default=3)
+CUSTOMER_TICKET_LOCK_RETRY_BASE_DELAY = env.float("CUSTOMER_TICKET_LOCK_RETRY_BASE_DELAY", default=0.02)
+# 충돌/재시도/실패 집계 보관 기간(초)
+CUSTOMER_TICKET_LOCK_TELEMETRY_TIMEOUT = env.int("CUSTOMER_TICKET_LOCK_TELEMETRY_TIMEOUT", default=60 * 60 * 24)
+
+# 예약 생성/취소 Idempotency-Key 응답 보관 기간, 처리 중 선점 유지 시간, 중복 요청 대기 시간(초)
+# 선점은 처리하는 동안 계속 연장되므로, 선점 유지 시간은 처리 중인 프로세스가 종료됐을 때 선점이 풀리기까지의 시간입니다.
+IDEMPOTENCY_KEY_TIMEOUT = env.int("IDEMPOTENCY_KEY_TIMEOUT", default=60 * 60 * 24)
+IDEMPOTENCY_LOCK_TIMEOUT = env.int("IDEMPOTENCY_LOCK_TIMEOUT", default=30)
+IDEMPOTENCY_WAIT_TIMEOUT = env.int("IDEMPOTENCY_WAIT_TIMEOUT", default=10)
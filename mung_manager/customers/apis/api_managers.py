@@ -5,6 +5,7 @@ from rest_framework import status
 from mung_manager.customers.apis.apis import (
     CustomerActiveStatusAPI,
     CustomerCreateReservationAPI,
+    CustomerReservationBulkCancelAPI,
     CustomerReservationCancelAPI,
     CustomerReservationDetailListAPI,
     CustomerReservationListAPI,
@@ -40,10 +41,12 @@ from mung_manager.schemas.errors.pet_kindergardens import (
 from mung_manager.schemas.errors.reservations import (
     ErrorInvalidAttendanceTimeSchema,
     ErrorInvalidEndAtSchema,
+    ErrorIdempotencyRequestInProgressSchema,
     ErrorInvalidReservedAtSchema,
     ErrorReservationNotFoundSchema,
 )
 from mung_manager.schemas.errors.tickets import ErrorTicketNotFoundSchema
+from mung_manager.schemas.parameters.reservations import ParameterIdempotencyKeySchema
 from mung_manager_commons.base import BaseAPIManager
 
 
@@ -149,7 +152,9 @@ class CustomerReservationAPIManager(BaseAPIManager):
         description="""
         Rogic
             - 고객의 반려동물 유치원 예약하기 API 입니다.
+            - Idempotency-Key 헤더를 보내면 같은 키로 재시도한 요청은 처음 처리한 응답을 그대로 반환합니다.
         """,
+        parameters=[ParameterIdempotencyKeySchema],
         request=VIEWS_BY_METHOD["POST"]().cls.InputSerializer,
         responses={
             status.HTTP_200_OK: VIEWS_BY_METHOD["POST"]().cls.OutputSerializer,
@@ -198,6 +203,7 @@ class CustomerReservationAPIManager(BaseAPIManager):
                 response=OpenApiTypes.OBJECT,
                 examples=[
                     ErrorCustomerTicketConflictSchema,
+                    ErrorIdempotencyRequestInProgressSchema,
                 ],
             ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
@@ -317,7 +323,9 @@ class CustomerReservationCancelAPIManager(BaseAPIManager):
         description="""
         Rogic
             - 고객의 반려동물 유치원 예약 취소 API 입니다.
+            - Idempotency-Key 헤더를 보내면 같은 키로 재시도한 요청은 처음 처리한 응답을 그대로 반환합니다.
         """,
+        parameters=[ParameterIdempotencyKeySchema],
         responses={
             status.HTTP_204_NO_CONTENT: OpenApiTypes.NONE,
             status.HTTP_400_BAD_REQUEST: OpenApiResponse(
@@ -351,6 +359,10 @@ class CustomerReservationCancelAPIManager(BaseAPIManager):
                     ErrorPetKindergardenNotFoundSchema,
                 ],
             ),
+            status.HTTP_409_CONFLICT: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[ErrorIdempotencyRequestInProgressSchema],
+            ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
                 response=OpenApiTypes.OBJECT, examples=[ErrorUnknownServerSchema]
             ),
@@ -360,6 +372,68 @@ class CustomerReservationCancelAPIManager(BaseAPIManager):
         return self.VIEWS_BY_METHOD["DELETE"]()(request, *args, **kwargs)
 
 
+class CustomerReservationBulkCancelAPIManager(BaseAPIManager):
+    VIEWS_BY_METHOD = {
+        "POST": CustomerReservationBulkCancelAPI.as_view,
+    }
+
+    @extend_schema(
+        tags=["고객"],
+        summary="고객의 반려동물 유치원 예약 일괄 취소",
+        description="""
+        Rogic
+            - 고객의 반려동물 유치원 예약 여러 건을 한 번에 취소하는 API 입니다.
+            - 취소할 수 있는 예약만 취소하고, 예약 아이디별 취소 여부와 실패 사유를 반환합니다.
+            - Idempotency-Key 헤더를 보내면 같은 키로 재시도한 요청은 처음 처리한 응답을 그대로 반환합니다.
+        """,
+        parameters=[ParameterIdempotencyKeySchema],
+        request=VIEWS_BY_METHOD["POST"]().cls.InputSerializer,
+        responses={
+            status.HTTP_200_OK: VIEWS_BY_METHOD["POST"]().cls.OutputSerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorInvalidParameterFormatSchema,
+                ],
+            ),
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorAuthenticationFailedSchema,
+                    ErrorNotAuthenticatedSchema,
+                    ErrorInvalidTokenSchema,
+                    ErrorAuthorizationHeaderSchema,
+                    ErrorAuthenticationPasswordChangedSchema,
+                    ErrorAuthenticationUserDeletedSchema,
+                    ErrorAuthenticationUserInactiveSchema,
+                    ErrorAuthenticationUserNotFoundSchema,
+                    ErrorTokenIdentificationSchema,
+                ],
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[ErrorPermissionDeniedSchema],
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorPetKindergardenNotFoundSchema,
+                    ErrorCustomerNotFoundSchema,
+                ],
+            ),
+            status.HTTP_409_CONFLICT: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[ErrorIdempotencyRequestInProgressSchema],
+            ),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorUnknownServerSchema]
+            ),
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        return self.VIEWS_BY_METHOD["POST"]()(request, *args, **kwargs)
+
+
 class CustomerActiveStatusAPIManager(BaseAPIManager):
     VIEWS_BY_METHOD = {
         "GET": CustomerActiveStatusAPI.as_view,
@@ -5,6 +5,7 @@ from rest_framework.views import APIView
 
 from mung_manager.customers.containers import CustomerContainer
 from mung_manager.reservations.containers import ReservationContainer
+from mung_manager.reservations.idempotency import idempotency_store
 from mung_manager_commons.base import BaseSerializer
 from mung_manager_commons.constants import SYSTEM_CODE
 from mung_manager_commons.mixins import GuestAPIAuthMixin
@@ -198,10 +199,63 @@ class CustomerReservationCancelAPI(GuestAPIAuthMixin, APIView):
         self._reservation_service = ReservationContainer.reservation_service()
 
     def delete(self, request: Request, reservation_id: int) -> Response:
+        # 같은 Idempotency-Key로 재시도한 요청은 저장된 응답을 반환
+        return idempotency_store.run(
+            request=request,
+            scope="cancel_reservation",
+            handler=lambda: self._cancel(request, reservation_id),
+        )
+
+    def _cancel(self, request: Request, reservation_id: int) -> Response:
         self._reservation_service.cancel_reservation(request.pet_kindergarden, reservation_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class CustomerReservationBulkCancelAPI(GuestAPIAuthMixin, APIView):
+    class InputSerializer(BaseSerializer):
+        reservation_ids = serializers.ListField(
+            label="예약 아이디 목록",
+            child=serializers.IntegerField(label="예약 아이디"),
+            min_length=1,
+            max_length=100,
+        )
+
+    class OutputSerializer(BaseSerializer):
+        reservation_id = serializers.IntegerField(label="예약 아이디")
+        is_canceled = serializers.BooleanField(label="취소 여부")
+        code = serializers.CharField(label="취소 실패 코드", allow_null=True)
+        message = serializers.CharField(label="취소 실패 메시지", allow_null=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._customer_selector = CustomerContainer.customer_selector()
+        self._reservation_service = ReservationContainer.reservation_service()
+
+    def post(self, request: Request) -> Response:
+        # 같은 Idempotency-Key로 재시도한 요청은 저장된 응답을 반환
+        return idempotency_store.run(
+            request=request,
+            scope="cancel_reservations",
+            handler=lambda: self._cancel(request),
+        )
+
+    def _cancel(self, request: Request) -> Response:
+        input_serializer = self.InputSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        user = request.user
+        pet_kindergarden = request.pet_kindergarden
+        customer = get_object_or_not_found(
+            self._customer_selector.get_by_user_and_pet_kindergarden_id(user, pet_kindergarden.id),
+            msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
+            code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER"),
+        )
+        results = self._reservation_service.cancel_reservations(
+            customer, pet_kindergarden, input_serializer.validated_data["reservation_ids"]
+        )
+        data = self.OutputSerializer(results, many=True).data
+        return Response(data=data, status=status.HTTP_200_OK)
+
+
 class CustomerCreateReservationAPI(GuestAPIAuthMixin, APIView):
 
     class InputSerializer(BaseSerializer):
@@ -230,6 +284,14 @@ class CustomerCreateReservationAPI(GuestAPIAuthMixin, APIView):
         self._reservation_service = ReservationContainer.reservation_service()
 
     def post(self, request: Request) -> Response:
+        # 같은 Idempotency-Key로 재시도한 요청은 저장된 응답을 반환
+        return idempotency_store.run(
+            request=request,
+            scope="create_reservation",
+            handler=lambda: self._create(request),
+        )
+
+    def _create(self, request: Request) -> Response:
         input_serializer = self.InputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         user = request.user
@@ -3,6 +3,7 @@ from django.urls import path
 from mung_manager.customers.apis.api_managers import (
     CustomerActiveStatusAPIManager,
     CustomerReservationAPIManager,
+    CustomerReservationBulkCancelAPIManager,
     CustomerReservationCancelAPIManager,
     CustomerReservationDetailListAPIManager,
     CustomerTicketCountAPIManager,
@@ -35,6 +36,11 @@ urlpatterns = [
         CustomerReservationCancelAPIManager.as_view(),
         name="customer-reservation-cancel",
     ),
+    path(
+        "/reservations/cancel",
+        CustomerReservationBulkCancelAPIManager.as_view(),
+        name="customer-reservation-bulk-cancel",
+    ),
     path(
         "/active",
         CustomerActiveStatusAPIManager.as_view(),
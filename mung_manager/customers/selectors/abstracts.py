@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Annotated, Any, Optional
 
 from django.db.models.query import QuerySet
+from django_stubs_ext import ValuesQuerySet
 
 from mung_manager.customers.types import is_expired_type
 from mung_manager_commons.errors import NotImplementedException
@@ -51,6 +52,10 @@ class AbstractCustomerPetSelector(ABC):
     def exists_by_customer_and_pet_id(self, customer: Customer, pet_id: int) -> bool:
         raise NotImplementedException()
 
+    @abstractmethod
+    def get_by_customer_and_pet_id(self, customer: Customer, pet_id: int) -> Optional[CustomerPet]:
+        raise NotImplementedException()
+
     @abstractmethod
     def get_by_pet_id_for_pet_name(self, pet_id: int) -> Optional[str]:
         raise NotImplementedException()
@@ -81,6 +86,14 @@ class AbstractCustomerTicketSelector(ABC):
     def get_queryset_by_customer_for_hotel_ticket_type(self, customer: Customer) -> QuerySet[CustomerTicket]:
         raise NotImplementedException()
 
+    @abstractmethod
+    def get_queryset_with_ticket_by_customer_for_available_ticket(self, customer: Customer) -> QuerySet[CustomerTicket]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_queryset_for_pet_kindergarden_ids_with_available_ticket(self) -> ValuesQuerySet[CustomerTicket, int]:
+        raise NotImplementedException()
+
     @abstractmethod
     def get_for_all_day_or_time_ticket_type(
         self, customer: Customer, ticket_type: str, ticket_id: Optional[int]
@@ -36,6 +36,23 @@ class CustomerPetSelector(AbstractCustomerPetSelector):
         """
         return CustomerPet.objects.filter(customer=customer, id=pet_id, is_deleted=False).exists()
 
+    def get_by_customer_and_pet_id(self, customer: Customer, pet_id: int) -> Optional[CustomerPet]:
+        """
+        이 함수는 고객 객체와 반려동물 아이디로 반려동물을 조회합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+            pet_id (int): 반려동물 아이디
+
+        Returns:
+            Optional[CustomerPet]: 반려동물이 존재하지 않을 경우 None 반환
+        """
+        try:
+            return CustomerPet.objects.filter(customer=customer, id=pet_id, is_deleted=False).get()
+
+        except CustomerPet.DoesNotExist:
+            return None
+
     def get_by_pet_id_for_pet_name(self, pet_id: int) -> Optional[str]:
         """
         이 함수는 반려동물 아이디로 반려동물의 이름을 조회합니다.
@@ -15,6 +15,7 @@ from django.db.models import (
 )
 from django.db.models.functions import Concat
 from django.utils import timezone
+from django_stubs_ext import ValuesQuerySet
 
 from mung_manager.customers.selectors.abstracts import AbstractCustomerTicketSelector
 from mung_manager.customers.types import is_expired_type
@@ -185,6 +186,45 @@ class CustomerTicketSelector(AbstractCustomerTicketSelector):
             ticket__usage_time=0,
         ).select_related("ticket")
 
+    def get_queryset_with_ticket_by_customer_for_available_ticket(self, customer: Customer) -> QuerySet[CustomerTicket]:
+        """
+        고객 객체로 해당 고객이 소유하고 있는 만료되지 않은 잔여 티켓 목록을 티켓 정보와 함께 조회합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+
+        Returns:
+            QuerySet[CustomerTicket]: 만료일 순으로 정렬되며, 소유하고 있는 티켓이 존재하지 않으면 빈 쿼리셋을 반환합니다.
+        """
+
+        return (
+            CustomerTicket.objects.filter(
+                customer=customer,
+                expired_at__gte=timezone.now(),
+                unused_count__gt=0,
+            )
+            .select_related("ticket")
+            .order_by("expired_at")
+        )
+
+    def get_queryset_for_pet_kindergarden_ids_with_available_ticket(self) -> ValuesQuerySet[CustomerTicket, int]:
+        """
+        만료되지 않은 잔여 티켓을 가진 고객이 있는 반려동물 유치원 아이디 목록을 조회합니다.
+
+        Returns:
+            ValuesQuerySet[CustomerTicket, int]: 중복 없이 오름차순으로 정렬된 반려동물 유치원 아이디 쿼리셋
+        """
+
+        return (
+            CustomerTicket.objects.filter(
+                expired_at__gte=timezone.now(),
+                unused_count__gt=0,
+            )
+            .values_list("customer__pet_kindergarden_id", flat=True)
+            .order_by("customer__pet_kindergarden_id")
+            .distinct()
+        )
+
     def get_for_all_day_or_time_ticket_type(
         self, customer: Customer, ticket_type: str, ticket_id: Optional[int]
     ) -> Optional[CustomerTicket]:
@@ -7,7 +7,10 @@ from mung_manager.reservations.apis.apis import (
     ReservationCustomerTicketTypeDetailAPI,
     ReservationCustomerTicketTypesAPI,
     ReservationPetKindergardenAttendanceTimesAPI,
+    ReservationPetKindergardenAvailableDateRangesAPI,
     ReservationPetKindergardenAvailableDatesAPI,
+    ReservationPetKindergardenNextAvailableDatesAPI,
+    ReservationPetKindergardenTicketsAvailableDatesAPI,
     ReservationTicketCheckExpirationAPI,
 )
 from mung_manager.schemas.errors.authentications import (
@@ -282,6 +285,161 @@ class ReservationPetKindergardenAvailableDatesAPIManager(BaseAPIManager):
         return self.VIEWS_BY_METHOD["GET"]()(request, *args, **kwargs)
 
 
+class ReservationPetKindergardenAvailableDateRangesAPIManager(BaseAPIManager):
+    VIEWS_BY_METHOD = {
+        "GET": ReservationPetKindergardenAvailableDateRangesAPI.as_view,
+    }
+
+    @extend_schema(
+        tags=["예약"],
+        summary="예약 가능한 날짜 구간 목록 조회",
+        description="""
+        Rogic
+            - 선택한 티켓 타입으로 from_month ~ to_month 범위 안의 예약 가능한 날짜를 조회합니다.
+            - 연속된 예약 가능한 날짜는 [시작일, 종료일] 구간 하나로 묶어서 반환합니다.
+        """,
+        parameters=[VIEWS_BY_METHOD["GET"]().cls.InputSerializer],
+        responses={
+            status.HTTP_200_OK: VIEWS_BY_METHOD["GET"]().cls.OutputSerializer,
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorInvalidParameterFormatSchema]
+            ),
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorAuthenticationFailedSchema,
+                    ErrorNotAuthenticatedSchema,
+                    ErrorInvalidTokenSchema,
+                    ErrorAuthorizationHeaderSchema,
+                    ErrorAuthenticationPasswordChangedSchema,
+                    ErrorAuthenticationUserDeletedSchema,
+                    ErrorAuthenticationUserInactiveSchema,
+                    ErrorAuthenticationUserNotFoundSchema,
+                    ErrorTokenIdentificationSchema,
+                ],
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[ErrorPermissionDeniedSchema],
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorTicketNotFoundSchema,
+                    ErrorPetKindergardenNotFoundSchema,
+                ],
+            ),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorUnknownServerSchema]
+            ),
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return self.VIEWS_BY_METHOD["GET"]()(request, *args, **kwargs)
+
+
+class ReservationPetKindergardenNextAvailableDatesAPIManager(BaseAPIManager):
+    VIEWS_BY_METHOD = {
+        "GET": ReservationPetKindergardenNextAvailableDatesAPI.as_view,
+    }
+
+    @extend_schema(
+        tags=["예약"],
+        summary="가장 가까운 예약 가능한 날짜 목록 조회",
+        description="""
+        Rogic
+            - 선택한 티켓 타입으로 오늘(또는 내일)부터 가장 가까운 예약 가능한 날짜를 최대 count개 조회합니다.
+            - 휴무일과 정원이 초과된 날짜는 제외하며, count개를 찾으면 검색을 종료합니다.
+        """,
+        parameters=[VIEWS_BY_METHOD["GET"]().cls.InputSerializer],
+        responses={
+            status.HTTP_200_OK: VIEWS_BY_METHOD["GET"]().cls.OutputSerializer,
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorInvalidParameterFormatSchema]
+            ),
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorAuthenticationFailedSchema,
+                    ErrorNotAuthenticatedSchema,
+                    ErrorInvalidTokenSchema,
+                    ErrorAuthorizationHeaderSchema,
+                    ErrorAuthenticationPasswordChangedSchema,
+                    ErrorAuthenticationUserDeletedSchema,
+                    ErrorAuthenticationUserInactiveSchema,
+                    ErrorAuthenticationUserNotFoundSchema,
+                    ErrorTokenIdentificationSchema,
+                ],
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[ErrorPermissionDeniedSchema],
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorTicketNotFoundSchema,
+                    ErrorPetKindergardenNotFoundSchema,
+                ],
+            ),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorUnknownServerSchema]
+            ),
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return self.VIEWS_BY_METHOD["GET"]()(request, *args, **kwargs)
+
+
+class ReservationPetKindergardenTicketsAvailableDatesAPIManager(BaseAPIManager):
+    VIEWS_BY_METHOD = {
+        "GET": ReservationPetKindergardenTicketsAvailableDatesAPI.as_view,
+    }
+
+    @extend_schema(
+        tags=["예약"],
+        summary="고객의 모든 티켓별 예약 가능한 날짜 목록 조회",
+        description="""
+        Rogic
+            - 고객이 사용할 수 있는 모든 티켓의 예약 가능한 날짜 목록을 한 번에 조회합니다.
+            - 시간권/종일권은 티켓별로, 호텔권은 하나로 묶어서 반환합니다.
+        """,
+        responses={
+            status.HTTP_200_OK: VIEWS_BY_METHOD["GET"]().cls.OutputSerializer,
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorAuthenticationFailedSchema,
+                    ErrorNotAuthenticatedSchema,
+                    ErrorInvalidTokenSchema,
+                    ErrorAuthorizationHeaderSchema,
+                    ErrorAuthenticationPasswordChangedSchema,
+                    ErrorAuthenticationUserDeletedSchema,
+                    ErrorAuthenticationUserInactiveSchema,
+                    ErrorAuthenticationUserNotFoundSchema,
+                    ErrorTokenIdentificationSchema,
+                ],
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[ErrorPermissionDeniedSchema],
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorPetKindergardenNotFoundSchema,
+                    ErrorCustomerNotFoundSchema,
+                ],
+            ),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorUnknownServerSchema]
+            ),
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return self.VIEWS_BY_METHOD["GET"]()(request, *args, **kwargs)
+
+
 class ReservationPetKindergardenAttendanceTimesAPIManager(BaseAPIManager):
     VIEWS_BY_METHOD = {
         "GET": ReservationPetKindergardenAttendanceTimesAPI.as_view,
@@ -7,6 +7,7 @@ from mung_manager.customers.containers import CustomerContainer
 from mung_manager.reservations.containers import ReservationContainer
 from mung_manager_commons.base import BaseSerializer
 from mung_manager_commons.constants import SYSTEM_CODE
+from mung_manager_commons.errors import InvalidParameterFormatException
 from mung_manager_commons.mixins import GuestAPIAuthMixin
 from mung_manager_commons.selector import get_object_or_not_found
 from mung_manager_commons.validators import (
@@ -146,11 +147,133 @@ class ReservationPetKindergardenAvailableDatesAPI(GuestAPIAuthMixin, APIView):
             customer=customer,
             ticket_type=input_serializer.validated_data.get("ticket_type"),
             ticket_id=input_serializer.validated_data.get("ticket_id"),
+            use_cache=True,
         )
         available_dates_per_ticket_data = self.OutputSerializer({"available_dates": available_dates_data}).data
         return Response(data=available_dates_per_ticket_data, status=status.HTTP_200_OK)
 
 
+class ReservationPetKindergardenAvailableDateRangesAPI(GuestAPIAuthMixin, APIView):
+    class InputSerializer(BaseSerializer):
+        ticket_type = serializers.CharField(label="티켓 타입", validators=[InvalidTicketTypeValidator()])
+        ticket_id = serializers.IntegerField(label="티켓 아이디", required=False)
+        from_month = serializers.DateField(label="조회 시작 월(YYYY-MM)", input_formats=["%Y-%m"])
+        to_month = serializers.DateField(label="조회 종료 월(YYYY-MM)", input_formats=["%Y-%m"])
+
+        class Meta:
+            validators = [AvailableDatesAPIParameterValidator()]
+
+        def validate(self, attrs):
+            if attrs["from_month"] > attrs["to_month"]:
+                raise InvalidParameterFormatException(
+                    detail=SYSTEM_CODE.message("INVALID_PARAMETER_FORMAT"),
+                    code=SYSTEM_CODE.code("INVALID_PARAMETER_FORMAT"),
+                )
+            return attrs
+
+    class OutputSerializer(BaseSerializer):
+        start_date = serializers.DateField(label="조회 시작 일자")
+        end_date = serializers.DateField(label="조회 종료 일자")
+        available_ranges = serializers.ListField(
+            child=serializers.ListField(child=serializers.CharField(), min_length=2, max_length=2),
+            label="예약 가능한 날짜 구간 목록([시작일, 종료일])",
+        )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._customer_selector = CustomerContainer.customer_selector()
+        self._reservation_service = ReservationContainer.reservation_service()
+
+    def get(self, request: Request) -> Response:
+        input_serializer = self.InputSerializer(data=request.query_params)
+        input_serializer.is_valid(raise_exception=True)
+        user = request.user
+        pet_kindergarden = request.pet_kindergarden
+        customer = get_object_or_not_found(
+            self._customer_selector.get_by_user_and_pet_kindergarden_id(user, pet_kindergarden.id),
+            msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
+            code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER"),
+        )
+        available_date_ranges = self._reservation_service.get_available_reservation_date_ranges(
+            pet_kindergarden_id=pet_kindergarden.id,
+            customer=customer,
+            ticket_type=input_serializer.validated_data.get("ticket_type"),
+            ticket_id=input_serializer.validated_data.get("ticket_id"),
+            start_month=input_serializer.validated_data["from_month"],
+            end_month=input_serializer.validated_data["to_month"],
+        )
+        available_date_ranges_data = self.OutputSerializer(available_date_ranges).data
+        return Response(data=available_date_ranges_data, status=status.HTTP_200_OK)
+
+
+class ReservationPetKindergardenNextAvailableDatesAPI(GuestAPIAuthMixin, APIView):
+    class InputSerializer(BaseSerializer):
+        ticket_type = serializers.CharField(label="티켓 타입", validators=[InvalidTicketTypeValidator()])
+        ticket_id = serializers.IntegerField(label="티켓 아이디", required=False)
+        count = serializers.IntegerField(label="조회할 날짜 개수", required=False, default=5, min_value=1, max_value=31)
+
+        class Meta:
+            validators = [AvailableDatesAPIParameterValidator()]
+
+    class OutputSerializer(BaseSerializer):
+        available_dates = serializers.ListField(
+            child=serializers.CharField(), label="가장 가까운 예약 가능한 날짜 목록"
+        )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._customer_selector = CustomerContainer.customer_selector()
+        self._reservation_service = ReservationContainer.reservation_service()
+
+    def get(self, request: Request) -> Response:
+        input_serializer = self.InputSerializer(data=request.query_params)
+        input_serializer.is_valid(raise_exception=True)
+        user = request.user
+        pet_kindergarden = request.pet_kindergarden
+        customer = get_object_or_not_found(
+            self._customer_selector.get_by_user_and_pet_kindergarden_id(user, pet_kindergarden.id),
+            msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
+            code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER"),
+        )
+        next_available_dates = self._reservation_service.search_next_available_reservation_dates(
+            pet_kindergarden_id=pet_kindergarden.id,
+            customer=customer,
+            ticket_type=input_serializer.validated_data.get("ticket_type"),
+            ticket_id=input_serializer.validated_data.get("ticket_id"),
+            count=input_serializer.validated_data["count"],
+        )
+        next_available_dates_data = self.OutputSerializer({"available_dates": next_available_dates}).data
+        return Response(data=next_available_dates_data, status=status.HTTP_200_OK)
+
+
+class ReservationPetKindergardenTicketsAvailableDatesAPI(GuestAPIAuthMixin, APIView):
+    class OutputSerializer(BaseSerializer):
+        ticket_type = serializers.CharField(label="티켓 타입")
+        ticket_id = serializers.IntegerField(label="티켓 아이디", allow_null=True)
+        expired_at = serializers.DateTimeField(label="만료 일자", format="%Y-%m-%d")
+        available_dates = serializers.ListField(child=serializers.CharField(), label="예약 가능한 날짜 목록")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._customer_selector = CustomerContainer.customer_selector()
+        self._reservation_service = ReservationContainer.reservation_service()
+
+    def get(self, request: Request) -> Response:
+        user = request.user
+        pet_kindergarden = request.pet_kindergarden
+        customer = get_object_or_not_found(
+            self._customer_selector.get_by_user_and_pet_kindergarden_id(user, pet_kindergarden.id),
+            msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
+            code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER"),
+        )
+        available_dates_per_ticket = self._reservation_service.get_available_reservation_dates_for_customer_tickets(
+            pet_kindergarden_id=pet_kindergarden.id,
+            customer=customer,
+        )
+        available_dates_per_ticket_data = self.OutputSerializer(available_dates_per_ticket, many=True).data
+        return Response(data=available_dates_per_ticket_data, status=status.HTTP_200_OK)
+
+
 class ReservationPetKindergardenAttendanceTimesAPI(GuestAPIAuthMixin, APIView):
     class InputSerializer(BaseSerializer):
         usage_time = serializers.IntegerField(label="사용 가능한 시간")
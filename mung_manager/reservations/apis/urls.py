@@ -5,7 +5,10 @@ from mung_manager.reservations.apis.api_managers import (
     ReservationCustomerTicketTypeDetailAPIManager,
     ReservationCustomerTicketTypesAPIManager,
     ReservationPetKindergardenAttendanceTimesAPIManager,
+    ReservationPetKindergardenAvailableDateRangesAPIManager,
     ReservationPetKindergardenAvailableDatesAPIManager,
+    ReservationPetKindergardenNextAvailableDatesAPIManager,
+    ReservationPetKindergardenTicketsAvailableDatesAPIManager,
     ReservationTicketCheckExpirationAPIManager,
 )
 
@@ -35,6 +38,21 @@ urlpatterns = [
         ReservationPetKindergardenAvailableDatesAPIManager.as_view(),
         name="pet-kindergarden-available-dates",
     ),
+    path(
+        "/pet-kindergardens/available-date-ranges",
+        ReservationPetKindergardenAvailableDateRangesAPIManager.as_view(),
+        name="pet-kindergarden-available-date-ranges",
+    ),
+    path(
+        "/pet-kindergardens/next-available-dates",
+        ReservationPetKindergardenNextAvailableDatesAPIManager.as_view(),
+        name="pet-kindergarden-next-available-dates",
+    ),
+    path(
+        "/pet-kindergardens/tickets/available-dates",
+        ReservationPetKindergardenTicketsAvailableDatesAPIManager.as_view(),
+        name="pet-kindergarden-tickets-available-dates",
+    ),
     path(
         "/pet-kindergardens/attendance-times",
         ReservationPetKindergardenAttendanceTimesAPIManager.as_view(),
@@ -1,6 +1,75 @@
+from typing import Any, Optional
+
 from django.apps import AppConfig
+from django.core import checks
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_migrate
+
+# 연박 호텔 예약을 묶고 조회하는 데 반드시 필요한 예약 모델 필드(mung_manager_db)
+REQUIRED_RESERVATION_FIELDS = ("root", "depth")
+
+
+def check_reservation_fields(**kwargs: Any) -> list[checks.CheckMessage]:
+    """
+    이 함수는 예약 모델(mung_manager_db)에 연박 예약의 대표 예약(root)과 깊이(depth) 필드가 있는지 검사합니다.
+    서비스와 조회 로직은 두 필드를 항상 사용하므로, 필드가 없는 mung_manager_db로는 서버를 실행하거나 migrate할 수 없습니다.
+
+    Args:
+        **kwargs (Any): 시스템 검사 인자
+
+    Returns:
+        list[checks.CheckMessage]: 누락된 필드마다 하나씩 생성한 에러 리스트
+    """
+    from mung_manager_db.models import Reservation
+
+    field_names = {field.name for field in Reservation._meta.get_fields()}
+    return [
+        checks.Error(
+            f"Reservation.{field_name} is required by mung_manager.reservations.",
+            hint="Update the mung_manager_db submodule to a version that defines this field.",
+            obj=Reservation,
+            id="reservations.E001",
+        )
+        for field_name in REQUIRED_RESERVATION_FIELDS
+        if field_name not in field_names
+    ]
+
+
+def install_database_objects(using: str = DEFAULT_DB_ALIAS, plan: Optional[list] = None, **kwargs: Any) -> None:
+    """
+    이 함수는 migrate가 끝나면 모델 메타 정보로 생성하는 DB 객체(예약 함수, 캐시 만료 트리거)를 다시 생성하고,
+    대표 예약 아이디(root_id)가 비어 있는 기존 연박 예약을 채웁니다(모든 마이그레이션이 적용된 뒤에 실행되므로 컬럼이 항상 존재).
+    flush(테스트 데이터 초기화 포함)도 post_migrate를 보내지만 함수와 트리거는 그대로 남으므로 다시 생성하지 않습니다.
+
+    Args:
+        using (str): DB 별칭
+        plan (Optional[list]): 적용한 마이그레이션 계획(flush에서 보낸 시그널이면 None)
+        **kwargs (Any): post_migrate 시그널 인자
+
+    Returns:
+        None
+    """
+    if plan is None:
+        return
+
+    from mung_manager.reservations.booking_functions import (
+        install_booking_function,
+    )
+    from mung_manager.reservations.cache_invalidation_triggers import (
+        install_cache_invalidation_triggers,
+    )
+
+    install_booking_function(using=using)
+    install_cache_invalidation_triggers(using=using)
+    call_command("backfill_reservation_root_ids")
 
 
 class ReservationsConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "mung_manager.reservations"
+
+    def ready(self):
+        # 스키마가 변경되어도 모델과 어긋나지 않도록 배포(migrate) 시마다 DB 객체를 다시 생성
+        post_migrate.connect(install_database_objects, sender=self)
+        checks.register(check_reservation_fields, checks.Tags.models)
@@ -0,0 +1,287 @@
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.db.models import Model
+
+from mung_manager.reservations.services.daily_reservations import (
+    get_capacity_lock_sql,
+)
+from mung_manager_db.enum_types import ReservationStatus, TicketType
+from mung_manager_db.models import (
+    CustomerPet,
+    CustomerTicket,
+    CustomerTicketUsageLog,
+    DailyReservation,
+    Reservation,
+)
+
+BOOKING_FUNCTION_NAME = "guest_register_reservation"
+
+# 예약 함수가 RAISE EXCEPTION으로 전달하는 에러 코드(SYSTEM_CODE)
+BOOKING_FUNCTION_ERROR_CODES = ["NOT_FOUND_CUSTOMER_TICKET", "INVALID_RESERVED_AT"]
+
+BOOKING_FUNCTION_ARGUMENTS = """
+    p_customer_id bigint,
+    p_pet_kindergarden_id bigint,
+    p_customer_pet_id bigint,
+    p_customer_ticket_id bigint,
+    p_ticket_type varchar,
+    p_reserved_at timestamp,
+    p_end_at timestamp,
+    p_daily_pet_limit integer,
+    p_shard integer,
+    p_sharded boolean
+"""
+
+
+def _quote(cursor: Any, value: Any) -> str:
+    return cursor.mogrify("%s", [value]).decode()
+
+
+def _column(model: type[Model], field_name: str) -> str:
+    return connection.ops.quote_name(model._meta.get_field(field_name).column)
+
+
+def _get_insert_sql(cursor: Any, model: type[Model], values: dict[str, str]) -> str:
+    """
+    이 함수는 주어진 값으로 행을 추가하는 INSERT 문을 생성합니다.
+    값이 주어지지 않은 필드는 자동 시간 필드면 현재 시간, 기본값이 있으면 기본값, 없으면 NULL로 채웁니다.
+
+    Args:
+        cursor (Any): DB 커서
+        model (type[Model]): 모델 클래스
+        values (dict[str, str]): 필드 이름별 SQL 표현식
+
+    Returns:
+        str: INSERT 문
+    """
+    columns = []
+    expressions = []
+    for field in model._meta.concrete_fields:
+        if field.primary_key:
+            continue
+
+        if field.name in values:
+            expression = values[field.name]
+        elif getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            expression = "LOCALTIMESTAMP"
+        elif field.has_default():
+            expression = _quote(cursor, field.get_db_prep_save(field.get_default(), connection=connection))
+        else:
+            expression = "NULL"
+        columns.append(connection.ops.quote_name(field.column))
+        expressions.append(expression)
+
+    return (
+        f"INSERT INTO {connection.ops.quote_name(model._meta.db_table)} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(expressions)})"
+    )
+
+
+def get_create_booking_function_sql(cursor: Any) -> str:
+    """
+    이 함수는 시간권/종일권 예약의 쓰기 단계(티켓 차감, 일별 예약 현황 증가, 예약 생성, 티켓 사용 로그 생성)를
+    한 번의 호출로 처리하는 plpgsql 함수 생성 SQL을 반환합니다.
+    테이블과 컬럼 이름은 모델 메타 정보에서 가져오므로 스키마가 변경되면 함수를 다시 생성해야 합니다(install_booking_function).
+    샤드 컬럼(DailyReservation.shard)은 DAILY_RESERVATION_SHARDING_ENABLED일 때만 사용합니다.
+
+    Args:
+        cursor (Any): DB 커서
+
+    Returns:
+        str: CREATE FUNCTION 문
+    """
+    qn = connection.ops.quote_name
+    customer_ticket_table = qn(CustomerTicket._meta.db_table)
+    daily_reservation_table = qn(DailyReservation._meta.db_table)
+
+    customer_ticket_updates = [
+        f"{_column(CustomerTicket, 'used_count')} = {_column(CustomerTicket, 'used_count')} + 1",
+        f"{_column(CustomerTicket, 'unused_count')} = {_column(CustomerTicket, 'unused_count')} - 1",
+        f"{_column(CustomerTicket, 'updated_at')} = LOCALTIMESTAMP",
+        # 파이썬 코드에서 같은 티켓을 저장하려는 요청이 충돌(RecordModifiedError)을 감지하도록 버전 증가
+        f"{_column(CustomerTicket, 'version')} = {_column(CustomerTicket, 'version')} + 1",
+    ]
+
+    pet_count_expressions = {
+        field_name: f"CASE WHEN p_ticket_type = {_quote(cursor, ticket_type)} THEN 1 ELSE 0 END"
+        for ticket_type, field_name in [
+            (TicketType.TIME.value, "time_pet_count"),
+            (TicketType.ALL_DAY.value, "all_day_pet_count"),
+            (TicketType.HOTEL.value, "hotel_pet_count"),
+        ]
+    }
+    daily_reservation_values = {
+        "pet_kindergarden": "p_pet_kindergarden_id",
+        "reserved_at": "p_reserved_at",
+        "total_pet_count": "1",
+        **pet_count_expressions,
+    }
+    pet_count_columns = [
+        _column(DailyReservation, field_name) for field_name in ["total_pet_count", *pet_count_expressions]
+    ]
+    auto_now_columns = [
+        qn(field.column) for field in DailyReservation._meta.concrete_fields if getattr(field, "auto_now", False)
+    ]
+    daily_reservation_updates = [
+        f"{column} = {column} + {pet_count_expressions.get(field_name, '1')}"
+        for column, field_name in zip(pet_count_columns, ["total_pet_count", *pet_count_expressions])
+    ] + [f"{column} = LOCALTIMESTAMP" for column in auto_now_columns]
+
+    pk_column = _column(DailyReservation, "id")
+    pet_kindergarden_column = _column(DailyReservation, "pet_kindergarden")
+    reserved_at_column = _column(DailyReservation, "reserved_at")
+
+    # 날짜 잠금 안이므로 수정할 행이 없을 때만 생성해도 중복 행이 생기지 않음
+    daily_reservation_increment_sql = f"""UPDATE {daily_reservation_table}
+        SET {', '.join(daily_reservation_updates)}
+        WHERE {pk_column} = (
+            SELECT {pk_column}
+            FROM {daily_reservation_table}
+            WHERE {pet_kindergarden_column} = p_pet_kindergarden_id AND {reserved_at_column} = p_reserved_at
+            ORDER BY {pk_column}
+            LIMIT 1
+        );
+        IF NOT FOUND THEN
+            {_get_insert_sql(cursor, DailyReservation, daily_reservation_values)};
+        END IF;"""
+
+    # 샤딩이 설정된 경우에만 샤드 컬럼을 사용하는 분기를 생성(설정되지 않으면 p_shard, p_sharded는 무시)
+    if settings.DAILY_RESERVATION_SHARDING_ENABLED:
+        daily_reservation_upsert_updates = [
+            f"{column} = {daily_reservation_table}.{column} + EXCLUDED.{column}" for column in pet_count_columns
+        ] + [f"{column} = EXCLUDED.{column}" for column in auto_now_columns]
+        daily_reservation_conflict_columns = [
+            _column(DailyReservation, field_name) for field_name in ["pet_kindergarden", "reserved_at", "shard"]
+        ]
+        sharded_daily_reservation_insert_sql = _get_insert_sql(
+            cursor, DailyReservation, {**daily_reservation_values, "shard": "p_shard"}
+        )
+        daily_reservation_increment_sql = f"""IF p_sharded THEN
+        {sharded_daily_reservation_insert_sql}
+        ON CONFLICT ({', '.join(daily_reservation_conflict_columns)})
+        DO UPDATE SET {', '.join(daily_reservation_upsert_updates)};
+    ELSE
+        {daily_reservation_increment_sql}
+    END IF;"""
+
+    daily_pet_count_sql = f"""SELECT COALESCE(SUM({_column(DailyReservation, 'total_pet_count')}), 0) INTO v_pet_count
+        FROM {daily_reservation_table}
+        WHERE {pet_kindergarden_column} = p_pet_kindergarden_id
+            AND {reserved_at_column} >= p_reserved_at::date
+            AND {reserved_at_column} < p_reserved_at::date + 1;"""
+
+    reservation_insert_sql = _get_insert_sql(
+        cursor,
+        Reservation,
+        {
+            "reserved_at": "p_reserved_at",
+            "end_at": "p_end_at",
+            "is_attended": "NULL",
+            "reservation_status": _quote(cursor, ReservationStatus.COMPLETED.value),
+            "pet_kindergarden": "p_pet_kindergarden_id",
+            "customer": "p_customer_id",
+            "customer_pet": "p_customer_pet_id",
+            "customer_ticket": "p_customer_ticket_id",
+        },
+    )
+    customer_ticket_usage_log_insert_sql = _get_insert_sql(
+        cursor,
+        CustomerTicketUsageLog,
+        {
+            "customer_ticket": "p_customer_ticket_id",
+            "reservation": "v_reservation_id",
+            "used_count": "1",
+        },
+    )
+
+    return f"""
+CREATE OR REPLACE FUNCTION {BOOKING_FUNCTION_NAME}({BOOKING_FUNCTION_ARGUMENTS})
+RETURNS TABLE (reservation_id bigint, remain_count integer, pet_name varchar, ticket_expired_at timestamp) AS $$
+#variable_conflict use_column
+DECLARE
+    v_reservation_id bigint;
+    v_remain_count integer;
+    v_pet_name varchar;
+    v_ticket_expired_at timestamp;
+    v_pet_count bigint;
+BEGIN
+    -- 티켓 차감(행 잠금 안에서 잔여 횟수가 남아있고 만료되지 않은 티켓만 차감하므로 버전은 비교하지 않음)
+    UPDATE {customer_ticket_table}
+    SET {', '.join(customer_ticket_updates)}
+    WHERE {_column(CustomerTicket, 'id')} = p_customer_ticket_id
+        AND {_column(CustomerTicket, 'customer')} = p_customer_id
+        AND {_column(CustomerTicket, 'unused_count')} >= 1
+        AND {_column(CustomerTicket, 'expired_at')} >= LOCALTIMESTAMP
+    RETURNING {_column(CustomerTicket, 'unused_count')}, {_column(CustomerTicket, 'expired_at')}
+    INTO v_remain_count, v_ticket_expired_at;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION USING MESSAGE = 'NOT_FOUND_CUSTOMER_TICKET';
+    END IF;
+
+    -- 하루 정원 확인(파이썬 코드와 같은 날짜 잠금을 획득한 뒤 같은 날짜의 모든 행을 합산)
+    -- 샤딩된 유치원도 정원이 있으면 같은 잠금 안에서 확인하며, 정원이 없으면 잠그지 않음
+    IF p_daily_pet_limit <> -1 OR NOT p_sharded THEN
+        PERFORM {get_capacity_lock_sql("p_pet_kindergarden_id", "p_reserved_at::date")};
+    END IF;
+    IF p_daily_pet_limit <> -1 THEN
+        {daily_pet_count_sql}
+        IF v_pet_count + 1 > p_daily_pet_limit THEN
+            RAISE EXCEPTION USING MESSAGE = 'INVALID_RESERVED_AT';
+        END IF;
+    END IF;
+
+    -- 일별 예약 현황 증가
+    {daily_reservation_increment_sql}
+
+    -- 예약 및 티켓 사용 로그 생성
+    {reservation_insert_sql}
+    RETURNING {_column(Reservation, 'id')} INTO v_reservation_id;
+    {customer_ticket_usage_log_insert_sql};
+
+    SELECT {_column(CustomerPet, 'name')} INTO v_pet_name
+    FROM {qn(CustomerPet._meta.db_table)}
+    WHERE {_column(CustomerPet, 'id')} = p_customer_pet_id AND {_column(CustomerPet, 'is_deleted')} = false;
+
+    RETURN QUERY SELECT v_reservation_id, v_remain_count, v_pet_name, v_ticket_expired_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def get_drop_booking_function_sql() -> str:
+    """
+    이 함수는 예약 함수 제거 SQL을 반환합니다.
+    인자가 변경되기 전에 설치된 함수도 남지 않도록 같은 이름의 함수를 모두 제거합니다.
+
+    Returns:
+        str: 같은 이름의 함수를 모두 제거하는 DO 블록
+    """
+    return f"""
+DO $$
+DECLARE
+    v_function regprocedure;
+BEGIN
+    FOR v_function IN SELECT oid::regprocedure FROM pg_proc WHERE proname = '{BOOKING_FUNCTION_NAME}' LOOP
+        EXECUTE 'DROP FUNCTION ' || v_function;
+    END LOOP;
+END;
+$$;
+"""
+
+
+def install_booking_function(using: str = DEFAULT_DB_ALIAS) -> None:
+    """
+    이 함수는 예약 함수를 현재 모델 메타 정보로 다시 생성합니다.
+    마이그레이션이 끝날 때마다(post_migrate) 호출되므로 스키마가 변경되어도 함수가 모델과 어긋나지 않습니다.
+
+    Args:
+        using (str): DB 별칭
+
+    Returns:
+        None
+    """
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(get_drop_booking_function_sql())
+        cursor.execute(get_create_booking_function_sql(cursor))
@@ -0,0 +1,85 @@
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from mung_manager.reservations.caches import PET_KINDERGARDEN_CACHE_INVALIDATION_CHANNEL
+from mung_manager.reservations.day_off_rules import DayOffRule
+from mung_manager_db.models import DailyReservation, DayOff, PetKindergarden, Ticket
+
+TRIGGER_FUNCTION_NAME = "guest_notify_pet_kindergarden_cache_invalidation"
+
+# (모델, 반려동물 유치원 아이디 컬럼)
+TRIGGER_TARGETS = [
+    (DayOff, "pet_kindergarden_id"),
+    (DailyReservation, "pet_kindergarden_id"),
+    (Ticket, "pet_kindergarden_id"),
+    (PetKindergarden, "id"),
+]
+if DayOffRule is not None:
+    TRIGGER_TARGETS.append((DayOffRule, "pet_kindergarden_id"))
+
+CREATE_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION {TRIGGER_FUNCTION_NAME}() RETURNS trigger AS $$
+DECLARE
+    row_data jsonb;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := to_jsonb(OLD);
+    ELSE
+        row_data := to_jsonb(NEW);
+    END IF;
+
+    PERFORM pg_notify(
+        '{PET_KINDERGARDEN_CACHE_INVALIDATION_CHANNEL}',
+        json_build_object(
+            'table', TG_TABLE_NAME,
+            'operation', TG_OP,
+            'pet_kindergarden_id', (row_data ->> TG_ARGV[0])::bigint
+        )::text
+    );
+
+    -- 유치원이 변경되는 UPDATE는 이전 유치원의 캐시도 만료
+    IF TG_OP = 'UPDATE' AND (to_jsonb(OLD) ->> TG_ARGV[0]) IS DISTINCT FROM (row_data ->> TG_ARGV[0]) THEN
+        PERFORM pg_notify(
+            '{PET_KINDERGARDEN_CACHE_INVALIDATION_CHANNEL}',
+            json_build_object(
+                'table', TG_TABLE_NAME,
+                'operation', TG_OP,
+                'pet_kindergarden_id', (to_jsonb(OLD) ->> TG_ARGV[0])::bigint
+            )::text
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def install_cache_invalidation_triggers(using: str = DEFAULT_DB_ALIAS, drop: bool = False) -> None:
+    """
+    이 함수는 캐시 만료 대상 테이블의 NOTIFY 트리거와 트리거 함수를 다시 생성합니다.
+    마이그레이션이 끝날 때마다(post_migrate) 호출되므로 배포 시 트리거가 자동으로 설치됩니다.
+
+    Args:
+        using (str): DB 별칭
+        drop (bool): True면 트리거와 함수를 제거만 함
+
+    Returns:
+        None
+    """
+    connection = connections[using]
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        for model, _ in TRIGGER_TARGETS:
+            table_name = connection.ops.quote_name(model._meta.db_table)
+            cursor.execute(f"DROP TRIGGER IF EXISTS {TRIGGER_FUNCTION_NAME} ON {table_name}")
+
+        if drop:
+            cursor.execute(f"DROP FUNCTION IF EXISTS {TRIGGER_FUNCTION_NAME}()")
+            return
+
+        cursor.execute(CREATE_TRIGGER_FUNCTION_SQL)
+        for model, pet_kindergarden_column in TRIGGER_TARGETS:
+            cursor.execute(
+                f"CREATE TRIGGER {TRIGGER_FUNCTION_NAME} "
+                f"AFTER INSERT OR UPDATE OR DELETE ON {connection.ops.quote_name(model._meta.db_table)} "
+                f"FOR EACH ROW EXECUTE FUNCTION {TRIGGER_FUNCTION_NAME}('{pet_kindergarden_column}')"
+            )
@@ -0,0 +1,269 @@
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from mung_manager.reservations.types import pet_kindergarden_calendar_type
+
+
+class SingleFlight:
+    """
+    이 클래스는 같은 키에 대한 동시 계산을 프로세스 안에서 하나로 합칩니다.
+
+    먼저 도착한 호출만 계산을 수행하고, 계산이 끝날 때까지 도착한 나머지 호출은 그 결과(또는 예외)를 공유합니다.
+    대기 시간을 넘기면 나머지 호출은 더 기다리지 않고 직접 계산합니다.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.event = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, SingleFlight._Call] = {}
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+        fallback: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        이 함수는 같은 키로 진행 중인 계산이 있으면 그 결과를 기다리고, 없으면 직접 계산합니다.
+
+        Args:
+            key (str): 계산을 식별하는 키
+            fn (Callable[[], Any]): 계산 함수
+            timeout (Optional[float]): 진행 중인 계산을 기다리는 최대 시간(초, None이면 무제한)
+            fallback (Optional[Callable[[], Any]]): 대기 시간을 넘겼을 때 실행할 계산 함수(None이면 fn)
+
+        Returns:
+            Any: 계산 결과
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = self._Call()
+
+        if not is_leader:
+            # 먼저 시작한 계산이 멈춘 경우 대기 중인 요청이 모두 묶이지 않도록 직접 계산
+            if not call.event.wait(timeout):
+                return (fallback or fn)()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+        return call.result
+
+
+# 프로세스 단위로 공유되는 캘린더 생성 single-flight
+pet_kindergarden_calendar_single_flight = SingleFlight()
+
+# 파트너 서비스의 변경 사항을 전달받는 Postgres NOTIFY 채널
+PET_KINDERGARDEN_CACHE_INVALIDATION_CHANNEL = "guest_pet_kindergarden_cache_invalidation"
+
+
+class PetKindergardenCalendarCache:
+    """
+    이 클래스는 반려동물 유치원 단위의 예약 캘린더(휴무일, 정원 초과일)를 Redis에 캐싱합니다.
+
+    캘린더 데이터는 STALE_TIMEOUT 동안 보관하고, 신선도 키는 FRESH_TIMEOUT 동안만 유지합니다.
+    신선도 키가 사라진 캘린더는 재검증이 끝날 때까지 그대로 제공됩니다.
+    """
+
+    KEY_PREFIX = "reservations:pet_kindergarden_calendar"
+    REVALIDATION_LOCK_TIMEOUT = 30
+    BUILD_LOCK_TIMEOUT = 10
+    BUILD_WAIT_INTERVAL = 0.05
+    # 같은 프로세스에서 진행 중인 생성을 기다리는 최대 시간(다른 프로세스 대기 후 직접 생성하는 시간까지 포함)
+    BUILD_WAIT_TIMEOUT = BUILD_LOCK_TIMEOUT * 2
+
+    def _get_data_key(self, pet_kindergarden_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{pet_kindergarden_id}:data"
+
+    def _get_fresh_key(self, pet_kindergarden_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{pet_kindergarden_id}:fresh"
+
+    def _get_revalidation_lock_key(self, pet_kindergarden_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{pet_kindergarden_id}:revalidating"
+
+    def _get_build_lock_key(self, pet_kindergarden_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{pet_kindergarden_id}:building"
+
+    def get(self, pet_kindergarden_id: int) -> tuple[Optional[pet_kindergarden_calendar_type], bool]:
+        """
+        이 함수는 캐싱된 캘린더와 신선도 여부를 조회합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            tuple[Optional[pet_kindergarden_calendar_type], bool]: 캘린더(없으면 None)와 신선도 여부
+        """
+        data_key = self._get_data_key(pet_kindergarden_id)
+        fresh_key = self._get_fresh_key(pet_kindergarden_id)
+        values = cache.get_many([data_key, fresh_key])
+        return values.get(data_key), fresh_key in values
+
+    def set(self, pet_kindergarden_id: int, calendar: pet_kindergarden_calendar_type) -> None:
+        """
+        이 함수는 캘린더를 저장하고 신선도 키를 갱신합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            calendar (pet_kindergarden_calendar_type): 반려동물 유치원 캘린더
+
+        Returns:
+            None
+        """
+        cache.set(
+            self._get_data_key(pet_kindergarden_id),
+            calendar,
+            timeout=settings.PET_KINDERGARDEN_CALENDAR_CACHE_STALE_TIMEOUT,
+        )
+        cache.set(
+            self._get_fresh_key(pet_kindergarden_id),
+            True,
+            timeout=settings.PET_KINDERGARDEN_CALENDAR_CACHE_FRESH_TIMEOUT,
+        )
+        cache.delete(self._get_revalidation_lock_key(pet_kindergarden_id))
+
+    def invalidate(self, pet_kindergarden_id: int) -> None:
+        """
+        이 함수는 캘린더를 만료 상태로 전환합니다. 데이터는 재검증이 끝날 때까지 유지됩니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            None
+        """
+        cache.delete(self._get_fresh_key(pet_kindergarden_id))
+
+    def delete(self, pet_kindergarden_id: int) -> None:
+        """
+        이 함수는 캘린더를 캐시에서 즉시 제거합니다. 다음 요청은 DB에서 캘린더를 새로 생성합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            None
+        """
+        cache.delete_many([self._get_data_key(pet_kindergarden_id), self._get_fresh_key(pet_kindergarden_id)])
+
+    def delete_many(self, pet_kindergarden_ids: Iterable[int]) -> None:
+        """
+        이 함수는 여러 반려동물 유치원의 캘린더를 캐시에서 즉시 제거합니다.
+
+        Args:
+            pet_kindergarden_ids (Iterable[int]): 반려동물 유치원 아이디 목록
+
+        Returns:
+            None
+        """
+        keys = []
+        for pet_kindergarden_id in pet_kindergarden_ids:
+            keys.extend([self._get_data_key(pet_kindergarden_id), self._get_fresh_key(pet_kindergarden_id)])
+        if keys:
+            cache.delete_many(keys)
+
+    def acquire_revalidation_lock(self, pet_kindergarden_id: int) -> bool:
+        """
+        이 함수는 재검증 작업이 중복으로 실행되지 않도록 잠금을 획득합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            bool: 잠금을 획득하면 True, 이미 다른 재검증이 진행 중이면 False
+        """
+        return cache.add(
+            self._get_revalidation_lock_key(pet_kindergarden_id),
+            True,
+            timeout=self.REVALIDATION_LOCK_TIMEOUT,
+        )
+
+    def get_or_build(
+        self,
+        pet_kindergarden_id: int,
+        start_date: date,
+        end_date: date,
+        build: Callable[[], pet_kindergarden_calendar_type],
+    ) -> pet_kindergarden_calendar_type:
+        """
+        이 함수는 캘린더를 생성하여 저장하되, 같은 유치원과 기간에 대한 동시 생성을 하나로 합칩니다.
+        같은 프로세스의 요청은 진행 중인 생성 결과를 BUILD_WAIT_TIMEOUT 동안 기다려 공유하고(넘기면 직접 생성),
+        PET_KINDERGARDEN_CALENDAR_CACHE_BUILD_LOCK_ENABLED가 켜져 있으면 다른 프로세스의 생성 결과도 기다립니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            start_date (date): 시작 날짜
+            end_date (date): 종료 날짜
+            build (Callable[[], pet_kindergarden_calendar_type]): 캘린더 생성 함수
+
+        Returns:
+            pet_kindergarden_calendar_type: 반려동물 유치원 캘린더
+        """
+        return pet_kindergarden_calendar_single_flight.do(
+            f"{pet_kindergarden_id}:{start_date.toordinal()}:{end_date.toordinal()}",
+            lambda: self._build_once_across_processes(pet_kindergarden_id, start_date, end_date, build),
+            timeout=self.BUILD_WAIT_TIMEOUT,
+            fallback=lambda: self._build_and_set(pet_kindergarden_id, build),
+        )
+
+    def _build_once_across_processes(
+        self,
+        pet_kindergarden_id: int,
+        start_date: date,
+        end_date: date,
+        build: Callable[[], pet_kindergarden_calendar_type],
+    ) -> pet_kindergarden_calendar_type:
+        if not settings.PET_KINDERGARDEN_CALENDAR_CACHE_BUILD_LOCK_ENABLED:
+            return self._build_and_set(pet_kindergarden_id, build)
+
+        build_lock_key = self._get_build_lock_key(pet_kindergarden_id)
+        if cache.add(build_lock_key, True, timeout=self.BUILD_LOCK_TIMEOUT):
+            try:
+                return self._build_and_set(pet_kindergarden_id, build)
+            finally:
+                cache.delete(build_lock_key)
+
+        # 다른 프로세스가 생성 중이면 해당 기간을 포함하는 캘린더가 저장될 때까지 대기
+        deadline = time.monotonic() + self.BUILD_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(self.BUILD_WAIT_INTERVAL)
+            calendar, _ = self.get(pet_kindergarden_id)
+            if (
+                calendar is not None
+                and calendar["start_ordinal"] <= start_date.toordinal()
+                and calendar["end_ordinal"] >= end_date.toordinal()
+            ):
+                return calendar
+
+        # 대기 시간 안에 결과가 저장되지 않으면 직접 생성
+        return self._build_and_set(pet_kindergarden_id, build)
+
+    def _build_and_set(
+        self, pet_kindergarden_id: int, build: Callable[[], pet_kindergarden_calendar_type]
+    ) -> pet_kindergarden_calendar_type:
+        calendar = build()
+        self.set(pet_kindergarden_id, calendar)
+        return calendar
@@ -8,11 +8,15 @@ from mung_manager.customers.selectors.customer_tickets import CustomerTicketSele
 from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
     PetKindergardenSelector,
 )
+from mung_manager.reservations.caches import PetKindergardenCalendarCache
 from mung_manager.reservations.selectors.daily_reservations import (
     DailyReservationSelector,
 )
 from mung_manager.reservations.selectors.days_off import DayOffSelector
 from mung_manager.reservations.selectors.reservations import ReservationSelector
+from mung_manager.reservations.services.daily_reservations import (
+    DailyReservationService,
+)
 from mung_manager.reservations.services.reservations import ReservationService
 from mung_manager.reservations.services.strategies.strategy_factory import (
     ReservationStrategyFactory,
@@ -31,7 +35,9 @@ class ReservationContainer(containers.DeclarativeContainer):
         daily_reservation_selector: 일별 예약 셀렉터
         customer_pet_selector: 고객 반려동물 셀렉터
         reservation_selector: 예약 셀렉터
+        daily_reservation_service: 일별 예약 서비스
         strategy_factory: 전략 팩토리
+        pet_kindergarden_calendar_cache: 반려동물 유치원 캘린더 캐시
         reservation_service: 예약 서비스
 
         ## 여기 채우기
@@ -45,14 +51,19 @@ class ReservationContainer(containers.DeclarativeContainer):
     customer_pet_selector = providers.Factory(CustomerPetSelector)
     reservation_selector = providers.Factory(ReservationSelector)
 
+    daily_reservation_service = providers.Factory(DailyReservationService)
+
     strategy_factory = providers.Factory(
         ReservationStrategyFactory,
         customer_pet_selector=customer_pet_selector,
         customer_ticket_selector=customer_ticket_selector,
         daily_reservation_selector=daily_reservation_selector,
         reservation_selector=reservation_selector,
+        daily_reservation_service=daily_reservation_service,
     )
 
+    pet_kindergarden_calendar_cache = providers.Factory(PetKindergardenCalendarCache)
+
     reservation_service = providers.Factory(
         ReservationService,
         reservation_selector=reservation_selector,
@@ -63,4 +74,6 @@ class ReservationContainer(containers.DeclarativeContainer):
         customer_ticket_selector=customer_ticket_selector,
         customer_pet_selector=customer_pet_selector,
         strategy_factory=strategy_factory,
+        pet_kindergarden_calendar_cache=pet_kindergarden_calendar_cache,
+        daily_reservation_service=daily_reservation_service,
     )
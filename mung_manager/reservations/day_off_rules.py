@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Iterable
+
+from mung_manager.reservations.types import day_off_rule_type
+
+try:
+    from mung_manager_db.enum_types import DayOffRuleType
+    from mung_manager_db.models import DayOffRule
+except ImportError:
+    # 공용 패키지(mung_manager_db)에 반복 휴무 규칙이 추가되기 전에는 규칙 없이 휴무일(DayOff)만 사용
+    DayOffRule = None  # type: ignore
+    DayOffRuleType = None  # type: ignore
+
+
+class DayOffRuleEngine:
+    """
+    이 클래스는 반복 휴무 규칙을 주어진 기간에 대해 계산합니다.
+
+    날짜별로 휴무일을 저장하지 않고 규칙을 산술적으로 전개하므로 계산 비용은 기간의 길이에만 비례합니다.
+        - WEEKLY: 매주 같은 요일(weekday, 월요일=0)
+        - YEARLY: 매년 같은 날짜(month, day), 공휴일처럼 날짜가 고정된 휴무
+        - EXCEPTION: 규칙에 해당하더라도 영업하는 날짜(excluded_at)
+    """
+
+    @staticmethod
+    def get_closed_ordinals(rules: Iterable[day_off_rule_type], start_date: date, end_date: date) -> set[int]:
+        """
+        이 함수는 반복 휴무 규칙에 해당하는 날짜를 날짜 서수(ordinal) 집합으로 계산합니다.
+
+        Args:
+            rules (Iterable[day_off_rule_type]): 반복 휴무 규칙 목록
+            start_date (date): 시작 날짜
+            end_date (date): 종료 날짜
+
+        Returns:
+            set[int]: 규칙상 휴무인 날짜의 서수 집합(예외 영업일 제외)
+        """
+        start_ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
+        closed_ordinals: set[int] = set()
+        excluded_ordinals: set[int] = set()
+
+        for rule in rules:
+            if rule["rule_type"] == DayOffRuleType.WEEKLY.value:
+                # 시작 날짜 이후 첫 번째 해당 요일부터 7일 간격으로 전개
+                first_ordinal = start_ordinal + (rule["weekday"] - start_date.weekday()) % 7
+                closed_ordinals.update(range(first_ordinal, end_ordinal + 1, 7))
+            elif rule["rule_type"] == DayOffRuleType.YEARLY.value:
+                for year in range(start_date.year, end_date.year + 1):
+                    try:
+                        ordinal = date(year, rule["month"], rule["day"]).toordinal()  # type: ignore
+                    except ValueError:
+                        # 윤년이 아닌 해의 2월 29일
+                        continue
+                    if start_ordinal <= ordinal <= end_ordinal:
+                        closed_ordinals.add(ordinal)
+            elif rule["rule_type"] == DayOffRuleType.EXCEPTION.value:
+                excluded_ordinals.add(rule["excluded_at"].toordinal())  # type: ignore
+
+        return closed_ordinals - excluded_ordinals
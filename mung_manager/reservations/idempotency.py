@@ -0,0 +1,167 @@
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from mung_manager_commons.constants import SYSTEM_CODE
+from mung_manager_commons.errors import (
+    InvalidParameterFormatException,
+    ValidationException,
+)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_REPLAYED_HEADER = "Idempotency-Replayed"
+
+
+class IdempotencyStore:
+    """
+    이 클래스는 Idempotency-Key 헤더로 같은 요청이 여러 번 처리되지 않도록 응답을 Redis에 저장합니다.
+
+    처음 도착한 요청만 키를 선점하여 처리하고, 처리가 끝나면 응답을 저장합니다.
+    같은 키로 다시 들어온 요청은 저장된 응답을 그대로 반환하고, 처리 중에 들어온 요청은 처리가 끝날 때까지 대기합니다.
+    대기 시간 안에 처리가 끝나지 않으면 중복 처리하지 않고 처리 중(409) 에러를 반환합니다.
+    처리에 실패하면 선점을 해제하여 같은 키로 다시 요청할 수 있습니다.
+    처리 중에는 선점 유지 시간의 1/3마다 선점을 연장하므로, 처리가 길어져도 선점이 먼저 만료되어 중복 처리되지 않습니다.
+    """
+
+    KEY_PREFIX = "reservations:idempotency"
+    MAX_KEY_LENGTH = 255
+    WAIT_INTERVAL = 0.05
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+
+    def _get_key(self, request: Request, scope: str, idempotency_key: str) -> str:
+        return f"{self.KEY_PREFIX}:{scope}:{request.pet_kindergarden.id}:{request.user.id}:{idempotency_key}"
+
+    @staticmethod
+    def _get_fingerprint(request: Request) -> str:
+        payload = json.dumps(
+            {"method": request.method, "path": request.path, "data": request.data},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @contextmanager
+    def _hold_claim(self, key: str) -> Iterator[None]:
+        """
+        이 함수는 요청을 처리하는 동안 별도 스레드에서 선점 키의 만료 시간을 주기적으로 연장합니다.
+        처리가 끝나면 연장을 멈춘 뒤 반환하므로, 이후 저장한 응답의 보관 기간을 덮어쓰지 않습니다.
+
+        Args:
+            key (str): 선점 키
+
+        Returns:
+            Iterator[None]: 처리하는 동안 선점을 유지하는 컨텍스트
+        """
+        stopped = threading.Event()
+        interval = settings.IDEMPOTENCY_LOCK_TIMEOUT / 3
+
+        def heartbeat() -> None:
+            while not stopped.wait(interval):
+                cache.touch(key, timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT)
+
+        thread = threading.Thread(target=heartbeat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+            thread.join()
+
+    def _get_idempotency_key(self, request: Request) -> Optional[str]:
+        idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if idempotency_key is not None and not 0 < len(idempotency_key) <= self.MAX_KEY_LENGTH:
+            raise InvalidParameterFormatException(
+                detail=SYSTEM_CODE.message("INVALID_PARAMETER_FORMAT"),
+                code=SYSTEM_CODE.code("INVALID_PARAMETER_FORMAT"),
+            )
+        return idempotency_key
+
+    def _replay(self, entry: dict[str, Any], fingerprint: str) -> Response:
+        # 같은 키를 다른 요청에 재사용한 경우
+        if entry["fingerprint"] != fingerprint:
+            raise InvalidParameterFormatException(
+                detail=SYSTEM_CODE.message("INVALID_PARAMETER_FORMAT"),
+                code=SYSTEM_CODE.code("INVALID_PARAMETER_FORMAT"),
+            )
+        return Response(
+            data=entry["data"],
+            status=entry["status_code"],
+            headers={IDEMPOTENCY_REPLAYED_HEADER: "true"},
+        )
+
+    def run(self, request: Request, scope: str, handler: Callable[[], Response]) -> Response:
+        """
+        이 함수는 Idempotency-Key 헤더가 있으면 같은 키의 요청을 한 번만 처리합니다.
+        헤더가 없으면 요청을 그대로 처리합니다.
+
+        Args:
+            request (Request): 요청 객체
+            scope (str): 키를 구분하는 API 이름
+            handler (Callable[[], Response]): 요청을 처리하는 함수
+
+        Returns:
+            Response: 처리 결과 또는 저장된 응답
+
+        Raises:
+            ValidationException: 같은 키의 요청이 대기 시간이 지나도 처리 중인 경우(IDEMPOTENCY_REQUEST_IN_PROGRESS)
+        """
+        idempotency_key = self._get_idempotency_key(request)
+        if idempotency_key is None:
+            return handler()
+
+        key = self._get_key(request, scope, idempotency_key)
+        fingerprint = self._get_fingerprint(request)
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+        while not cache.add(
+            key,
+            {"status": self.PROCESSING, "fingerprint": fingerprint},
+            timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT,
+        ):
+            entry = cache.get(key)
+            if entry is not None and entry["status"] == self.COMPLETED:
+                return self._replay(entry, fingerprint)
+
+            # 먼저 도착한 요청이 처리 중이면 대기(대기 시간이 지나도 처리 중이면 직접 처리하지 않고 다시 요청하도록 안내)
+            if time.monotonic() >= deadline:
+                raise ValidationException(
+                    detail=SYSTEM_CODE.message("IDEMPOTENCY_REQUEST_IN_PROGRESS"),
+                    code=SYSTEM_CODE.code("IDEMPOTENCY_REQUEST_IN_PROGRESS"),
+                )
+            time.sleep(self.WAIT_INTERVAL)
+
+        try:
+            with self._hold_claim(key):
+                response = handler()
+        except BaseException:
+            cache.delete(key)
+            raise
+
+        # 성공한 응답만 저장(실패한 요청은 같은 키로 다시 처리할 수 있음)
+        if status.is_success(response.status_code):
+            cache.set(
+                key,
+                {
+                    "status": self.COMPLETED,
+                    "fingerprint": fingerprint,
+                    "status_code": response.status_code,
+                    "data": response.data,
+                },
+                timeout=settings.IDEMPOTENCY_KEY_TIMEOUT,
+            )
+        else:
+            cache.delete(key)
+
+        return response
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from mung_manager_db.models import Reservation
+
+
+class Command(BaseCommand):
+    help = "대표 예약 아이디(root_id)가 없는 기존 연박 호텔 예약에 대표 예약 아이디를 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 처리할 연박 예약 수")
+
+    def get_update_sql(self) -> str:
+        """
+        이 함수는 대표 예약부터 부모 관계를 따라 내려가며 연박 예약 전체에 대표 예약 아이디를 채우는 SQL을 반환합니다.
+
+        Returns:
+            str: UPDATE 문
+        """
+        meta = Reservation._meta
+        qn = connection.ops.quote_name
+        table = qn(meta.db_table)
+        pk_column = qn(meta.pk.column)
+        parent_column = qn(meta.get_field("parent").column)
+        root_column = qn(meta.get_field("root").column)
+        return f"""
+            WITH RECURSIVE chain AS (
+                SELECT {pk_column} AS reservation_id, {pk_column} AS root_id
+                FROM {table}
+                WHERE {pk_column} = ANY(%s)
+
+                UNION ALL
+
+                SELECT r.{pk_column}, c.root_id
+                FROM {table} r
+                INNER JOIN chain c ON r.{parent_column} = c.reservation_id
+            )
+            UPDATE {table}
+            SET {root_column} = chain.root_id
+            FROM chain
+            WHERE {table}.{pk_column} = chain.reservation_id
+        """
+
+    def handle(self, *args, **options):
+        update_sql = self.get_update_sql()
+        updated_count = 0
+        while True:
+            # 짧은 트랜잭션으로 나누어 처리하여 예약 테이블을 오래 잠그지 않음(배포 시 migrate가 끝나면 실행됨)
+            with transaction.atomic():
+                root_ids = list(
+                    Reservation.objects.filter(parent_id__isnull=True, is_extented=True, root_id__isnull=True)
+                    .order_by("id")
+                    .values_list("id", flat=True)[: options["batch_size"]]
+                )
+                if not root_ids:
+                    break
+
+                with connection.cursor() as cursor:
+                    cursor.execute(update_sql, [root_ids])
+                    updated_count += cursor.rowcount
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled root_id of {updated_count} reservations"))
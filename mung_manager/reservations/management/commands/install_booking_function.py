@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from mung_manager.reservations.booking_functions import (
+    get_drop_booking_function_sql,
+    install_booking_function,
+)
+
+
+class Command(BaseCommand):
+    help = "시간권/종일권 예약을 한 번의 호출로 처리하는 DB 함수를 다시 생성합니다. (migrate 시 자동으로 생성됩니다.)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--drop", action="store_true", help="설치된 함수를 제거합니다.")
+
+    def handle(self, *args, **options):
+        if options["drop"]:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(get_drop_booking_function_sql())
+            self.stdout.write(self.style.SUCCESS("Dropped booking function"))
+            return
+
+        install_booking_function()
+        self.stdout.write(self.style.SUCCESS("Installed booking function"))
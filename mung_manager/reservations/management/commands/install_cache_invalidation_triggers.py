@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from mung_manager.reservations.cache_invalidation_triggers import (
+    install_cache_invalidation_triggers,
+)
+
+
+class Command(BaseCommand):
+    help = "반려동물 유치원 캐시 만료를 위한 NOTIFY 트리거를 다시 설치합니다. (migrate 시 자동으로 설치됩니다.)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--drop", action="store_true", help="설치된 트리거와 함수를 제거합니다.")
+
+    def handle(self, *args, **options):
+        install_cache_invalidation_triggers(drop=options["drop"])
+        if options["drop"]:
+            self.stdout.write(self.style.SUCCESS("Dropped cache invalidation triggers"))
+            return
+
+        self.stdout.write(self.style.SUCCESS("Installed cache invalidation triggers"))
@@ -0,0 +1,81 @@
+import json
+import select
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from mung_manager.reservations.caches import (
+    PET_KINDERGARDEN_CACHE_INVALIDATION_CHANNEL,
+    PetKindergardenCalendarCache,
+)
+from mung_manager_db.models import PetKindergarden
+
+# select 대기 시간(초), 연결 상태를 주기적으로 확인하기 위해 사용
+POLL_TIMEOUT = 30
+# 연결이 끊어졌을 때 재연결까지 대기하는 최대 시간(초)
+MAX_RECONNECT_DELAY = 60
+# 재연결 후 캘린더를 제거할 때 한 번에 처리하는 유치원 수
+EVICT_BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = "파트너 서비스의 변경 사항을 NOTIFY로 전달받아 반려동물 유치원 캐시를 만료합니다."
+
+    def handle(self, *args, **options):
+        pet_kindergarden_calendar_cache = PetKindergardenCalendarCache()
+        self._reconnect_delay = 1
+
+        while True:
+            try:
+                self._listen(pet_kindergarden_calendar_cache)
+            except KeyboardInterrupt:
+                return
+            except Exception as exc:
+                # 연결이 끊어진 동안의 알림은 유실되므로 다시 LISTEN한 뒤 모든 유치원의 캘린더를 제거
+                self.stderr.write(f"Cache invalidation listener disconnected: {exc}")
+                connection.close()
+                time.sleep(self._reconnect_delay)
+                self._reconnect_delay = min(self._reconnect_delay * 2, MAX_RECONNECT_DELAY)
+
+    def _listen(self, pet_kindergarden_calendar_cache: PetKindergardenCalendarCache) -> None:
+        connection.ensure_connection()
+        pg_connection = connection.connection
+        pg_connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with pg_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {PET_KINDERGARDEN_CACHE_INVALIDATION_CHANNEL}")
+        self.stdout.write(f"Listening on {PET_KINDERGARDEN_CACHE_INVALIDATION_CHANNEL}")
+        self._reconnect_delay = 1
+
+        # LISTEN 이전(시작 전 또는 연결이 끊어진 동안)에 발생한 변경은 알림을 받을 수 없으므로
+        # LISTEN 이후에 모든 유치원의 캘린더를 제거하여 오래된 캘린더가 긴 TTL 동안 제공되지 않도록 함
+        self._evict_all(pet_kindergarden_calendar_cache)
+
+        while True:
+            if select.select([pg_connection], [], [], POLL_TIMEOUT) == ([], [], []):
+                # 알림이 없으면 연결이 살아있는지 확인
+                with pg_connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                continue
+
+            pg_connection.poll()
+            pet_kindergarden_ids = set()
+            while pg_connection.notifies:
+                notify = pg_connection.notifies.pop(0)
+                try:
+                    payload = json.loads(notify.payload)
+                except ValueError:
+                    continue
+                if payload.get("pet_kindergarden_id") is not None:
+                    pet_kindergarden_ids.add(int(payload["pet_kindergarden_id"]))
+
+            # 같은 유치원에 대한 연속된 알림은 한 번만 처리
+            for pet_kindergarden_id in pet_kindergarden_ids:
+                pet_kindergarden_calendar_cache.delete(pet_kindergarden_id)
+
+    def _evict_all(self, pet_kindergarden_calendar_cache: PetKindergardenCalendarCache) -> None:
+        pet_kindergarden_ids = list(PetKindergarden.objects.order_by("id").values_list("id", flat=True))
+        for start in range(0, len(pet_kindergarden_ids), EVICT_BATCH_SIZE):
+            pet_kindergarden_calendar_cache.delete_many(pet_kindergarden_ids[start : start + EVICT_BATCH_SIZE])
+        self.stdout.write("Evicted all pet kindergarden calendars")
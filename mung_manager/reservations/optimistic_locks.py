@@ -0,0 +1,156 @@
+import logging
+import random
+import time
+from typing import Callable, TypeVar
+
+from concurrency.exceptions import RecordModifiedError
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from mung_manager_commons.constants import SYSTEM_CODE
+from mung_manager_commons.errors import ValidationException
+from mung_manager_db.models import CustomerTicket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CustomerTicketLockTelemetry:
+    """
+    이 클래스는 고객 티켓 낙관적 락의 충돌, 재시도, 최종 실패 횟수를 반려동물 유치원별로 Redis에 집계합니다.
+    """
+
+    KEY_PREFIX = "reservations:customer_ticket_lock"
+    CONFLICT = "conflict"
+    RETRY = "retry"
+    FAILURE = "failure"
+    EVENTS = [CONFLICT, RETRY, FAILURE]
+
+    def _get_key(self, pet_kindergarden_id: int, event: str) -> str:
+        return f"{self.KEY_PREFIX}:{pet_kindergarden_id}:{event}"
+
+    def record(self, pet_kindergarden_id: int, event: str) -> None:
+        """
+        이 함수는 주어진 이벤트의 횟수를 1 증가시킵니다. 집계에 실패하더라도 예약 처리는 계속합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            event (str): 이벤트(conflict, retry, failure)
+
+        Returns:
+            None
+        """
+        key = self._get_key(pet_kindergarden_id, event)
+        try:
+            cache.add(key, 0, timeout=settings.CUSTOMER_TICKET_LOCK_TELEMETRY_TIMEOUT)
+            cache.incr(key)
+        except Exception as e:
+            logger.warning(f"Failed to record customer ticket lock {event}({pet_kindergarden_id}): {e}")
+
+    def get_counts(self, pet_kindergarden_id: int) -> dict[str, int]:
+        """
+        이 함수는 반려동물 유치원의 이벤트별 집계 횟수를 조회합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            dict[str, int]: 이벤트별 횟수
+        """
+        values = cache.get_many([self._get_key(pet_kindergarden_id, event) for event in self.EVENTS])
+        return {event: values.get(self._get_key(pet_kindergarden_id, event), 0) for event in self.EVENTS}
+
+
+customer_ticket_lock_telemetry = CustomerTicketLockTelemetry()
+
+
+class CustomerTicketLockConflict(Exception):
+    """
+    이 클래스는 트랜잭션 안에서 해결하지 못한 고객 티켓 낙관적 락 충돌을 나타내는 예외입니다.
+    run_with_customer_ticket_lock_retry가 트랜잭션을 롤백한 뒤 쓰기 단계를 처음부터 다시 실행합니다.
+    """
+
+    def __init__(self, conflict_code: str):
+        super().__init__(conflict_code)
+        self.conflict_code = conflict_code
+
+
+def save_customer_ticket_with_retry(
+    customer_ticket: CustomerTicket,
+    apply: Callable[[CustomerTicket], bool],
+    pet_kindergarden_id: int,
+    update_fields: list[str],
+    conflict_code: str,
+) -> CustomerTicket:
+    """
+    이 함수는 고객 티켓의 횟수를 변경하여 낙관적 락으로 저장하고, 충돌하면 최신 값으로 한 번만 즉시 다시 적용합니다.
+    트랜잭션 안에서 호출되므로 대기하지 않으며, 다시 충돌하면 CustomerTicketLockConflict를 발생시켜
+    잠금을 해제한 뒤 트랜잭션 밖에서 재시도하도록 합니다(run_with_customer_ticket_lock_retry).
+
+    Args:
+        customer_ticket (CustomerTicket): 고객 티켓 객체
+        apply (Callable[[CustomerTicket], bool]): 횟수를 변경하는 함수(잔여 횟수가 부족하면 False 반환)
+        pet_kindergarden_id (int): 반려동물 유치원 아이디(집계용)
+        update_fields (list[str]): 저장할 필드 목록
+        conflict_code (str): 재시도 횟수를 모두 사용했을 때 반환할 에러 코드
+
+    Returns:
+        CustomerTicket: 저장된 고객 티켓 객체
+    """
+    for attempt in range(2):
+        if not apply(customer_ticket):
+            raise ValidationException(
+                detail=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER_TICKET"),
+                code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_TICKET"),
+            )
+
+        try:
+            customer_ticket.save(update_fields=update_fields)
+            return customer_ticket
+        except RecordModifiedError:
+            customer_ticket_lock_telemetry.record(pet_kindergarden_id, CustomerTicketLockTelemetry.CONFLICT)
+            if attempt == 1:
+                raise CustomerTicketLockConflict(conflict_code)
+
+            # 다른 요청이 저장한 버전과 횟수를 다시 읽어 재적용
+            customer_ticket.refresh_from_db(fields=["used_count", "unused_count", "version"])
+
+    return customer_ticket
+
+
+def run_with_customer_ticket_lock_retry(write: Callable[[], T], pet_kindergarden_id: int) -> T:
+    """
+    이 함수는 쓰기 단계를 트랜잭션으로 실행하고, 고객 티켓 충돌이 해결되지 않으면 트랜잭션을 롤백한 뒤 다시 실행합니다.
+    재시도 전에는 티켓, 일별 예약 현황, 날짜 잠금을 모두 해제한 상태에서
+    지수적으로 늘어나는 범위 안의 임의의 시간만큼 대기하여 동시에 재시도하지 않도록 합니다.
+
+    Args:
+        write (Callable[[], T]): 검증과 쓰기 단계를 처음부터 실행하는 함수(재시도마다 최신 데이터를 다시 조회해야 함)
+        pet_kindergarden_id (int): 반려동물 유치원 아이디(집계용)
+
+    Returns:
+        T: 쓰기 단계 결과
+    """
+    max_retries = settings.CUSTOMER_TICKET_LOCK_MAX_RETRIES
+    for attempt in range(max_retries):
+        try:
+            with transaction.atomic():
+                return write()
+        except CustomerTicketLockConflict:
+            customer_ticket_lock_telemetry.record(pet_kindergarden_id, CustomerTicketLockTelemetry.RETRY)
+            # 바깥 트랜잭션 안에서 호출되면 잠금이 유지되므로 대기하지 않고 바로 재시도
+            if not transaction.get_connection().in_atomic_block:
+                time.sleep(random.uniform(0, settings.CUSTOMER_TICKET_LOCK_RETRY_BASE_DELAY * 2**attempt))
+
+    try:
+        with transaction.atomic():
+            return write()
+    except CustomerTicketLockConflict as e:
+        customer_ticket_lock_telemetry.record(pet_kindergarden_id, CustomerTicketLockTelemetry.FAILURE)
+        logger.warning(f"Customer ticket lock conflict({pet_kindergarden_id}) after {max_retries} retries")
+        raise ValidationException(
+            detail=SYSTEM_CODE.message(e.conflict_code),
+            code=SYSTEM_CODE.code(e.conflict_code),
+        )
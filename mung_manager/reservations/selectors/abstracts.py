@@ -5,7 +5,11 @@ from typing import Annotated, Any, Optional
 from django.db.models import QuerySet
 from django_stubs_ext import ValuesQuerySet
 
-from mung_manager.reservations.types import attendance_type, is_expired_type
+from mung_manager.reservations.types import (
+    attendance_type,
+    day_off_rule_type,
+    is_expired_type,
+)
 from mung_manager_commons.errors import NotImplementedException
 from mung_manager_db.models import (
     Customer,
@@ -27,7 +31,7 @@ class AbstractReservationSelector(ABC):
     @abstractmethod
     def get_queryset_by_customer_and_pet_kindergarden_for_detail(
         self, customer: Customer, pet_kindergarden: PetKindergarden, ticket_status: str
-    ) -> QuerySet[Annotated[Reservation, attendance_type]] | list[dict[str, Any]]:
+    ) -> QuerySet[Annotated[Reservation, attendance_type], dict[str, Any]]:
         raise NotImplementedException()
 
     @abstractmethod
@@ -35,7 +39,21 @@ class AbstractReservationSelector(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def get_child_ids_by_parent_id(self, parent_id: int) -> list[tuple[int, None]]:
+    def get_queryset_for_uncanceled_reservations_by_ids(
+        self, customer: Customer, pet_kindergarden: PetKindergarden, reservation_ids: list[int]
+    ) -> QuerySet[Reservation]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_ids_by_root_ids(self, root_ids: list[int], min_depth: int = 0) -> list[int]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_child_ids_by_parent_ids(self, parent_ids: list[int]) -> list[int]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_next_ids(self, count: int) -> list[int]:
         raise NotImplementedException()
 
     @abstractmethod
@@ -58,22 +76,17 @@ class AbstractReservationSelector(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def get_queryset_for_hotel_type_reservation(
+    def get_hotel_stay_periods_by_customer_pet_ids(
         self,
-        customer_id: int,
-        customer_pet_id: int,
         pet_kindergarden_id: int,
-    ) -> list[str]:
+        customer_pet_ids: list[int],
+        start_at: datetime,
+        end_at: datetime,
+    ) -> list[tuple[int, datetime, datetime]]:
         raise NotImplementedException()
 
 
 class AbstractDailyReservationSelector(ABC):
-    @abstractmethod
-    def get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-        self, pet_kindergarden_id: int, reserved_at: datetime, end_at: datetime | None
-    ) -> QuerySet[DailyReservation]:
-        raise NotImplementedException()
-
     @abstractmethod
     def get_queryset_for_fully_booked(
         self,
@@ -98,3 +111,7 @@ class AbstractDayOffSelector(ABC):
         date_range: list[datetime],
     ) -> ValuesQuerySet[DayOff, date]:
         raise NotImplementedException()
+
+    @abstractmethod
+    def get_queryset_by_pet_kindergarden_id_for_day_off_rule(self, pet_kindergarden_id: int) -> list[day_off_rule_type]:
+        raise NotImplementedException()
@@ -1,5 +1,7 @@
 from datetime import date, datetime
 
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
 from django.db.models.query import QuerySet
 from django_stubs_ext import ValuesQuerySet
 
@@ -14,27 +16,6 @@ class DailyReservationSelector(AbstractDailyReservationSelector):
     이 클래스는 일별 예약을 DB에서 PULL하는 비즈니스 로직을 담당합니다.
     """
 
-    def get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-        self, pet_kindergarden_id: int, reserved_at: datetime, end_at: datetime | None
-    ) -> QuerySet[DailyReservation]:
-        """
-        반려동물 유치원 아이디와 예약일과 종료일로 일별 예약 리스트를 조회합니다.
-
-        Args:
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
-            reserved_at (datetime): 예약일
-            end_at (datetime): 종료일
-
-        Returns:
-            QuerySet[DailyReservation]: 일별 예약 리스트 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
-        """
-        reserved_at_str = reserved_at.strftime("%Y-%m-%d")
-        end_at_str = end_at.strftime("%Y-%m-%d") if end_at else None
-
-        return DailyReservation.objects.filter(
-            pet_kindergarden_id=pet_kindergarden_id, reserved_at__range=[reserved_at_str, end_at_str]
-        )
-
     def get_queryset_for_fully_booked(
         self,
         pet_kindergarden_id: int,
@@ -55,11 +36,18 @@ class DailyReservationSelector(AbstractDailyReservationSelector):
         if daily_pet_limit == -1:
             return None
 
-        return DailyReservation.objects.filter(
-            pet_kindergarden_id=pet_kindergarden_id,
-            reserved_at__range=date_range,
-            total_pet_count__gte=daily_pet_limit,
-        ).values_list("reserved_at", flat=True)
+        # 하루 정원은 날짜 단위로 적용되므로 같은 날짜의 행(시간권의 등원 일시별 행, 샤드 행)을 합산하여 비교
+        return (
+            DailyReservation.objects.filter(
+                pet_kindergarden_id=pet_kindergarden_id,
+                reserved_at__range=date_range,
+            )
+            .annotate(reserved_date=TruncDate("reserved_at"))
+            .values("reserved_date")
+            .annotate(pet_count=Sum("total_pet_count"))
+            .filter(pet_count__gte=daily_pet_limit)
+            .values_list("reserved_date", flat=True)
+        )
 
     def get_queryset_by_pet_kindergarden_id_and_reserved_at(
         self, pet_kindergarden_id: int, reserved_at: str
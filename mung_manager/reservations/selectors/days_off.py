@@ -2,7 +2,9 @@ from datetime import date, datetime
 
 from django_stubs_ext import ValuesQuerySet
 
+from mung_manager.reservations.day_off_rules import DayOffRule
 from mung_manager.reservations.selectors.abstracts import AbstractDayOffSelector
+from mung_manager.reservations.types import day_off_rule_type
 from mung_manager_db.models import DayOff
 
 
@@ -30,3 +32,22 @@ class DayOffSelector(AbstractDayOffSelector):
         return DayOff.objects.filter(pet_kindergarden_id=pet_kindergarden_id, day_off_at__range=date_range).values_list(
             "day_off_at", flat=True
         )
+
+    def get_queryset_by_pet_kindergarden_id_for_day_off_rule(self, pet_kindergarden_id: int) -> list[day_off_rule_type]:
+        """
+        반려동물 유치원 아이디로 반복 휴무 규칙(요일, 매년 같은 날짜, 예외 영업일) 목록을 조회합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            list[day_off_rule_type]: 존재하지 않거나 반복 휴무 규칙 모델이 없으면 빈 리스트 반환
+        """
+        if DayOffRule is None:
+            return []
+
+        return list(
+            DayOffRule.objects.filter(pet_kindergarden_id=pet_kindergarden_id).values(
+                "rule_type", "weekday", "month", "day", "excluded_at"
+            )
+        )
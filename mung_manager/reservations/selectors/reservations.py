@@ -1,5 +1,4 @@
-from collections import defaultdict
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Annotated, Any, Optional
 
 from django.db import connection
@@ -10,12 +9,14 @@ from django.db.models import (
     ExpressionWrapper,
     F,
     IntegerField,
+    Max,
+    Min,
     Q,
     QuerySet,
     Value,
     When,
 )
-from django.db.models.functions import ExtractDay
+from django.db.models.functions import Coalesce, ExtractDay
 from django.utils import timezone
 
 from mung_manager.customers.types import is_expired_type
@@ -30,13 +31,6 @@ class ReservationSelector(AbstractReservationSelector):
     이 클래스는 예약을 DB에서 PULL하는 비즈니스 로직을 담당합니다.
     """
 
-    @staticmethod
-    def find_root(reservation):
-        current = reservation
-        while current.parent_id is not None:
-            current = current.parent
-        return current
-
     def get_queryset_by_customer_and_pet_kindergarden(
         self, customer: Customer, pet_kindergarden: PetKindergarden
     ) -> list[dict[str, Any]]:
@@ -50,56 +44,30 @@ class ReservationSelector(AbstractReservationSelector):
         Returns:
             list[dict[str, Any]]: 예약 리스트 반환
         """
-        reservations = Reservation.objects.filter(
-            customer=customer,
-            pet_kindergarden=pet_kindergarden,
-            reserved_at__gt=timezone.now(),
-            reservation_status=ReservationStatus.COMPLETED.value,
-        ).select_related("customer_pet")
-
-        reservation_list = []
-
-        # 각 예약을 그룹화
-        grouped_reservations = defaultdict(list)
-        for reservation in reservations:
-            reservation_id = reservation.id
-            if reservation.customer_ticket.ticket.ticket_type == TicketType.HOTEL.value and reservation.is_extented:
-                root_reservation = self.find_root(reservation)
-                reservation_id = root_reservation.id
-            grouped_reservations[reservation_id].append(reservation)
-
-        # 그룹화된 예약 정보를 딕셔너리로 변환
-        for group in grouped_reservations.values():
-            if len(group) == 1 and group[0].customer_ticket.ticket.ticket_type != TicketType.HOTEL.value:
-                reservation = group[0]
-                ticket_type_value = reservation.customer_ticket.ticket.ticket_type
-                ticket_type = (
-                    TicketType.TIME.value if ticket_type_value == TicketType.TIME.value else TicketType.ALL_DAY.value
-                )
-                reservation_data = {
-                    "ticket_type": ticket_type,
-                    "start_at": reservation.reserved_at,
-                    "end_at": reservation.end_at,
-                    "customer_pet_name": reservation.customer_pet.name,
-                }
-            else:
-                ticket_type = TicketType.HOTEL.value
-                start_time = min(res.reserved_at for res in group)  # type: ignore
-                end_time = max(res.end_at for res in group)  # type: ignore
-                reservation_data = {
-                    "ticket_type": ticket_type,
-                    "start_at": start_time,
-                    "end_at": end_time,
-                    "customer_pet_name": group[0].customer_pet.name,
-                }
-
-            reservation_list.append(reservation_data)
-
-        return reservation_list
+        # 연박 호텔 예약은 대표 예약 아이디(root_id)로 묶고, 나머지 예약은 예약 하나를 한 그룹으로 집계
+        # (한 그룹의 예약은 모두 같은 티켓 타입과 반려동물을 가짐)
+        reservations = (
+            Reservation.objects.filter(
+                customer=customer,
+                pet_kindergarden=pet_kindergarden,
+                reserved_at__gt=timezone.now(),
+                reservation_status=ReservationStatus.COMPLETED.value,
+            )
+            .annotate(group_id=Coalesce("root_id", "id"))
+            .values("group_id")
+            .annotate(
+                ticket_type=Min("customer_ticket__ticket__ticket_type"),
+                start_at=Min("reserved_at"),
+                end_at=Max("end_at"),
+                customer_pet_name=Min("customer_pet__name"),
+            )
+            .order_by("start_at", "group_id")
+        )
+        return list(reservations)
 
     def get_queryset_by_customer_and_pet_kindergarden_for_detail(
         self, customer: Customer, pet_kindergarden: PetKindergarden, ticket_status: str
-    ) -> QuerySet[Annotated[Reservation, attendance_type]] | list[dict[str, Any]]:
+    ) -> QuerySet[Annotated[Reservation, attendance_type], dict[str, Any]]:
         """
         고객 객체와 반려동물 유치원 객체로 등원 예정인 예약 상세 목록을 조회합니다.
 
@@ -109,7 +77,7 @@ class ReservationSelector(AbstractReservationSelector):
             ticket_status (str): 티켓 상태
 
         Returns:
-            QuerySet[Annotated[Reservation, attendance_type]] | list[dict[str, Any]]: 정의된 응답 스키마 및 예약 리스트 반환
+            QuerySet[Annotated[Reservation, attendance_type], dict[str, Any]]: 예약 일시 순으로 정렬된 예약 쿼리셋 반환
         """
         reservations = self.generate_reservation_queryset(customer, pet_kindergarden, ticket_status)
 
@@ -167,7 +135,12 @@ class ReservationSelector(AbstractReservationSelector):
             )
         )
 
-        return list(hotel_reservations) + list(regular_reservations)
+        # 두 쿼리셋을 DB에서 합친 뒤 정렬하여 페이지네이션의 LIMIT/OFFSET이 DB에서 적용되도록 함
+        # (등원 예정 예약은 가까운 예약부터, 지난 예약은 최근 예약부터 정렬)
+        ordering = ["reserved_at", "reservation_id"]
+        if ticket_status == TicketStatus.COMPLETED.value:
+            ordering = ["-reserved_at", "-reservation_id"]
+        return hotel_reservations.union(regular_reservations, all=True).order_by(*ordering)
 
     @staticmethod
     def generate_reservation_queryset(customer, pet_kindergarden, ticket_status):
@@ -222,42 +195,116 @@ class ReservationSelector(AbstractReservationSelector):
             Optional[Reservation]: 예약이 존재하면 예약 객체를 반환하고, 존재하지 않으면 None을 반환
         """
         try:
-            return Reservation.objects.get(id=reservation_id, reservation_status=ReservationStatus.COMPLETED.value)
+            return Reservation.objects.select_related("customer_ticket__ticket").get(
+                id=reservation_id, reservation_status=ReservationStatus.COMPLETED.value
+            )
 
         except Reservation.DoesNotExist:
             return None
 
-    def get_child_ids_by_parent_id(self, parent_id: int) -> list[tuple[int, None]]:
+    def get_queryset_for_uncanceled_reservations_by_ids(
+        self, customer: Customer, pet_kindergarden: PetKindergarden, reservation_ids: list[int]
+    ) -> QuerySet[Reservation]:
         """
-        부모 예약 아이디로 모든 자식 예약 아이디를 조회합니다.
+        고객의 취소되지 않은 예약을 예약 아이디 목록으로 잠금과 함께 조회합니다.
 
         Args:
-            parent_id (int): 부모 예약 아이디
+            customer (Customer): 고객 객체
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation_ids (list[int]): 예약 아이디 리스트
 
         Returns:
-            list[tuple[int, int]]: 부모 예약 아이디와 모든 자식 예약 아이디를 튜플로 반환
+            QuerySet[Reservation]: 티켓 정보를 포함한 예약 쿼리셋
         """
+        return (
+            Reservation.objects.select_for_update(of=("self",))
+            .select_related("customer_ticket__ticket")
+            .filter(
+                id__in=reservation_ids,
+                customer=customer,
+                pet_kindergarden=pet_kindergarden,
+                reservation_status=ReservationStatus.COMPLETED.value,
+            )
+        )
+
+    def get_ids_by_root_ids(self, root_ids: list[int], min_depth: int = 0) -> list[int]:
+        """
+        대표 예약 아이디 목록으로 연박 예약을 이루는 예약 아이디를 조회합니다.
+
+        Args:
+            root_ids (list[int]): 대표 예약 아이디 리스트
+            min_depth (int): 조회할 최소 깊이(해당 예약과 이후 예약만 조회할 때 사용)
+
+        Returns:
+            list[int]: 깊이 오름차순으로 정렬된 예약 아이디 리스트
+        """
+        if not root_ids:
+            return []
+
+        return list(
+            Reservation.objects.filter(root_id__in=root_ids, depth__gte=min_depth)
+            .order_by("root_id", "depth")
+            .values_list("id", flat=True)
+        )
+
+    def get_child_ids_by_parent_ids(self, parent_ids: list[int]) -> list[int]:
+        """
+        부모 예약 아이디 목록으로 부모 관계를 따라 이어지는 모든 자식 예약 아이디를 한 번에 조회합니다.
+        대표 예약 아이디(root_id)가 채워지기 전에 생성된 연박 예약을 조회할 때 사용합니다.
+
+        Args:
+            parent_ids (list[int]): 부모 예약 아이디 리스트
+
+        Returns:
+            list[int]: 모든 자식 예약 아이디 리스트
+        """
+        if not parent_ids:
+            return []
+
+        meta = Reservation._meta
+        qn = connection.ops.quote_name
+        table = qn(meta.db_table)
+        pk_column = qn(meta.pk.column)
+        parent_column = qn(meta.get_field("parent").column)
         with connection.cursor() as cursor:
-            query = """
-            WITH RECURSIVE CTE AS (
-                -- Anchor member: This selects the initial parent_id
-                SELECT reservation_id,parent_id
-                FROM reservation
-                WHERE parent_id = %s
-
-                UNION ALL
-
-                -- Recursive member: This joins the table to itself
-                SELECT r.reservation_id, r.parent_id
-                FROM reservation r
-                INNER JOIN CTE c ON r.parent_id = c.reservation_id
+            cursor.execute(
+                f"""
+                WITH RECURSIVE children AS (
+                    SELECT {pk_column} AS reservation_id
+                    FROM {table}
+                    WHERE {parent_column} = ANY(%s)
+
+                    UNION ALL
+
+                    SELECT r.{pk_column}
+                    FROM {table} r
+                    INNER JOIN children c ON r.{parent_column} = c.reservation_id
+                )
+                SELECT reservation_id
+                FROM children
+                """,
+                [parent_ids],
             )
-            SELECT reservation_id
-            FROM CTE;
+            return [row[0] for row in cursor.fetchall()]
+
+    def get_next_ids(self, count: int) -> list[int]:
+        """
+        예약 아이디 시퀀스에서 다음 아이디를 count개 미리 할당합니다.
+
+        Args:
+            count (int): 할당할 아이디 개수
+
+        Returns:
+            list[int]: 오름차순으로 정렬된 예약 아이디 리스트
+        """
+        with connection.cursor() as cursor:
+            query = """
+            SELECT nextval(pg_get_serial_sequence(%s, %s))
+            FROM generate_series(1, %s);
             """
-            cursor.execute(query, [parent_id])
+            cursor.execute(query, [Reservation._meta.db_table, Reservation._meta.pk.column, count])
             result = cursor.fetchall()
-        return result
+        return sorted(row[0] for row in result)
 
     def get_queryset_with_customer_ticket_and_ticket_by_ids(self, reservation_ids: list[int]) -> QuerySet[Reservation]:
         """
@@ -338,36 +385,36 @@ class ReservationSelector(AbstractReservationSelector):
 
         return list(set(formatted_dates))
 
-    def get_queryset_for_hotel_type_reservation(
+    def get_hotel_stay_periods_by_customer_pet_ids(
         self,
-        customer_id: int,
-        customer_pet_id: int,
         pet_kindergarden_id: int,
-    ) -> list[str]:
+        customer_pet_ids: list[int],
+        start_at: datetime,
+        end_at: datetime,
+    ) -> list[tuple[int, datetime, datetime]]:
         """
-        이 함수는 사용자의 방문이 예정된 호텔 타입 예약 날짜를 반환합니다.
+        이 함수는 주어진 기간과 겹치는 반려동물별 호텔 예약의 숙박 기간(등원 일시, 하원 일시)을 반환합니다.
+        연박 예약은 모두 같은 기간을 가지므로 중복을 제거하여 반환합니다.
 
         Args:
-            customer_id (int): 고객 아이디
-            customer_pet_id (int): 고객 반려동물 아이디
             pet_kindergarden_id (int): 반려동물 유치원 아이디
+            customer_pet_ids (list[int]): 고객 반려동물 아이디 리스트
+            start_at (datetime): 조회 시작 일시
+            end_at (datetime): 조회 종료 일시
 
         Returns:
-            list[str]: 예약 날짜 리스트를 반환하며, 존재하지 않을 경우 빈 리스트를 반환합니다.
+            list[tuple[int, datetime, datetime]]: (고객 반려동물 아이디, 등원 일시, 하원 일시) 리스트
         """
-        reserved_dates = (
+        return list(
             Reservation.objects.filter(
-                customer_id=customer_id,
-                customer_pet_id=customer_pet_id,
                 pet_kindergarden_id=pet_kindergarden_id,
-                reserved_at__gte=timezone.now(),
+                customer_pet_id__in=customer_pet_ids,
                 reservation_status=ReservationStatus.COMPLETED.value,
                 customer_ticket__ticket__ticket_type=TicketType.HOTEL.value,
+                reserved_at__lte=end_at,
+                end_at__gte=start_at,
             )
-            .select_related("customer_ticket", "customer_ticket__ticket")
-            .values_list("reserved_at", flat=True)
+            .order_by()
+            .values_list("customer_pet_id", "reserved_at", "end_at")
+            .distinct()
         )
-
-        formatted_dates = [date.strftime("%Y-%m-%d") for date in reserved_dates]
-
-        return formatted_dates
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from datetime import datetime, time
-from typing import Optional
-
-from django.db.models import QuerySet
+from datetime import date, datetime, time
+from typing import Any, Optional
 
+from mung_manager.reservations.types import (
+    day_off_rule_type,
+    pet_kindergarden_calendar_type,
+)
 from mung_manager_commons.errors import NotImplementedException
 from mung_manager_db.models import Customer, PetKindergarden
 
@@ -14,6 +16,12 @@ class AbstractReservationService(ABC):
     def cancel_reservation(self, pet_kindergarden: PetKindergarden, reservation_id: int) -> None:
         raise NotImplementedException()
 
+    @abstractmethod
+    def cancel_reservations(
+        self, customer: Customer, pet_kindergarden: PetKindergarden, reservation_ids: list[int]
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedException()
+
     @abstractmethod
     def get_associated_reservation_ids_by_reservation_id(self, reservation_id: int) -> list[int]:
         raise NotImplementedException()
@@ -27,19 +35,134 @@ class AbstractReservationService(ABC):
         self,
         start_date: datetime,
         end_date: datetime,
-        day_off_dates_queryset: QuerySet,
-        fully_booked_dates_queryset: QuerySet,
+        closed_ordinals: set[int],
     ) -> list[str]:
         raise NotImplementedException()
 
+    @abstractmethod
+    def build_pet_kindergarden_calendar(
+        self, pet_kindergarden_id: int, start_date: date, end_date: date, check_capacity: bool = True
+    ) -> pet_kindergarden_calendar_type:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_day_off_rules(self, pet_kindergarden_id: int) -> list[day_off_rule_type]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_pet_kindergarden_calendar(self, pet_kindergarden_id: int, end_date: date) -> pet_kindergarden_calendar_type:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def refresh_pet_kindergarden_calendar(self, pet_kindergarden_id: int) -> None:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def invalidate_pet_kindergarden_calendar(self, pet_kindergarden_id: int) -> None:
+        raise NotImplementedException()
+
     @abstractmethod
     def get_available_reservation_dates(
-        self, pet_kindergarden_id: int, customer: Customer, ticket_type: str, ticket_id: Optional[int]
+        self,
+        pet_kindergarden_id: int,
+        customer: Customer,
+        ticket_type: str,
+        ticket_id: Optional[int],
+        use_cache: bool = False,
+        check_capacity: bool = True,
     ) -> list[str]:
         raise NotImplementedException()
 
+    @abstractmethod
+    def get_available_reservation_dates_by_end_date(
+        self, pet_kindergarden: PetKindergarden, end_date: datetime
+    ) -> list[str]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_hotel_occupied_dates(
+        self, pet_kindergarden_id: int, customer_pet_ids: list[int], start_date: date, end_date: date
+    ) -> dict[int, set[date]]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_ticket_end_date(self, customer: Customer, ticket_type: str, ticket_id: Optional[int]) -> datetime:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_closed_ordinals(
+        self,
+        pet_kindergarden_id: int,
+        date_range: list[datetime],
+        daily_pet_limit: int,
+        day_off_rules: Optional[list[day_off_rule_type]] = None,
+    ) -> set[int]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def search_next_available_reservation_dates(
+        self,
+        pet_kindergarden_id: int,
+        customer: Customer,
+        ticket_type: str,
+        ticket_id: Optional[int],
+        count: int,
+    ) -> list[str]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_available_reservation_date_ranges(
+        self,
+        pet_kindergarden_id: int,
+        customer: Customer,
+        ticket_type: str,
+        ticket_id: Optional[int],
+        start_month: date,
+        end_month: date,
+    ) -> dict[str, Any]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_available_reservation_dates_for_customer_tickets(
+        self, pet_kindergarden_id: int, customer: Customer
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedException()
+
     @abstractmethod
     def register_reservation(
         self, customer: Customer, pet_kindergarden: PetKindergarden, reservation_data: dict
     ) -> dict:
         raise NotImplementedException()
+
+
+class AbstractDailyReservationService(ABC):
+
+    @abstractmethod
+    def is_sharded(self, pet_kindergarden_id: int) -> bool:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_shard(self, pet_kindergarden_id: int) -> int:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def increase_pet_counts(
+        self,
+        pet_kindergarden_id: int,
+        reserved_ats: list[datetime],
+        ticket_type: str,
+        daily_pet_limit: int = -1,
+    ) -> list[datetime]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def decrease_pet_counts(self, pet_kindergarden_id: int, reserved_ats: list[datetime], ticket_type: str) -> None:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_pet_kindergarden_ids_for_sharded(self) -> list[int]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def compact_pet_counts(self, pet_kindergarden_id: int) -> int:
+        raise NotImplementedException()
@@ -0,0 +1,443 @@
+import random
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from typing import Iterable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from mung_manager.reservations.services.abstracts import (
+    AbstractDailyReservationService,
+)
+from mung_manager_db.enum_types import TicketType
+from mung_manager_db.models import DailyReservation
+
+
+def get_capacity_lock_sql(pet_kindergarden_id_sql: str, reserved_date_sql: str) -> str:
+    """
+    이 함수는 반려동물 유치원의 하루 정원을 확인하고 증가시키는 동안 해당 날짜를 잠그는 SQL 표현식을 반환합니다.
+    트랜잭션 단위의 advisory lock이므로 트랜잭션이 끝나면 해제됩니다.
+    DB 예약 함수도 같은 표현식을 사용하여 파이썬 코드와 같은 잠금을 획득합니다.
+
+    Args:
+        pet_kindergarden_id_sql (str): 반려동물 유치원 아이디 SQL 표현식
+        reserved_date_sql (str): 날짜(date) SQL 표현식
+
+    Returns:
+        str: pg_advisory_xact_lock 호출 표현식
+    """
+    return f"pg_advisory_xact_lock(({pet_kindergarden_id_sql})::integer, ({reserved_date_sql}) - DATE '2000-01-01')"
+
+
+class DailyReservationService(AbstractDailyReservationService):
+    """
+    이 클래스는 일별 예약 현황(전체/티켓 타입별 반려동물 수)을 관리하는 비즈니스 로직을 담당합니다.
+    """
+
+    PET_COUNT_FIELD_BY_TICKET_TYPE = {
+        TicketType.TIME.value: "time_pet_count",
+        TicketType.ALL_DAY.value: "all_day_pet_count",
+        TicketType.HOTEL.value: "hotel_pet_count",
+    }
+    PET_COUNT_FIELD_NAMES = ["total_pet_count", "time_pet_count", "all_day_pet_count", "hotel_pet_count"]
+
+    def is_sharded(self, pet_kindergarden_id: int) -> bool:
+        """
+        이 함수는 반려동물 유치원의 일별 예약 현황을 여러 행(샤드)으로 나누어 관리하는지 확인합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            bool: 샤딩 여부
+        """
+        return (
+            settings.DAILY_RESERVATION_SHARDING_ENABLED
+            and pet_kindergarden_id in settings.DAILY_RESERVATION_SHARDED_PET_KINDERGARDEN_IDS
+        )
+
+    def get_shard(self, pet_kindergarden_id: int) -> int:
+        """
+        이 함수는 일별 예약 현황을 증가시킬 샤드 번호를 반환합니다. 샤딩되지 않은 유치원은 항상 0번 샤드를 사용합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            int: 샤드 번호
+        """
+        if not self.is_sharded(pet_kindergarden_id):
+            return 0
+
+        return random.randrange(settings.DAILY_RESERVATION_SHARD_COUNT)
+
+    def lock_reserved_dates(self, pet_kindergarden_id: int, reserved_dates: Iterable[date]) -> None:
+        """
+        이 함수는 반려동물 유치원의 주어진 날짜들을 날짜 순서대로 잠급니다.
+        같은 날짜의 정원 확인과 증가는 이 잠금 안에서만 이루어지므로 동시에 들어온 예약이 정원을 넘을 수 없습니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            reserved_dates (Iterable[date]): 잠글 날짜 목록
+
+        Returns:
+            None
+        """
+        reserved_dates = sorted(set(reserved_dates))
+        if not reserved_dates:
+            return
+
+        # 교착 상태를 피하기 위해 항상 날짜 순서대로 잠금
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT {get_capacity_lock_sql("%s", "reserved_date")}
+                FROM (SELECT unnest(%s::date[]) AS reserved_date ORDER BY 1) AS reserved_dates
+                """,
+                [pet_kindergarden_id, reserved_dates],
+            )
+
+    def get_total_pet_counts_by_date(self, pet_kindergarden_id: int, reserved_dates: Iterable[date]) -> dict[date, int]:
+        """
+        이 함수는 주어진 날짜별 전체 반려동물 수를 조회합니다.
+        시간권은 등원 일시별로, 종일권과 호텔권은 영업 시작 일시로, 샤딩된 유치원은 샤드별로 행이 나뉘므로 날짜 단위로 합산합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            reserved_dates (Iterable[date]): 조회할 날짜 목록
+
+        Returns:
+            dict[date, int]: 날짜별 전체 반려동물 수
+        """
+        return dict(
+            DailyReservation.objects.filter(
+                pet_kindergarden_id=pet_kindergarden_id,
+                reserved_at__date__in=set(reserved_dates),
+            )
+            .annotate(reserved_date=TruncDate("reserved_at"))
+            .values("reserved_date")
+            .annotate(pet_count=Sum("total_pet_count"))
+            .values_list("reserved_date", "pet_count")
+        )
+
+    def increase_pet_counts(
+        self,
+        pet_kindergarden_id: int,
+        reserved_ats: list[datetime],
+        ticket_type: str,
+        daily_pet_limit: int = -1,
+    ) -> list[datetime]:
+        """
+        이 함수는 주어진 날짜들의 전체 반려동물 수와 티켓 타입별 반려동물 수를 증가시킵니다.
+        일별 예약 현황이 없는 날짜는 새로 생성합니다.
+
+        하루 정원은 날짜 단위로 적용됩니다. 시간권은 등원 일시별로, 종일권과 호텔권은 영업 시작 일시로 행이 나뉘므로
+        정원이 주어지면 해당 날짜들을 잠근 뒤 날짜별 전체 반려동물 수(같은 날짜의 모든 행의 합)에 증가시킬 수를 더해
+        정원을 넘지 않는 날짜만 증가시키고, 정원이 초과되어 증가시키지 못한 일시를 반환합니다.
+        같은 날짜의 정원 확인과 증가는 잠금을 획득한 트랜잭션 하나에서만 진행되므로 동시에 들어온 예약이 정원을 넘을 수 없습니다.
+        일부 날짜가 실패하더라도 나머지 날짜는 증가하므로 호출하는 쪽에서 트랜잭션을 롤백해야 합니다.
+
+        샤딩되지 않은 유치원은 날짜를 잠근 뒤 (pet_kindergarden_id, reserved_at) 행을 수정하고 없으면 생성하므로 샤드 컬럼을 사용하지 않습니다.
+        샤딩된 유치원은 같은 날짜의 한 행에 잠금이 몰리지 않도록 임의의 샤드 행을 증가시키며
+        ((pet_kindergarden_id, reserved_at, shard) 유니크 제약 조건이 필요합니다), 정원이 없으면 날짜를 잠그지 않습니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            reserved_ats (list[datetime]): 일별 예약 일시 목록
+            ticket_type (str): 티켓 타입(시간, 종일, 호텔)
+            daily_pet_limit (int): 하루 정원(-1이면 제한 없음)
+
+        Returns:
+            list[datetime]: 정원이 초과되어 증가시키지 못한 일별 예약 일시 목록
+        """
+        if not reserved_ats:
+            return []
+
+        reserved_at_counts = Counter(reserved_ats)
+        sharded = self.is_sharded(pet_kindergarden_id)
+        if sharded and daily_pet_limit == -1:
+            self._upsert_sharded_pet_counts(pet_kindergarden_id, reserved_at_counts, ticket_type)
+            return []
+
+        failed_reserved_ats: list[datetime] = []
+        with transaction.atomic():
+            self.lock_reserved_dates(pet_kindergarden_id, {reserved_at.date() for reserved_at in reserved_at_counts})
+            if daily_pet_limit != -1:
+                failed_reserved_ats = self._exclude_fully_booked(
+                    pet_kindergarden_id, reserved_at_counts, daily_pet_limit
+                )
+            if not reserved_at_counts:
+                return failed_reserved_ats
+
+            if sharded:
+                self._upsert_sharded_pet_counts(pet_kindergarden_id, reserved_at_counts, ticket_type)
+            else:
+                self._increment_pet_counts(pet_kindergarden_id, reserved_at_counts, ticket_type)
+        return failed_reserved_ats
+
+    def _exclude_fully_booked(
+        self, pet_kindergarden_id: int, reserved_at_counts: Counter, daily_pet_limit: int
+    ) -> list[datetime]:
+        # 잠금을 획득한 날짜별 합계로 정원을 확인하고, 정원을 넘는 날짜의 일시는 증가 대상에서 제외
+        increments_by_date: Counter = Counter()
+        for reserved_at, count in reserved_at_counts.items():
+            increments_by_date[reserved_at.date()] += count
+        pet_counts = self.get_total_pet_counts_by_date(pet_kindergarden_id, increments_by_date)
+
+        failed_reserved_ats = [
+            reserved_at
+            for reserved_at in reserved_at_counts
+            if pet_counts.get(reserved_at.date(), 0) + increments_by_date[reserved_at.date()] > daily_pet_limit
+        ]
+        for reserved_at in failed_reserved_ats:
+            del reserved_at_counts[reserved_at]
+        return failed_reserved_ats
+
+    def _increment_pet_counts(self, pet_kindergarden_id: int, reserved_at_counts: Counter, ticket_type: str) -> None:
+        # 날짜 잠금 안에서만 호출되므로 수정할 행이 없는 일시만 새로 생성해도 중복 행이 생기지 않음
+        pet_count_field_name = self.PET_COUNT_FIELD_BY_TICKET_TYPE[ticket_type]
+        meta = DailyReservation._meta
+        qn = connection.ops.quote_name
+        table = qn(meta.db_table)
+        pk_column = qn(meta.pk.column)
+        pet_kindergarden_column = qn(meta.get_field("pet_kindergarden").column)
+        reserved_at_column = qn(meta.get_field("reserved_at").column)
+        updated_columns = [meta.get_field("total_pet_count").column, meta.get_field(pet_count_field_name).column]
+        update_clauses = [f"{qn(column)} = {table}.{qn(column)} + counts.pet_count" for column in updated_columns]
+        update_params: list = []
+        for field in meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                update_clauses.append(f"{qn(field.column)} = %s")
+                update_params.append(field.get_db_prep_save(timezone.now(), connection=connection))
+
+        # 샤딩을 해제한 유치원에 샤드 행이 남아있을 수 있으므로 일시별로 한 행만 증가
+        query = f"""
+            UPDATE {table}
+            SET {', '.join(update_clauses)}
+            FROM (VALUES {', '.join(['(%s::timestamp, %s::integer)'] * len(reserved_at_counts))})
+                AS counts(reserved_at, pet_count)
+            WHERE {table}.{pk_column} = (
+                SELECT daily_reservation.{pk_column}
+                FROM {table} daily_reservation
+                WHERE daily_reservation.{pet_kindergarden_column} = %s
+                    AND daily_reservation.{reserved_at_column} = counts.reserved_at
+                ORDER BY daily_reservation.{pk_column}
+                LIMIT 1
+            )
+            RETURNING {table}.{reserved_at_column}
+        """
+        params = [
+            *update_params,
+            *[value for reserved_at, count in reserved_at_counts.items() for value in (reserved_at, count)],
+            pet_kindergarden_id,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            updated_reserved_ats = {row[0] for row in cursor.fetchall()}
+
+        DailyReservation.objects.bulk_create(
+            [
+                DailyReservation(
+                    pet_kindergarden_id=pet_kindergarden_id,
+                    reserved_at=reserved_at,
+                    total_pet_count=count,
+                    **{pet_count_field_name: count},
+                )
+                for reserved_at, count in reserved_at_counts.items()
+                if reserved_at not in updated_reserved_ats
+            ]
+        )
+
+    def _upsert_sharded_pet_counts(
+        self, pet_kindergarden_id: int, reserved_at_counts: Counter, ticket_type: str
+    ) -> None:
+        pet_count_field_name = self.PET_COUNT_FIELD_BY_TICKET_TYPE[ticket_type]
+        meta = DailyReservation._meta
+        fields = [field for field in meta.concrete_fields if not field.primary_key]
+
+        # 같은 날짜가 여러 번 전달되면 한 행으로 합쳐서 증가(ON CONFLICT는 한 행을 두 번 수정할 수 없음)
+        rows = []
+        for reserved_at, count in reserved_at_counts.items():
+            daily_reservation = DailyReservation(
+                pet_kindergarden_id=pet_kindergarden_id,
+                reserved_at=reserved_at,
+                shard=self.get_shard(pet_kindergarden_id),
+                total_pet_count=count,
+                **{pet_count_field_name: count},
+            )
+            rows.append(
+                [
+                    field.get_db_prep_save(field.pre_save(daily_reservation, add=True), connection=connection)
+                    for field in fields
+                ]
+            )
+
+        qn = connection.ops.quote_name
+        table = qn(meta.db_table)
+        updated_columns = [meta.get_field("total_pet_count").column, meta.get_field(pet_count_field_name).column]
+        update_clauses = [f"{qn(column)} = {table}.{qn(column)} + EXCLUDED.{qn(column)}" for column in updated_columns]
+        update_clauses.extend(
+            f"{qn(field.column)} = EXCLUDED.{qn(field.column)}" for field in fields if getattr(field, "auto_now", False)
+        )
+        conflict_columns = [
+            qn(meta.get_field(field_name).column) for field_name in ["pet_kindergarden", "reserved_at", "shard"]
+        ]
+        row_placeholder = f"({', '.join(['%s'] * len(fields))})"
+        query = f"""
+            INSERT INTO {table} ({', '.join(qn(field.column) for field in fields)})
+            VALUES {', '.join([row_placeholder] * len(rows))}
+            ON CONFLICT ({', '.join(conflict_columns)})
+            DO UPDATE SET {', '.join(update_clauses)}
+        """
+        params = [value for row in rows for value in row]
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+
+    def decrease_pet_counts(self, pet_kindergarden_id: int, reserved_ats: list[datetime], ticket_type: str) -> None:
+        """
+        이 함수는 주어진 날짜들의 전체 반려동물 수와 티켓 타입별 반려동물 수를 한 번의 쿼리로 감소시킵니다.
+        같은 날짜가 여러 번 주어지면 주어진 횟수만큼 감소시킵니다.
+        시간권은 등원 일시가 같은 행을, 종일권과 호텔권은 날짜가 같은 행을 감소시키므로
+        예약 이후 영업 시작 시간이 변경되어도 예약 시 증가시킨 행을 감소시킵니다.
+        샤딩된 날짜는 해당 티켓 타입의 반려동물 수가 많은 샤드 행부터 남아있는 수만큼 나누어 감소시킵니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            reserved_ats (list[datetime]): 일별 예약 일시 목록(중복 가능)
+            ticket_type (str): 티켓 타입(시간, 종일, 호텔)
+
+        Returns:
+            None
+        """
+        if not reserved_ats:
+            return
+
+        pet_count_field_name = self.PET_COUNT_FIELD_BY_TICKET_TYPE[ticket_type]
+        meta = DailyReservation._meta
+        qn = connection.ops.quote_name
+        table = qn(meta.db_table)
+        pk_column = qn(meta.pk.column)
+        reserved_at_column = qn(meta.get_field("reserved_at").column)
+        total_pet_count_column = qn(meta.get_field("total_pet_count").column)
+        pet_count_column = qn(meta.get_field(pet_count_field_name).column)
+
+        if ticket_type == TicketType.TIME.value:
+            pet_counts = Counter(reserved_ats)
+            key_type = "timestamp"
+            key_condition = f"daily_reservation.{reserved_at_column} = counts.reserved_key"
+        else:
+            pet_counts = Counter(reserved_at.date() for reserved_at in reserved_ats)
+            key_type = "date"
+            key_condition = (
+                f"daily_reservation.{reserved_at_column} >= counts.reserved_key "
+                f"AND daily_reservation.{reserved_at_column} < counts.reserved_key + 1"
+            )
+
+        # 키별로 반려동물 수가 많은 행부터 누적하여, 각 행이 감소시킬 수(행에 남은 수 이하)를 계산
+        query = f"""
+            UPDATE {table}
+            SET {total_pet_count_column} = GREATEST({table}.{total_pet_count_column} - decrements.pet_count, 0),
+                {pet_count_column} = {table}.{pet_count_column} - decrements.pet_count
+            FROM (
+                SELECT
+                    daily_reservation.{pk_column} AS id,
+                    LEAST(
+                        daily_reservation.{pet_count_column},
+                        GREATEST(
+                            counts.pet_count
+                            - (SUM(daily_reservation.{pet_count_column}) OVER previous_rows
+                            - daily_reservation.{pet_count_column}),
+                            0
+                        )
+                    ) AS pet_count
+                FROM {table} daily_reservation
+                INNER JOIN (VALUES {', '.join([f'(%s::{key_type}, %s::integer)'] * len(pet_counts))})
+                    AS counts(reserved_key, pet_count)
+                    ON {key_condition}
+                WHERE daily_reservation.{qn(meta.get_field("pet_kindergarden").column)} = %s
+                    AND daily_reservation.{pet_count_column} > 0
+                WINDOW previous_rows AS (
+                    PARTITION BY counts.reserved_key
+                    ORDER BY daily_reservation.{pet_count_column} DESC, daily_reservation.{pk_column}
+                    ROWS UNBOUNDED PRECEDING
+                )
+            ) AS decrements
+            WHERE {table}.{pk_column} = decrements.id AND decrements.pet_count > 0
+        """
+        params = [
+            *[value for reserved_key, count in pet_counts.items() for value in (reserved_key, count)],
+            pet_kindergarden_id,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+
+    def get_pet_kindergarden_ids_for_sharded(self) -> list[int]:
+        """
+        이 함수는 샤드 행이 남아있는 반려동물 유치원 아이디 목록을 조회합니다.
+        샤딩을 해제한 유치원에 남은 샤드 행도 압축할 수 있도록 설정이 아닌 DB를 기준으로 조회하되,
+        샤딩이 설정되지 않은 배포(DAILY_RESERVATION_SHARDING_ENABLED)에서는 샤드 컬럼을 조회하지 않습니다.
+
+        Returns:
+            list[int]: 반려동물 유치원 아이디 목록
+        """
+        if not settings.DAILY_RESERVATION_SHARDING_ENABLED:
+            return []
+
+        return list(
+            DailyReservation.objects.filter(shard__gt=0)
+            .order_by("pet_kindergarden_id")
+            .values_list("pet_kindergarden_id", flat=True)
+            .distinct()
+        )
+
+    @transaction.atomic
+    def compact_pet_counts(self, pet_kindergarden_id: int) -> int:
+        """
+        이 함수는 샤드 행으로 나뉜 일별 예약 현황을 날짜별로 하나의 행(0번 샤드)으로 합칩니다.
+        합치는 동안 해당 날짜와 행들을 잠그므로 동시에 증가/감소하는 예약은 압축이 끝날 때까지 대기합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            int: 압축한 날짜 수
+        """
+        reserved_ats = list(
+            DailyReservation.objects.filter(pet_kindergarden_id=pet_kindergarden_id, shard__gt=0)
+            .values_list("reserved_at", flat=True)
+            .distinct()
+        )
+        # 예약과 같은 순서(날짜 잠금 -> 행 잠금)로 잠가 압축 중에 행이 새로 생성되지 않도록 함
+        self.lock_reserved_dates(pet_kindergarden_id, {reserved_at.date() for reserved_at in reserved_ats})
+        daily_reservations = (
+            DailyReservation.objects.select_for_update()
+            .filter(pet_kindergarden_id=pet_kindergarden_id, reserved_at__in=reserved_ats)
+            .order_by("reserved_at", "shard")
+        )
+
+        daily_reservations_by_reserved_at = defaultdict(list)
+        for daily_reservation in daily_reservations:
+            daily_reservations_by_reserved_at[daily_reservation.reserved_at].append(daily_reservation)
+
+        # 샤드 번호가 가장 작은 행에 나머지 행을 합치고 0번 샤드로 변경(0번 샤드가 있으면 그 행이 남음)
+        merged_daily_reservations = []
+        merged_daily_reservation_ids = []
+        for daily_reservation, *shards in daily_reservations_by_reserved_at.values():
+            for shard in shards:
+                for field_name in self.PET_COUNT_FIELD_NAMES:
+                    setattr(
+                        daily_reservation,
+                        field_name,
+                        getattr(daily_reservation, field_name) + getattr(shard, field_name),
+                    )
+                merged_daily_reservation_ids.append(shard.id)
+            daily_reservation.shard = 0
+            merged_daily_reservations.append(daily_reservation)
+
+        DailyReservation.objects.filter(id__in=merged_daily_reservation_ids).delete()
+        DailyReservation.objects.bulk_update(merged_daily_reservations, fields=self.PET_COUNT_FIELD_NAMES + ["shard"])
+
+        return len(merged_daily_reservations)
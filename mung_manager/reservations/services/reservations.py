@@ -1,12 +1,13 @@
-from collections import defaultdict
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from datetime import date, datetime, time, timedelta
-from typing import Optional
+from itertools import groupby
+from typing import Any, Optional
 
-from concurrency.exceptions import RecordModifiedError
-from django.db import transaction
-from django.db.models import F, QuerySet
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Case, F, When
 from django.utils import timezone
-from django_stubs_ext import ValuesQuerySet
 
 from mung_manager.customers.selectors.customer_pets import CustomerPetSelector
 from mung_manager.customers.selectors.customer_ticket_usage_logs import (
@@ -16,19 +17,34 @@ from mung_manager.customers.selectors.customer_tickets import CustomerTicketSele
 from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
     PetKindergardenSelector,
 )
+from mung_manager.reservations.caches import PetKindergardenCalendarCache
+from mung_manager.reservations.day_off_rules import DayOffRuleEngine
+from mung_manager.reservations.optimistic_locks import (
+    run_with_customer_ticket_lock_retry,
+)
 from mung_manager.reservations.selectors.daily_reservations import (
     DailyReservationSelector,
 )
 from mung_manager.reservations.selectors.days_off import DayOffSelector
 from mung_manager.reservations.selectors.reservations import ReservationSelector
 from mung_manager.reservations.services.abstracts import AbstractReservationService
+from mung_manager.reservations.services.daily_reservations import (
+    DailyReservationService,
+)
 from mung_manager.reservations.services.strategies.abstract_strategy import (
     AbstractReservationStrategy,
 )
 from mung_manager.reservations.services.strategies.strategy_factory import (
     ReservationStrategyFactory,
 )
-from mung_manager.reservations.tasks import send_alimtalk_on_ticket_low
+from mung_manager.reservations.tasks import (
+    refresh_pet_kindergarden_calendar_cache,
+    send_alimtalk_on_ticket_low,
+)
+from mung_manager.reservations.types import (
+    day_off_rule_type,
+    pet_kindergarden_calendar_type,
+)
 from mung_manager_commons.constants import SYSTEM_CODE
 from mung_manager_commons.errors import ValidationException
 from mung_manager_commons.selector import get_object_or_not_found
@@ -40,8 +56,8 @@ from mung_manager_db.enum_types import (
 )
 from mung_manager_db.models import (
     Customer,
-    DailyReservation,
-    DayOff,
+    CustomerTicket,
+    CustomerTicketUsageLog,
     PetKindergarden,
     Reservation,
 )
@@ -52,6 +68,9 @@ class ReservationService(AbstractReservationService):
     이 클래스는 예약과 관련된 비즈니스 로직을 담당합니다.
     """
 
+    # 가장 가까운 예약 가능한 날짜를 검색할 때 한 번에 조회하는 날짜 수
+    NEXT_AVAILABLE_DATES_SCAN_DAYS = 31
+
     def __init__(
         self,
         reservation_selector: ReservationSelector,
@@ -62,6 +81,8 @@ class ReservationService(AbstractReservationService):
         pet_kindergarden_selector: PetKindergardenSelector,
         customer_pet_selector: CustomerPetSelector,
         strategy_factory: ReservationStrategyFactory,
+        pet_kindergarden_calendar_cache: PetKindergardenCalendarCache,
+        daily_reservation_service: DailyReservationService,
     ):
         self._reservation_selector = reservation_selector
         self._daily_reservation_selector = daily_reservation_selector
@@ -71,11 +92,15 @@ class ReservationService(AbstractReservationService):
         self._pet_kindergarden_selector = pet_kindergarden_selector
         self._customer_pet_selector = customer_pet_selector
         self._strategy_factory = strategy_factory
+        self._pet_kindergarden_calendar_cache = pet_kindergarden_calendar_cache
+        self._daily_reservation_service = daily_reservation_service
 
     @staticmethod
-    def validate_reservation_cancellation(pet_kindergarden: PetKindergarden, reservation: Reservation) -> None:
+    def get_reservation_cancellation_error(
+        pet_kindergarden: PetKindergarden, reservation: Reservation
+    ) -> Optional[str]:
         """
-        이 함수는 다음 사항을 검증합니다.
+        이 함수는 다음 사항을 검사하여 예약을 취소할 수 없는 경우 에러 코드를 반환합니다.
         - 연박 중간의 예약인지
         - 당일 취소 불가능 옵션이면서 취소하려는 예약 날짜가 오늘일 때
 
@@ -84,21 +109,36 @@ class ReservationService(AbstractReservationService):
             reservation (Reservation): 예약 객체
 
         Returns:
-            None
+            Optional[str]: 취소할 수 없으면 에러 코드, 취소할 수 있으면 None
         """
         if reservation.is_extented:
             if reservation.depth != 0:
-                raise ValidationException(
-                    detail=SYSTEM_CODE.message("CANNOT_CANCEL_RESERVATION"),
-                    code=SYSTEM_CODE.code("CANNOT_CANCEL_RESERVATION"),
-                )
+                return "CANNOT_CANCEL_RESERVATION"
 
         if pet_kindergarden.reservation_change_option == ReservationChangeOption.SAME_DAY_UNCHANGE.value:
             if reservation.reserved_at.date() == timezone.now().date():
-                raise ValidationException(
-                    detail=SYSTEM_CODE.message("CANNOT_CANCEL_RESERVATION"),
-                    code=SYSTEM_CODE.code("CANNOT_CANCEL_RESERVATION"),
-                )
+                return "CANNOT_CANCEL_RESERVATION"
+
+        return None
+
+    @classmethod
+    def validate_reservation_cancellation(cls, pet_kindergarden: PetKindergarden, reservation: Reservation) -> None:
+        """
+        이 함수는 예약을 취소할 수 있는지 검증합니다.
+
+        Args:
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation (Reservation): 예약 객체
+
+        Returns:
+            None
+        """
+        error = cls.get_reservation_cancellation_error(pet_kindergarden, reservation)
+        if error is not None:
+            raise ValidationException(
+                detail=SYSTEM_CODE.message(error),
+                code=SYSTEM_CODE.code(error),
+            )
 
     @transaction.atomic
     def cancel_reservation(self, pet_kindergarden: PetKindergarden, reservation_id: int) -> None:
@@ -118,107 +158,287 @@ class ReservationService(AbstractReservationService):
             code=SYSTEM_CODE.code("NOT_FOUND_RESERVATION"),
         )
         self.validate_reservation_cancellation(pet_kindergarden, reservation)
+        self.apply_reservation_cancellations(pet_kindergarden, [reservation])
 
-        reservations = self.update_reservation_status_to_canceled(reservation)
-        used_count_dict = self.update_ticket_usage_logs(reservations)
-        self.update_daily_reservations(used_count_dict)
-        self.restore_ticket_counts(used_count_dict)
+    @transaction.atomic
+    def cancel_reservations(
+        self, customer: Customer, pet_kindergarden: PetKindergarden, reservation_ids: list[int]
+    ) -> list[dict[str, Any]]:
+        """
+        이 함수는 여러 예약을 한 번에 검증하고, 취소할 수 있는 예약만 하나의 트랜잭션에서 취소합니다.
+        취소할 수 없는 예약이 있어도 나머지 예약은 취소하며, 예약 아이디별 처리 결과를 반환합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation_ids (list[int]): 예약 아이디 리스트
 
-    def update_reservation_status_to_canceled(self, reservation: Reservation) -> QuerySet[Reservation]:
+        Returns:
+            list[dict[str, Any]]: 요청한 순서대로 정렬된 예약 아이디별 취소 결과
         """
-        이 함수는 reservation 객체를 사용하여 단일 예약 또는 묶여있는 예약의 상태를 "취소"로 변경합니다.
+        reservation_ids = list(dict.fromkeys(reservation_ids))
+        reservations = {
+            reservation.id: reservation
+            for reservation in self._reservation_selector.get_queryset_for_uncanceled_reservations_by_ids(
+                customer, pet_kindergarden, reservation_ids
+            )
+        }
+
+        results = []
+        cancelable_reservations = []
+        for reservation_id in reservation_ids:
+            reservation = reservations.get(reservation_id)
+            if reservation is None:
+                error: Optional[str] = "NOT_FOUND_RESERVATION"
+            else:
+                error = self.get_reservation_cancellation_error(pet_kindergarden, reservation)
+
+            if error is None:
+                cancelable_reservations.append(reservation)
+            results.append(
+                {
+                    "reservation_id": reservation_id,
+                    "is_canceled": error is None,
+                    "code": SYSTEM_CODE.code(error) if error is not None else None,
+                    "message": SYSTEM_CODE.message(error) if error is not None else None,
+                }
+            )
+
+        if cancelable_reservations:
+            self.apply_reservation_cancellations(pet_kindergarden, cancelable_reservations)
+        return results
+
+    def apply_reservation_cancellations(
+        self, pet_kindergarden: PetKindergarden, reservations: list[Reservation]
+    ) -> None:
+        """
+        이 함수는 검증이 끝난 예약들을 취소하고 일별 예약 현황과 티켓 횟수를 복원합니다.
+        예약 수, 예약 기간, 사용한 티켓 수와 관계없이 정해진 개수의 쿼리로 처리합니다.
 
         Args:
-            reservation (Reservation): 예약 객체
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservations (list[Reservation]): 예약 객체 리스트
 
         Returns:
-            QuerySet[Reservation]: 예약 쿼리셋 반환
-        """
-        reservation_ids = [reservation.id]
-        if reservation.customer_ticket.ticket.ticket_type == TicketType.HOTEL.value and reservation.is_extented:
-            root_id = reservation.id
-            child_ids = self._reservation_selector.get_child_ids_by_parent_id(parent_id=root_id)
-            reservation_ids.extend(map(lambda x: x[0], child_ids))
-        reservations = self._reservation_selector.get_queryset_with_customer_ticket_and_ticket_by_ids(
-            reservation_ids=reservation_ids
-        )
-        reservations.update(reservation_status=ReservationStatus.CANCELED.value)
-        return reservations
+            None
+        """
+        reservation_ids = self.update_reservation_status_to_canceled(reservations)
+        used_counts = self.update_ticket_usage_logs(reservation_ids)
+        self.update_daily_reservations(pet_kindergarden.id, reservations)
+        self.restore_ticket_counts(used_counts)
+        self.invalidate_pet_kindergarden_calendar(pet_kindergarden.id)
 
-    def update_ticket_usage_logs(self, reservations: QuerySet[Reservation]) -> dict[Reservation, int]:
+    def update_reservation_status_to_canceled(self, reservations: list[Reservation]) -> list[int]:
         """
-        이 함수는 전달 받은 예약 쿼리셋에 속하는 예약들의 사용 로그를 수정합니다.
+        이 함수는 예약들과 각 예약에 묶여있는 예약의 상태를 "취소"로 변경합니다.
 
         Args:
-            reservations (QuerySet[Reservation]): 예약 쿼리셋
+            reservations (list[Reservation]): 예약 객체 리스트
 
         Returns:
-            dict[Reservation, int]: 각 예약별 사용된 티켓 수
+            list[int]: 취소한 예약 아이디 리스트 반환
         """
-        reservation_ids = list(reservations.values_list("id", flat=True))
-        customer_ticket_usage_logs = self._customer_ticket_usage_log_selector.get_queryset_by_reservation_ids(
-            reservation_ids=reservation_ids,
+        reservation_ids = [reservation.id for reservation in reservations]
+        # 연박 호텔 예약은 대표 예약 아이디(root_id)로 묶여있는 예약을 함께 취소
+        root_ids = [reservation.root_id for reservation in reservations if reservation.root_id is not None]
+        reservation_ids.extend(self._reservation_selector.get_ids_by_root_ids(root_ids=root_ids))
+        # 대표 예약 아이디가 채워지기 전에 생성된 연박 예약은 부모 관계를 따라 함께 취소
+        reservation_ids.extend(
+            self._reservation_selector.get_child_ids_by_parent_ids(
+                parent_ids=[
+                    reservation.id
+                    for reservation in reservations
+                    if reservation.root_id is None and reservation.is_extented
+                ]
+            )
         )
 
-        used_count_dict = defaultdict(int)
-        for log in customer_ticket_usage_logs:
-            used_count_dict[log.reservation] = log.used_count
+        # 상태 변경과 취소된 예약 아이디 조회를 하나의 쿼리로 처리(UPDATE ... RETURNING)
+        meta = Reservation._meta
+        qn = connection.ops.quote_name
+        pk_column = qn(meta.pk.column)
+        reservation_status_column = qn(meta.get_field("reservation_status").column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {qn(meta.db_table)}
+                SET {reservation_status_column} = %s
+                WHERE {pk_column} = ANY(%s) AND {reservation_status_column} <> %s
+                RETURNING {pk_column}
+                """,
+                [ReservationStatus.CANCELED.value, reservation_ids, ReservationStatus.CANCELED.value],
+            )
+            return [row[0] for row in cursor.fetchall()]
 
-        customer_ticket_usage_logs.update(used_count=0)
+    def update_ticket_usage_logs(self, reservation_ids: list[int]) -> dict[int, int]:
+        """
+        이 함수는 취소한 예약들의 티켓 사용 로그의 사용 횟수를 0으로 변경하고, 변경 전 사용 횟수를 고객 티켓별로 합산합니다.
 
-        return used_count_dict
+        Args:
+            reservation_ids (list[int]): 예약 아이디 리스트
 
-    def update_daily_reservations(self, used_count_dict: dict[Reservation, int]) -> None:
+        Returns:
+            dict[int, int]: 고객 티켓 아이디별 사용된 티켓 수
         """
-        이 함수는 전달 받은 예약 쿼리셋을 통해 일별 예약 현황을 수정합니다.
+        if not reservation_ids:
+            return {}
+
+        # 변경 전 사용 횟수를 반환하기 위해 잠근 행의 이전 값을 함께 조회(UPDATE ... FROM ... RETURNING)
+        meta = CustomerTicketUsageLog._meta
+        qn = connection.ops.quote_name
+        table = qn(meta.db_table)
+        pk_column = qn(meta.pk.column)
+        used_count_column = qn(meta.get_field("used_count").column)
+        customer_ticket_column = qn(meta.get_field("customer_ticket").column)
+        reservation_column = qn(meta.get_field("reservation").column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table}
+                SET {used_count_column} = 0
+                FROM (
+                    SELECT {pk_column}, {used_count_column}
+                    FROM {table}
+                    WHERE {reservation_column} = ANY(%s)
+                    FOR UPDATE
+                ) AS previous
+                WHERE {table}.{pk_column} = previous.{pk_column}
+                RETURNING {table}.{customer_ticket_column}, previous.{used_count_column}
+                """,
+                [reservation_ids],
+            )
+            rows = cursor.fetchall()
+
+        used_counts: dict[int, int] = defaultdict(int)
+        for customer_ticket_id, used_count in rows:
+            used_counts[customer_ticket_id] += used_count
+
+        return used_counts
+
+    @staticmethod
+    def get_hotel_stay_dates(reserved_at: datetime, end_at: datetime) -> set[date]:
+        """
+        이 함수는 호텔 예약이 일별 예약 현황을 차지하는 날짜(등원일부터 하원일까지)를 반환합니다.
 
         Args:
-            used_count_dict (dict[Reservation, int]): 각 예약별 사용된 티켓 수
+            reserved_at (datetime): 등원 일시
+            end_at (datetime): 하원 일시
 
         Returns:
-            None
+            set[date]: 숙박 날짜와 하원 날짜 집합
+        """
+        return {date.fromordinal(ordinal) for ordinal in range(reserved_at.toordinal(), end_at.toordinal() + 1)}
+
+    def get_hotel_occupied_dates(
+        self, pet_kindergarden_id: int, customer_pet_ids: list[int], start_date: date, end_date: date
+    ) -> dict[int, set[date]]:
+        """
+        이 함수는 반려동물별로 취소되지 않은 호텔 예약이 일별 예약 현황을 차지하고 있는 날짜를 조회합니다.
+        같은 반려동물의 호텔 예약이 겹치는 날짜(연속된 예약의 하원일과 등원일)는 일별 예약 현황에 한 번만 반영되므로,
+        예약과 취소 모두 이 날짜를 제외하여 증가/감소시킵니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            customer_pet_ids (list[int]): 고객 반려동물 아이디 리스트
+            start_date (date): 조회 시작 날짜
+            end_date (date): 조회 종료 날짜
+
+        Returns:
+            dict[int, set[date]]: 고객 반려동물 아이디별 차지하고 있는 날짜 집합
         """
-        reservation: Reservation = next(iter(used_count_dict))
-        reserved_at = reservation.reserved_at
-        end_at = reservation.end_at
-        daily_reservations = self._daily_reservation_selector.get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-            pet_kindergarden_id=reservation.pet_kindergarden.id,
-            reserved_at=reserved_at,
-            end_at=end_at,
+        stay_periods = self._reservation_selector.get_hotel_stay_periods_by_customer_pet_ids(
+            pet_kindergarden_id=pet_kindergarden_id,
+            customer_pet_ids=customer_pet_ids,
+            start_at=datetime.combine(start_date, time.min),
+            end_at=datetime.combine(end_date, time.max),
         )
-        if reservation.customer_ticket.ticket.ticket_type == TicketType.HOTEL.value:
-            daily_reservations.update(
-                total_pet_count=F("total_pet_count") - 1, hotel_pet_count=F("hotel_pet_count") - 1
+        occupied_dates: dict[int, set[date]] = defaultdict(set)
+        for customer_pet_id, reserved_at, end_at in stay_periods:
+            occupied_dates[customer_pet_id].update(self.get_hotel_stay_dates(reserved_at, end_at))
+        return occupied_dates
+
+    def update_daily_reservations(self, pet_kindergarden_id: int, reservations: list[Reservation]) -> None:
+        """
+        이 함수는 취소한 예약들의 일별 예약 현황을 티켓 타입별로 묶어 감소시킵니다.
+        예약 생성 시 증가시킨 날짜와 같은 날짜만 감소시키기 위해,
+        호텔 예약은 같은 반려동물의 남아있는 호텔 예약이 차지하는 날짜를 제외합니다.
+        상태를 "취소"로 변경한 뒤에 호출해야 합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            reservations (list[Reservation]): 예약 객체 리스트(연박 예약은 대표 예약만)
+
+        Returns:
+            None
+        """
+        reserved_at_counts_by_ticket_type: dict[str, Counter] = defaultdict(Counter)
+        canceled_hotel_dates: dict[int, set[date]] = defaultdict(set)
+        for reservation in reservations:
+            ticket_type = reservation.customer_ticket.ticket.ticket_type
+            if ticket_type == TicketType.HOTEL.value:
+                canceled_hotel_dates[reservation.customer_pet_id].update(
+                    self.get_hotel_stay_dates(reservation.reserved_at, reservation.end_at)  # type: ignore
+                )
+            else:
+                reserved_at_counts_by_ticket_type[ticket_type][reservation.reserved_at] += 1
+
+        if canceled_hotel_dates:
+            occupied_dates = self.get_hotel_occupied_dates(
+                pet_kindergarden_id=pet_kindergarden_id,
+                customer_pet_ids=list(canceled_hotel_dates),
+                start_date=min(min(dates) for dates in canceled_hotel_dates.values()),
+                end_date=max(max(dates) for dates in canceled_hotel_dates.values()),
             )
-        if reservation.customer_ticket.ticket.ticket_type == TicketType.TIME.value:
-            daily_reservations.update(total_pet_count=F("total_pet_count") - 1, time_pet_count=F("time_pet_count") - 1)
-        if reservation.customer_ticket.ticket.ticket_type == TicketType.ALL_DAY.value:
-            daily_reservations.update(
-                total_pet_count=F("total_pet_count") - 1, all_day_pet_count=F("all_day_pet_count") - 1
+            for customer_pet_id, dates in canceled_hotel_dates.items():
+                reserved_at_counts_by_ticket_type[TicketType.HOTEL.value].update(
+                    datetime.combine(released_date, time.min)
+                    for released_date in dates - occupied_dates.get(customer_pet_id, set())
+                )
+
+        # 티켓 타입별로 같은 날짜의 취소 수만큼 한 번의 쿼리로 감소
+        for ticket_type, reserved_at_counts in reserved_at_counts_by_ticket_type.items():
+            self._daily_reservation_service.decrease_pet_counts(
+                pet_kindergarden_id=pet_kindergarden_id,
+                reserved_ats=list(reserved_at_counts.elements()),
+                ticket_type=ticket_type,
             )
 
-    def restore_ticket_counts(self, used_count_dict: dict[Reservation, int]) -> None:
+    def restore_ticket_counts(self, used_counts: dict[int, int]) -> None:
         """
-        이 함수는 만료 기간이 남은 이용권의 횟수를 복원합니다.
+        이 함수는 만료 기간이 남은 이용권의 횟수를 한 번의 쿼리로 복원합니다.
+        버전을 함께 증가시켜 같은 티켓을 낙관적 락으로 저장하려는 요청이 충돌을 감지하도록 합니다.
 
         Args:
-            used_count_dict (dict[Reservation, int]): 각 예약별 사용된 티켓 수
+            used_counts (dict[int, int]): 고객 티켓 아이디별 사용된 티켓 수
 
         Returns:
             None
         """
-        for reservation in used_count_dict:
-            if reservation.customer_ticket.expired_at.date() >= timezone.now().date():
-                try:
-                    customer_ticket = reservation.customer_ticket
-                    customer_ticket.used_count -= used_count_dict[reservation]
-                    customer_ticket.unused_count += used_count_dict[reservation]
-                    customer_ticket.save(update_fields=["used_count", "unused_count", "version"])
-                except RecordModifiedError:
-                    raise ValidationException(
-                        detail=SYSTEM_CODE.message("CONFILCT_CUSTOMER_TICKET"),
-                        code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
-                    )
+        used_counts = {customer_ticket_id: count for customer_ticket_id, count in used_counts.items() if count}
+        if not used_counts:
+            return
+
+        CustomerTicket.objects.filter(
+            id__in=list(used_counts),
+            expired_at__gte=datetime.combine(timezone.now().date(), time.min),
+        ).update(
+            used_count=Case(
+                *[
+                    When(id=customer_ticket_id, then=F("used_count") - count)
+                    for customer_ticket_id, count in used_counts.items()
+                ],
+                default=F("used_count"),
+            ),
+            unused_count=Case(
+                *[
+                    When(id=customer_ticket_id, then=F("unused_count") + count)
+                    for customer_ticket_id, count in used_counts.items()
+                ],
+                default=F("unused_count"),
+            ),
+            version=F("version") + 1,
+            updated_at=timezone.now(),
+        )
 
     def get_associated_reservation_ids_by_reservation_id(self, reservation_id: int) -> list[int]:
         """
@@ -230,76 +450,273 @@ class ReservationService(AbstractReservationService):
         Returns:
             list[int]: 예약 아이디 리스트 반환
         """
-        get_object_or_not_found(
+        reservation = get_object_or_not_found(
             self._reservation_selector.get_by_id_for_uncanceled_reservation(reservation_id=reservation_id),
             msg=SYSTEM_CODE.message("NOT_FOUND_RESERVATION"),
             code=SYSTEM_CODE.code("NOT_FOUND_RESERVATION"),
         )
+        if reservation.root_id is None:
+            if not reservation.is_extented:
+                return [reservation_id]
+
+            # 대표 예약 아이디가 채워지기 전에 생성된 연박 예약은 부모 관계를 따라 이후에 이어지는 예약을 반환
+            return [
+                reservation_id,
+                *self._reservation_selector.get_child_ids_by_parent_ids(parent_ids=[reservation_id]),
+            ]
+
+        # 연박 예약은 해당 예약과 이후에 이어지는 예약을 반환
+        return self._reservation_selector.get_ids_by_root_ids(
+            root_ids=[reservation.root_id], min_depth=reservation.depth
+        )
+
+    @staticmethod
+    def get_available_ordinals(start_date: datetime, end_date: datetime, closed_ordinals: set[int]) -> list[int]:
+        """
+        예약할 수 없는 날짜의 서수(ordinal) 집합으로 기간 내 예약 가능한 날짜의 서수 목록을 추출합니다.
 
-        reservation_ids = [reservation_id]
-        child_ids = self._reservation_selector.get_child_ids_by_parent_id(parent_id=reservation_id)
-        reservation_ids.extend(map(lambda x: x[0], child_ids))
-        return reservation_ids
+        Args:
+            start_date (datetime): 시작 날짜
+            end_date (datetime): 종료 날짜
+            closed_ordinals (set[int]): 휴무일과 정원이 초과된 날짜의 서수 집합
+
+        Returns:
+            list[int]: 오름차순으로 정렬된 예약 가능한 날짜의 서수 목록
+        """
+        start_ordinal = start_date.toordinal()
+        end_ordinal = start_ordinal + (end_date - start_date).days
+        return [ordinal for ordinal in range(start_ordinal, end_ordinal + 1) if ordinal not in closed_ordinals]
 
     def filter_available_reservation_dates(
         self,
         start_date: datetime,
         end_date: datetime,
-        day_off_dates_queryset: ValuesQuerySet[DayOff, date],
-        fully_booked_dates_queryset: ValuesQuerySet[DailyReservation, date] | None,
+        closed_ordinals: set[int],
     ) -> list[str]:
         """
-        휴무일 날짜 범위와 반려동물 유치원 아이디로 티켓별 예약 가능한 날짜 목록을 조회합니다.
+        예약할 수 없는 날짜의 서수(ordinal) 집합으로 기간 내 예약 가능한 날짜 목록을 추출합니다.
 
         Args:
-            start_date (str): 시작 날짜
-            end_date (str): 종료 날짜
-            day_off_dates_queryset (ValuesQuerySet[DayOff, date]): 휴무일 쿼리셋
-            fully_booked_dates_queryset (ValuesQuerySet[DailyReservation, date] | None): 정원을 초과한 날짜 쿼리셋
+            start_date (datetime): 시작 날짜
+            end_date (datetime): 종료 날짜
+            closed_ordinals (set[int]): 휴무일과 정원이 초과된 날짜의 서수 집합
 
         Returns:
-            list[str]: 티켓 정보와 예약 가능한 날짜 목록
+            list[str]: 예약 가능한 날짜 목록
         """
-        day_off_dates = [day_off.strftime("%Y-%m-%d") for day_off in day_off_dates_queryset]
-        fully_booked_dates = (
-            [fully_booked.strftime("%Y-%m-%d") for fully_booked in fully_booked_dates_queryset]
-            if fully_booked_dates_queryset
-            else []
-        )
-
-        available_dates = []
-
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            if date_str not in day_off_dates and date_str not in fully_booked_dates:
-                available_dates.append(date_str)
-            current_date += timedelta(days=1)
+        available_dates = [
+            date.fromordinal(ordinal).strftime("%Y-%m-%d")
+            for ordinal in self.get_available_ordinals(start_date, end_date, closed_ordinals)
+        ]
 
         return available_dates
 
-    def get_available_reservation_dates(
-        self, pet_kindergarden_id: int, customer: Customer, ticket_type: str, ticket_id: Optional[int]
-    ) -> list[str]:
+    def build_pet_kindergarden_calendar(
+        self, pet_kindergarden_id: int, start_date: date, end_date: date, check_capacity: bool = True
+    ) -> pet_kindergarden_calendar_type:
         """
-        반려동물 유치원 아이디, 고객 객체, 티켓 타입으로  예약 가능한 날짜 목록을 조회합니다.
+        반려동물 유치원 아이디로 주어진 기간의 예약 캘린더(당일 예약 여부, 휴무일, 정원 초과일)를 생성합니다.
 
         Args:
             pet_kindergarden_id (int): 반려동물 유치원 아이디
-            customer (Customer): 고객 객체
-            ticket_type (str): 티켓 타입
-            ticket_id (int): 티켓 아이디
+            start_date (date): 시작 날짜
+            end_date (date): 종료 날짜
+            check_capacity (bool): 정원 초과일 포함 여부
 
         Returns:
-            list[str]: 예약 가능한 날짜 리스트
+            pet_kindergarden_calendar_type: 반려동물 유치원 캘린더
         """
         # 당일 예약 여부 조회
-        reservation_availability_option_queryset = (
+        reservation_availability_option = (
             self._pet_kindergarden_selector.get_by_pet_kindergarden_id_for_reservation_availability_option(
                 pet_kindergarden_id=pet_kindergarden_id
+            ).first()
+        )
+        date_range = [datetime.combine(start_date, time.min), datetime.combine(end_date, time.max)]
+
+        # 해당 유치원의 최대 정원(정원을 확인하지 않으면 제한 없음으로 처리)
+        daily_pet_limit = (
+            self._pet_kindergarden_selector.get_by_pet_kindergarden_id_for_daily_pet_limit(
+                pet_kindergarden_id=pet_kindergarden_id
             )
+            if check_capacity
+            else -1
+        )
+
+        # 반복 휴무 규칙은 캘린더와 함께 캐싱하여 캐시를 사용하지 않는 조회에서도 재사용
+        day_off_rules = self._day_off_selector.get_queryset_by_pet_kindergarden_id_for_day_off_rule(
+            pet_kindergarden_id=pet_kindergarden_id
+        )
+
+        return {
+            "reservation_availability_option": reservation_availability_option,
+            "start_ordinal": start_date.toordinal(),
+            "end_ordinal": end_date.toordinal(),
+            "closed_ordinals": self.get_closed_ordinals(
+                pet_kindergarden_id=pet_kindergarden_id,
+                date_range=date_range,
+                daily_pet_limit=daily_pet_limit,
+                day_off_rules=day_off_rules,
+            ),
+            "day_off_rules": day_off_rules,
+        }
+
+    def get_day_off_rules(self, pet_kindergarden_id: int) -> list[day_off_rule_type]:
+        """
+        반려동물 유치원 아이디로 반복 휴무 규칙 목록을 조회합니다.
+        신선한 캘린더 캐시가 있으면 캘린더에 함께 저장된 규칙을 사용하고, 없을 때만 DB에서 조회합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            list[day_off_rule_type]: 반복 휴무 규칙 목록
+        """
+        calendar, is_fresh = self._pet_kindergarden_calendar_cache.get(pet_kindergarden_id)
+        if calendar is not None and is_fresh and "day_off_rules" in calendar:
+            return calendar["day_off_rules"]
+
+        return self._day_off_selector.get_queryset_by_pet_kindergarden_id_for_day_off_rule(
+            pet_kindergarden_id=pet_kindergarden_id
+        )
+
+    def get_closed_ordinals(
+        self,
+        pet_kindergarden_id: int,
+        date_range: list[datetime],
+        daily_pet_limit: int,
+        day_off_rules: Optional[list[day_off_rule_type]] = None,
+    ) -> set[int]:
+        """
+        반려동물 유치원 아이디로 주어진 기간의 휴무일과 정원이 초과된 날짜를 날짜 서수(ordinal) 집합으로 조회합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            date_range (list[datetime]): 검색할 날짜 범위 (시작일, 종료일)
+            daily_pet_limit (int): 하루 정원
+            day_off_rules (Optional[list[day_off_rule_type]]): 미리 조회한 반복 휴무 규칙(없으면 get_day_off_rules로 조회)
+
+        Returns:
+            set[int]: 예약할 수 없는 날짜의 서수 집합
+        """
+        # 휴무일 목록 조회
+        day_off_dates_queryset = self._day_off_selector.get_queryset_by_pet_kindergarden_id_and_date_range_for_day_off(
+            pet_kindergarden_id=pet_kindergarden_id, date_range=date_range
+        )
+
+        # 정원이 초과된 날짜 목록 조회
+        fully_booked_dates_queryset = self._daily_reservation_selector.get_queryset_for_fully_booked(
+            pet_kindergarden_id=pet_kindergarden_id,
+            date_range=date_range,
+            daily_pet_limit=daily_pet_limit,
         )
 
+        # 반복 휴무 규칙을 조회 기간에 대해 계산
+        if day_off_rules is None:
+            day_off_rules = self.get_day_off_rules(pet_kindergarden_id=pet_kindergarden_id)
+        closed_ordinals = DayOffRuleEngine.get_closed_ordinals(
+            rules=day_off_rules,
+            start_date=date_range[0].date(),
+            end_date=date_range[1].date(),
+        )
+
+        # 휴무일과 정원이 초과된 날짜를 날짜 서수(ordinal) 집합으로 변환
+        closed_ordinals.update(day_off.toordinal() for day_off in day_off_dates_queryset)
+        if fully_booked_dates_queryset:
+            closed_ordinals.update(fully_booked.toordinal() for fully_booked in fully_booked_dates_queryset)
+
+        return closed_ordinals
+
+    def get_pet_kindergarden_calendar(self, pet_kindergarden_id: int, end_date: date) -> pet_kindergarden_calendar_type:
+        """
+        반려동물 유치원 캘린더를 캐시에서 조회합니다.
+        캐시가 없거나 종료 날짜를 포함하지 못하면 새로 생성하고,
+        만료된 캐시는 그대로 반환하면서 비동기로 재검증합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            end_date (date): 조회가 필요한 마지막 날짜
+
+        Returns:
+            pet_kindergarden_calendar_type: 반려동물 유치원 캘린더
+        """
+        today = timezone.now().date()
+        calendar, is_fresh = self._pet_kindergarden_calendar_cache.get(pet_kindergarden_id)
+
+        if (
+            calendar is None
+            or calendar["start_ordinal"] > today.toordinal()
+            or calendar["end_ordinal"] < end_date.toordinal()
+        ):
+            horizon_end_date = max(
+                today + timedelta(days=settings.PET_KINDERGARDEN_CALENDAR_CACHE_HORIZON_DAYS),
+                end_date,
+            )
+            # 동시에 들어온 요청은 같은 기간의 캘린더 생성을 한 번만 수행하고 결과를 공유
+            calendar = self._pet_kindergarden_calendar_cache.get_or_build(
+                pet_kindergarden_id=pet_kindergarden_id,
+                start_date=today,
+                end_date=horizon_end_date,
+                build=lambda: self.build_pet_kindergarden_calendar(
+                    pet_kindergarden_id=pet_kindergarden_id,
+                    start_date=today,
+                    end_date=horizon_end_date,
+                ),
+            )
+        elif not is_fresh and self._pet_kindergarden_calendar_cache.acquire_revalidation_lock(pet_kindergarden_id):
+            refresh_pet_kindergarden_calendar_cache.delay(pet_kindergarden_id=pet_kindergarden_id)  # type: ignore
+
+        return calendar
+
+    def refresh_pet_kindergarden_calendar(self, pet_kindergarden_id: int) -> None:
+        """
+        반려동물 유치원 캘린더를 DB에서 다시 생성하여 캐시에 저장합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            None
+        """
+        today = timezone.now().date()
+        horizon_end_date = today + timedelta(days=settings.PET_KINDERGARDEN_CALENDAR_CACHE_HORIZON_DAYS)
+
+        # 기존 캐시가 더 먼 날짜까지 포함하고 있었다면 해당 범위를 유지
+        calendar, _ = self._pet_kindergarden_calendar_cache.get(pet_kindergarden_id)
+        if calendar is not None:
+            horizon_end_date = max(horizon_end_date, date.fromordinal(calendar["end_ordinal"]))
+
+        calendar = self.build_pet_kindergarden_calendar(
+            pet_kindergarden_id=pet_kindergarden_id,
+            start_date=today,
+            end_date=horizon_end_date,
+        )
+        self._pet_kindergarden_calendar_cache.set(pet_kindergarden_id, calendar)
+
+    def invalidate_pet_kindergarden_calendar(self, pet_kindergarden_id: int) -> None:
+        """
+        트랜잭션이 커밋된 후 반려동물 유치원 캘린더 캐시를 만료 상태로 전환합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            None
+        """
+        transaction.on_commit(lambda: self._pet_kindergarden_calendar_cache.invalidate(pet_kindergarden_id))
+
+    def get_ticket_end_date(self, customer: Customer, ticket_type: str, ticket_id: Optional[int]) -> datetime:
+        """
+        고객 객체와 티켓 타입, 티켓 아이디로 예약 가능한 날짜를 검색할 종료 날짜를 조회합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+            ticket_type (str): 티켓 타입
+            ticket_id (int): 티켓 아이디
+
+        Returns:
+            datetime: 호텔권은 가장 늦은 만료일의 다음 날, 시간/종일권은 티켓의 만료일
+        """
         # 티켓 조회(호텔권 -> 목록 조회, 시간/종일권 -> 단일 조회)
         if ticket_type == TicketType.HOTEL.value:
             tickets_queryset = get_object_or_not_found(
@@ -318,22 +735,137 @@ class ReservationService(AbstractReservationService):
                 code=SYSTEM_CODE.code("NOT_FOUND_TICKET"),
             )
 
-        # 검색할 시작 날짜와 종료 날짜
-        start_date = (
-            datetime.now()
-            if reservation_availability_option_queryset.first()
-            == ReservationAvailabilityOption.SAME_DAY_AVAILABILITY.value
-            else (datetime.now() + timedelta(days=1))
-        )
-        end_date = (
+        # 검색할 종료 날짜
+        return (
             tickets_queryset.order_by("-expired_at").first().expired_at + timedelta(days=1)
             if ticket_type == TicketType.HOTEL.value
             else tickets_queryset.expired_at
         )
 
-        # 휴무일 목록 조회
-        day_off_dates_queryset = self._day_off_selector.get_queryset_by_pet_kindergarden_id_and_date_range_for_day_off(
-            pet_kindergarden_id=pet_kindergarden_id, date_range=[start_date, end_date]
+    @staticmethod
+    def get_reservation_start_date(reservation_availability_option: Optional[str]) -> datetime:
+        """
+        반려동물 유치원의 당일 예약 가능 여부로 예약 가능한 날짜를 검색할 시작 날짜를 계산합니다.
+
+        Args:
+            reservation_availability_option (Optional[str]): 당일 예약 가능 여부
+
+        Returns:
+            datetime: 당일 예약이 가능하면 현재 시간, 불가능하면 다음 날 현재 시간
+        """
+        if reservation_availability_option == ReservationAvailabilityOption.SAME_DAY_AVAILABILITY.value:
+            return datetime.now()
+        return datetime.now() + timedelta(days=1)
+
+    def get_available_reservation_dates(
+        self,
+        pet_kindergarden_id: int,
+        customer: Customer,
+        ticket_type: str,
+        ticket_id: Optional[int],
+        use_cache: bool = False,
+        check_capacity: bool = True,
+    ) -> list[str]:
+        """
+        반려동물 유치원 아이디, 고객 객체, 티켓 타입으로  예약 가능한 날짜 목록을 조회합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            customer (Customer): 고객 객체
+            ticket_type (str): 티켓 타입
+            ticket_id (int): 티켓 아이디
+            use_cache (bool): 반려동물 유치원 캘린더 캐시 사용 여부 (예약 검증 시에는 사용하지 않음)
+            check_capacity (bool): 정원 초과일 제외 여부 (예약 생성 시에는 일별 예약 현황 증가 시 정원을 확인)
+
+        Returns:
+            list[str]: 예약 가능한 날짜 리스트
+        """
+        # 검색할 종료 날짜
+        end_date = self.get_ticket_end_date(customer=customer, ticket_type=ticket_type, ticket_id=ticket_id)
+
+        # 반려동물 유치원 캘린더 조회
+        if use_cache:
+            calendar = self.get_pet_kindergarden_calendar(
+                pet_kindergarden_id=pet_kindergarden_id,
+                end_date=end_date.date(),
+            )
+        else:
+            calendar = self.build_pet_kindergarden_calendar(
+                pet_kindergarden_id=pet_kindergarden_id,
+                start_date=timezone.now().date(),
+                end_date=end_date.date(),
+                check_capacity=check_capacity,
+            )
+
+        # 검색할 시작 날짜
+        start_date = self.get_reservation_start_date(calendar["reservation_availability_option"])
+
+        # 예약 가능한 날짜 추출
+        available_dates = self.filter_available_reservation_dates(
+            start_date=start_date,
+            end_date=end_date,
+            closed_ordinals=calendar["closed_ordinals"],
+        )
+
+        return available_dates
+
+    def get_available_reservation_dates_by_end_date(
+        self, pet_kindergarden: PetKindergarden, end_date: datetime
+    ) -> list[str]:
+        """
+        이미 조회한 반려동물 유치원 설정으로 종료 날짜까지 휴무일을 제외한 예약 가능한 날짜 목록을 조회합니다.
+        예약 생성 시 사용하며, 정원은 일별 예약 현황을 증가시킬 때 확인하므로 여기서는 확인하지 않습니다.
+
+        Args:
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            end_date (datetime): 종료 날짜
+
+        Returns:
+            list[str]: 예약 가능한 날짜 리스트
+        """
+        closed_ordinals = self.get_closed_ordinals(
+            pet_kindergarden_id=pet_kindergarden.id,
+            date_range=[datetime.combine(timezone.now().date(), time.min), datetime.combine(end_date.date(), time.max)],
+            daily_pet_limit=-1,
+        )
+
+        return self.filter_available_reservation_dates(
+            start_date=self.get_reservation_start_date(pet_kindergarden.reservation_availability_option),
+            end_date=end_date,
+            closed_ordinals=closed_ordinals,
+        )
+
+    def search_next_available_reservation_dates(
+        self,
+        pet_kindergarden_id: int,
+        customer: Customer,
+        ticket_type: str,
+        ticket_id: Optional[int],
+        count: int,
+    ) -> list[str]:
+        """
+        가장 가까운 예약 가능한 날짜를 최대 count개 조회합니다.
+        티켓의 전체 기간을 한 번에 조회하지 않고 NEXT_AVAILABLE_DATES_SCAN_DAYS 단위로 앞에서부터 검색하며,
+        count개를 찾으면 바로 검색을 종료합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            customer (Customer): 고객 객체
+            ticket_type (str): 티켓 타입
+            ticket_id (int): 티켓 아이디
+            count (int): 조회할 날짜 개수
+
+        Returns:
+            list[str]: 예약 가능한 날짜 목록(오름차순)
+        """
+        # 검색할 종료 날짜
+        end_date = self.get_ticket_end_date(customer=customer, ticket_type=ticket_type, ticket_id=ticket_id)
+
+        # 당일 예약 여부 조회
+        reservation_availability_option = (
+            self._pet_kindergarden_selector.get_by_pet_kindergarden_id_for_reservation_availability_option(
+                pet_kindergarden_id=pet_kindergarden_id
+            ).first()
         )
 
         # 해당 유치원의 최대 정원
@@ -341,22 +873,180 @@ class ReservationService(AbstractReservationService):
             pet_kindergarden_id=pet_kindergarden_id
         )
 
-        # 정원이 초과된 날짜 목록 조회
-        fully_booked_dates_queryset = self._daily_reservation_selector.get_queryset_for_fully_booked(
+        # 검색할 시작 날짜
+        start_date = self.get_reservation_start_date(reservation_availability_option)
+        last_ordinal = start_date.toordinal() + (end_date - start_date).days
+
+        # 반복 휴무 규칙은 기간과 관계없으므로 검색 전에 한 번만 조회
+        day_off_rules = self.get_day_off_rules(pet_kindergarden_id=pet_kindergarden_id)
+
+        available_dates: list[str] = []
+        chunk_start_ordinal = start_date.toordinal()
+        while chunk_start_ordinal <= last_ordinal and len(available_dates) < count:
+            chunk_end_ordinal = min(chunk_start_ordinal + self.NEXT_AVAILABLE_DATES_SCAN_DAYS - 1, last_ordinal)
+            closed_ordinals = self.get_closed_ordinals(
+                pet_kindergarden_id=pet_kindergarden_id,
+                date_range=[
+                    datetime.combine(date.fromordinal(chunk_start_ordinal), time.min),
+                    datetime.combine(date.fromordinal(chunk_end_ordinal), time.max),
+                ],
+                daily_pet_limit=daily_pet_limit,
+                day_off_rules=day_off_rules,
+            )
+            for ordinal in range(chunk_start_ordinal, chunk_end_ordinal + 1):
+                if ordinal in closed_ordinals:
+                    continue
+                available_dates.append(date.fromordinal(ordinal).strftime("%Y-%m-%d"))
+                if len(available_dates) == count:
+                    break
+            chunk_start_ordinal = chunk_end_ordinal + 1
+
+        return available_dates
+
+    def get_available_reservation_date_ranges(
+        self,
+        pet_kindergarden_id: int,
+        customer: Customer,
+        ticket_type: str,
+        ticket_id: Optional[int],
+        start_month: date,
+        end_month: date,
+    ) -> dict[str, Any]:
+        """
+        조회할 월 범위 안에서 예약 가능한 날짜를 연속된 구간([시작일, 종료일]) 목록으로 조회합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            customer (Customer): 고객 객체
+            ticket_type (str): 티켓 타입
+            ticket_id (int): 티켓 아이디
+            start_month (date): 조회를 시작할 월
+            end_month (date): 조회를 종료할 월
+
+        Returns:
+            dict[str, Any]: 조회 범위와 예약 가능한 날짜 구간 목록
+        """
+        window_start_date = start_month.replace(day=1)
+        window_end_date = (end_month.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+        # 검색할 종료 날짜
+        end_date = self.get_ticket_end_date(customer=customer, ticket_type=ticket_type, ticket_id=ticket_id)
+
+        # 반려동물 유치원 캘린더 조회(조회 범위까지만 필요)
+        calendar = self.get_pet_kindergarden_calendar(
             pet_kindergarden_id=pet_kindergarden_id,
-            date_range=[start_date, end_date],
-            daily_pet_limit=daily_pet_limit,
+            end_date=min(end_date.date(), window_end_date),
         )
 
-        # 예약 가능한 날짜 추출
-        available_dates = self.filter_available_reservation_dates(
+        # 티켓의 예약 가능 기간과 조회 범위가 겹치는 구간만 검색
+        start_date = self.get_reservation_start_date(calendar["reservation_availability_option"])
+        first_ordinal = max(start_date.toordinal(), window_start_date.toordinal())
+        last_ordinal = min(start_date.toordinal() + (end_date - start_date).days, window_end_date.toordinal())
+        available_ordinals = [
+            ordinal for ordinal in range(first_ordinal, last_ordinal + 1) if ordinal not in calendar["closed_ordinals"]
+        ]
+
+        # 연속된 날짜를 하나의 구간으로 묶음
+        available_ranges = []
+        for _, group in groupby(enumerate(available_ordinals), lambda x: x[1] - x[0]):
+            ordinals = [ordinal for _, ordinal in group]
+            available_ranges.append(
+                [
+                    date.fromordinal(ordinals[0]).strftime("%Y-%m-%d"),
+                    date.fromordinal(ordinals[-1]).strftime("%Y-%m-%d"),
+                ]
+            )
+
+        return {
+            "start_date": window_start_date,
+            "end_date": window_end_date,
+            "available_ranges": available_ranges,
+        }
+
+    def get_available_reservation_dates_for_customer_tickets(
+        self, pet_kindergarden_id: int, customer: Customer
+    ) -> list[dict[str, Any]]:
+        """
+        고객이 사용할 수 있는 모든 티켓의 예약 가능한 날짜 목록을 한 번에 조회합니다.
+        반려동물 유치원 캘린더는 한 번만 조회하고, 티켓별 만료일까지의 구간만 잘라서 반환합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            customer (Customer): 고객 객체
+
+        Returns:
+            list[dict[str, Any]]: 티켓(호텔권은 하나로 묶음)별 예약 가능한 날짜 목록
+        """
+        customer_tickets = list(
+            self._customer_ticket_selector.get_queryset_with_ticket_by_customer_for_available_ticket(customer=customer)
+        )
+
+        # 티켓별 검색 종료 날짜(호텔권 -> 가장 늦은 만료일 + 1일, 시간/종일권 -> 티켓별 만료일)
+        ticket_windows: list[dict[str, Any]] = []
+        hotel_tickets = [
+            customer_ticket
+            for customer_ticket in customer_tickets
+            if customer_ticket.ticket.ticket_type == TicketType.HOTEL.value
+        ]
+        for customer_ticket in customer_tickets:
+            if customer_ticket.ticket.ticket_type == TicketType.HOTEL.value:
+                continue
+            ticket_type = (
+                f"{customer_ticket.ticket.usage_time}{TicketType.TIME.value}"
+                if customer_ticket.ticket.ticket_type == TicketType.TIME.value
+                else customer_ticket.ticket.ticket_type
+            )
+            ticket_windows.append(
+                {
+                    "ticket_type": ticket_type,
+                    "ticket_id": customer_ticket.id,
+                    "expired_at": customer_ticket.expired_at,
+                    "end_date": customer_ticket.expired_at,
+                }
+            )
+        if hotel_tickets:
+            expired_at = max(customer_ticket.expired_at for customer_ticket in hotel_tickets)
+            ticket_windows.append(
+                {
+                    "ticket_type": TicketType.HOTEL.value,
+                    "ticket_id": None,
+                    "expired_at": expired_at,
+                    "end_date": expired_at + timedelta(days=1),
+                }
+            )
+
+        if not ticket_windows:
+            return []
+
+        # 반려동물 유치원 캘린더는 가장 늦은 종료 날짜 기준으로 한 번만 조회
+        last_end_date = max(ticket_window["end_date"] for ticket_window in ticket_windows)
+        calendar = self.get_pet_kindergarden_calendar(
+            pet_kindergarden_id=pet_kindergarden_id,
+            end_date=last_end_date.date(),
+        )
+        start_date = self.get_reservation_start_date(calendar["reservation_availability_option"])
+        available_ordinals = self.get_available_ordinals(
             start_date=start_date,
-            end_date=end_date,
-            day_off_dates_queryset=day_off_dates_queryset,
-            fully_booked_dates_queryset=fully_booked_dates_queryset,
+            end_date=last_end_date,
+            closed_ordinals=calendar["closed_ordinals"],
         )
+        available_dates = [date.fromordinal(ordinal).strftime("%Y-%m-%d") for ordinal in available_ordinals]
 
-        return available_dates
+        # 티켓별 종료 날짜까지의 예약 가능한 날짜 추출
+        start_ordinal = start_date.toordinal()
+        available_dates_per_ticket = []
+        for ticket_window in ticket_windows:
+            end_ordinal = start_ordinal + (ticket_window["end_date"] - start_date).days
+            available_dates_per_ticket.append(
+                {
+                    "ticket_type": ticket_window["ticket_type"],
+                    "ticket_id": ticket_window["ticket_id"],
+                    "expired_at": ticket_window["expired_at"],
+                    "available_dates": available_dates[: bisect_right(available_ordinals, end_ordinal)],
+                }
+            )
+
+        return available_dates_per_ticket
 
     def get_available_timeslots(self, business_start_hour: time, business_end_hour: time, usage_time: int) -> list[str]:
         """
@@ -385,7 +1075,6 @@ class ReservationService(AbstractReservationService):
     def get_strategy(self, ticket_type: str) -> AbstractReservationStrategy:
         return self._strategy_factory.create_strategy(ticket_type, self)
 
-    @transaction.atomic
     def register_reservation(
         self, customer: Customer, pet_kindergarden: PetKindergarden, reservation_data: dict
     ) -> dict:
@@ -407,9 +1096,15 @@ class ReservationService(AbstractReservationService):
             dict
         """
         ticket_type = reservation_data["ticket_type"][-2:]
-        strategy = self.get_strategy(ticket_type)
-        strategy.validate(customer, pet_kindergarden, reservation_data)
-        reservation_info = strategy.reserve(customer, pet_kindergarden, reservation_data)
+
+        def write() -> dict:
+            # 재시도마다 새 전략 객체로 티켓과 예약 현황을 다시 조회하여 검증
+            strategy = self.get_strategy(ticket_type)
+            strategy.validate(customer, pet_kindergarden, reservation_data)
+            return strategy.reserve(customer, pet_kindergarden, reservation_data)
+
+        # 고객 티켓 충돌이 해결되지 않으면 트랜잭션을 롤백하고 잠금을 해제한 뒤 다시 실행
+        reservation_info = run_with_customer_ticket_lock_retry(write, pet_kindergarden_id=pet_kindergarden.id)
 
         if reservation_info["remain_count"] in [0, 1]:
             send_alimtalk_on_ticket_low.delay(  # type: ignore
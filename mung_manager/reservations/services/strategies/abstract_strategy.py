@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import datetime
+from typing import Any, Callable, Optional
 
-from mung_manager.customers.selectors.abstracts import AbstractCustomerPetSelector
+from mung_manager.customers.selectors.abstracts import (
+    AbstractCustomerPetSelector,
+    AbstractCustomerTicketSelector,
+)
 from mung_manager.reservations.selectors.abstracts import AbstractReservationSelector
-from mung_manager.reservations.services.abstracts import AbstractReservationService
+from mung_manager.reservations.services.abstracts import (
+    AbstractDailyReservationService,
+    AbstractReservationService,
+)
+from mung_manager.reservations.services.strategies.booking_context import (
+    BookingContext,
+)
 from mung_manager_commons.constants import SYSTEM_CODE
 from mung_manager_commons.errors import NotImplementedException, ValidationException
 from mung_manager_commons.selector import check_object_or_not_found
@@ -18,10 +28,160 @@ class AbstractReservationStrategy(ABC):
         customer_pet_selector: AbstractCustomerPetSelector,
         reservation_service: AbstractReservationService,
         reservation_selector: AbstractReservationSelector,
+        daily_reservation_service: AbstractDailyReservationService,
+        customer_ticket_selector: AbstractCustomerTicketSelector,
     ):
         self._customer_pet_selector = customer_pet_selector
+        self._customer_ticket_selector = customer_ticket_selector
         self._reservation_service = reservation_service
         self._reservation_selector = reservation_selector
+        self._daily_reservation_service = daily_reservation_service
+        # 전략 객체는 예약 한 건마다 생성되므로 메모도 예약 한 건 동안만 유지
+        self._memo: dict[str, Any] = {}
+        self._booking_context: Optional[BookingContext] = None
+
+    @property
+    def booking_context(self) -> BookingContext:
+        """
+        이 함수는 load_booking_context로 조회한 예약 컨텍스트를 반환합니다.
+        검증 단계(validate)에서 항상 먼저 조회하므로 쓰기 단계에서는 추가 조회 없이 사용할 수 있습니다.
+
+        Returns:
+            BookingContext: 예약 컨텍스트
+        """
+        if self._booking_context is None:
+            raise RuntimeError("load_booking_context() must be called before accessing booking_context")
+        return self._booking_context
+
+    def memoize(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        이 함수는 예약 한 건을 처리하는 동안 같은 키의 값을 한 번만 계산합니다.
+
+        Args:
+            key (str): 메모 키
+            compute (Callable[[], Any]): 값을 계산하는 함수
+
+        Returns:
+            Any: 계산된 값
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def load_booking_context(
+        self,
+        customer: Customer,
+        pet_kindergarden: PetKindergarden,
+        reservation_data: dict[str, Any],
+    ) -> BookingContext:
+        """
+        이 함수는 예약 한 건에 필요한 반려동물, 사용 가능한 티켓, 이미 예약한 날짜를 한 번에 조회합니다.
+        반려동물 유치원 설정은 요청에서 조회한 객체를 그대로 사용합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation_data (dict[str, Any]): 사용자 입력
+
+        Returns:
+            BookingContext: 예약 컨텍스트
+        """
+        self._booking_context = self.memoize(
+            "booking_context",
+            lambda: BookingContext(
+                customer=customer,
+                pet_kindergarden=pet_kindergarden,
+                customer_pet=self._customer_pet_selector.get_by_customer_and_pet_id(
+                    customer=customer, pet_id=reservation_data["pet_id"]
+                ),
+                customer_tickets=list(
+                    self._customer_ticket_selector.get_queryset_with_ticket_by_customer_for_available_ticket(
+                        customer=customer
+                    )
+                ),
+                reserved_dates=set(
+                    self._reservation_selector.get_queryset_for_duplicate_reservation(
+                        customer_id=customer.id,
+                        customer_pet_id=reservation_data["pet_id"],
+                        pet_kindergarden_id=pet_kindergarden.id,
+                    )
+                ),
+            ),
+        )
+        return self._booking_context
+
+    def get_pet_name(self, reservation_data: dict[str, Any]) -> Optional[str]:
+        """
+        이 함수는 예약한 반려동물의 이름을 반환합니다.
+        예약 컨텍스트에 반려동물이 있으면 추가 조회 없이 사용합니다.
+
+        Args:
+            reservation_data (dict[str, Any]): 사용자 입력
+
+        Returns:
+            Optional[str]: 반려동물 이름
+        """
+        if self._booking_context is not None and self._booking_context.customer_pet is not None:
+            return self._booking_context.customer_pet.name
+
+        return self._customer_pet_selector.get_by_pet_id_for_pet_name(reservation_data["pet_id"])
+
+    def get_available_dates(
+        self,
+        customer: Customer,
+        pet_kindergarden: PetKindergarden,
+        reservation_data: dict[str, Any],
+    ) -> set[str]:
+        """
+        이 함수는 예약하려는 티켓으로 예약 가능한 날짜 집합을 조회합니다.
+        정원은 일별 예약 현황을 증가시킬 때 원자적으로 확인하므로 여기서는 휴무일만 제외합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation_data (dict[str, Any]): 사용자 입력
+
+        Returns:
+            set[str]: 예약 가능한 날짜 집합
+        """
+        end_date = self.load_booking_context(customer, pet_kindergarden, reservation_data).get_ticket_end_date(
+            ticket_type=reservation_data["ticket_type"],
+            ticket_id=reservation_data.get("ticket_id"),
+        )
+        if end_date is None:
+            raise ValidationException(
+                detail=SYSTEM_CODE.message("NOT_FOUND_TICKET"),
+                code=SYSTEM_CODE.code("NOT_FOUND_TICKET"),
+            )
+
+        return self.memoize(
+            "available_dates",
+            lambda: set(
+                self._reservation_service.get_available_reservation_dates_by_end_date(
+                    pet_kindergarden=pet_kindergarden,
+                    end_date=end_date,
+                )
+            ),
+        )
+
+    def get_reserved_dates(
+        self,
+        customer: Customer,
+        pet_kindergarden: PetKindergarden,
+        reservation_data: dict[str, Any],
+    ) -> set[str]:
+        """
+        이 함수는 예약하려는 반려동물이 이미 예약한 날짜 집합을 반환합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation_data (dict[str, Any]): 사용자 입력
+
+        Returns:
+            set[str]: 이미 예약한 날짜 집합
+        """
+        return self.load_booking_context(customer, pet_kindergarden, reservation_data).reserved_dates
 
     def validate(
         self,
@@ -40,6 +200,7 @@ class AbstractReservationStrategy(ABC):
         Returns:
             None
         """
+        self.load_booking_context(customer, pet_kindergarden, reservation_data)
         self.common_validation(customer, pet_kindergarden, reservation_data)
         self.specific_validation(customer, pet_kindergarden, reservation_data)
 
@@ -62,21 +223,15 @@ class AbstractReservationStrategy(ABC):
         """
         # 해당 반려동물이 해당 고객에게 속해있는지 검증
         check_object_or_not_found(
-            self._customer_pet_selector.exists_by_customer_and_pet_id(
-                customer=customer, pet_id=reservation_data["pet_id"]
-            ),
+            self.load_booking_context(customer, pet_kindergarden, reservation_data).customer_pet,
             msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER_PET"),
             code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_PET"),
         )
 
         if reservation_data["ticket_type"] != TicketType.HOTEL.value:
             # 해당 날에 이미 예약을 했는지 검증
-            if reservation_data["reserved_date"].strftime(
-                "%Y-%m-%d"
-            ) in self._reservation_selector.get_queryset_for_duplicate_reservation(
-                customer_id=customer.id,
-                customer_pet_id=reservation_data["pet_id"],
-                pet_kindergarden_id=pet_kindergarden.id,
+            if reservation_data["reserved_date"].strftime("%Y-%m-%d") in self.get_reserved_dates(
+                customer, pet_kindergarden, reservation_data
             ):
                 raise ValidationException(
                     detail=SYSTEM_CODE.message("ALREADY_EXISTS_RESERVATION"),
@@ -84,13 +239,8 @@ class AbstractReservationStrategy(ABC):
                 )
 
             # 예약하려는 날이 휴무일이나 정원이 초과하는 날인지 검증
-            if reservation_data["reserved_date"].strftime(
-                "%Y-%m-%d"
-            ) not in self._reservation_service.get_available_reservation_dates(
-                pet_kindergarden_id=pet_kindergarden.id,
-                customer=customer,
-                ticket_type=reservation_data["ticket_type"],
-                ticket_id=reservation_data.get("ticket_id"),
+            if reservation_data["reserved_date"].strftime("%Y-%m-%d") not in self.get_available_dates(
+                customer, pet_kindergarden, reservation_data
             ):
                 raise ValidationException(
                     detail=SYSTEM_CODE.message("INVALID_RESERVED_AT"),
@@ -123,6 +273,7 @@ class AbstractReservationStrategy(ABC):
         Returns:
             dict[str, Any]: 예약 생성 결과 반환
         """
+        self.load_booking_context(customer, pet_kindergarden, reservation_data)
         customer_tickets = self.get_customer_tickets(customer, reservation_data)
         self.handle_daily_reservations(pet_kindergarden, reservation_data, customer)
         reservations = self.create_reservations(customer, pet_kindergarden, reservation_data, customer_tickets)
@@ -173,3 +324,27 @@ class AbstractReservationStrategy(ABC):
         customer_tickets: Any,
     ) -> dict[str, Any]:
         raise NotImplementedException()
+
+
+class AbstractSingleDayReservationStrategy(AbstractReservationStrategy):
+    """
+    이 클래스는 하루 단위로 예약하는 티켓(시간권, 종일권) 전략의 공통 인터페이스를 정의합니다.
+    """
+
+    @abstractmethod
+    def get_reserved_period(
+        self,
+        pet_kindergarden: PetKindergarden,
+        reservation_data: dict[str, Any],
+    ) -> tuple[datetime, datetime]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def build_reservation_info(
+        self,
+        reservation_data: dict[str, Any],
+        remain_count: Optional[int],
+        pet_name: Optional[str],
+        ticket_expired_at: datetime,
+    ) -> dict[str, Any]:
+        raise NotImplementedException()
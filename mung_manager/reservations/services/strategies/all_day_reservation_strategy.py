@@ -1,33 +1,33 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from concurrency.exceptions import RecordModifiedError
-from django.db.models import F
-
 from mung_manager.customers.selectors.abstracts import (
     AbstractCustomerPetSelector,
     AbstractCustomerTicketSelector,
 )
+from mung_manager.reservations.optimistic_locks import save_customer_ticket_with_retry
 from mung_manager.reservations.selectors.abstracts import AbstractReservationSelector
-from mung_manager.reservations.services.abstracts import AbstractReservationService
+from mung_manager.reservations.services.abstracts import (
+    AbstractDailyReservationService,
+    AbstractReservationService,
+)
 from mung_manager.reservations.services.strategies.abstract_strategy import (
-    AbstractReservationStrategy,
+    AbstractSingleDayReservationStrategy,
 )
 from mung_manager_commons.constants import SYSTEM_CODE
 from mung_manager_commons.errors import ValidationException
 from mung_manager_commons.selector import check_object_or_not_found
-from mung_manager_db.enum_types import ReservationStatus
+from mung_manager_db.enum_types import ReservationStatus, TicketType
 from mung_manager_db.models import (
     Customer,
     CustomerTicket,
     CustomerTicketUsageLog,
-    DailyReservation,
     PetKindergarden,
     Reservation,
 )
 
 
-class AllDayReservationStrategy(AbstractReservationStrategy):
+class AllDayReservationStrategy(AbstractSingleDayReservationStrategy):
 
     def __init__(
         self,
@@ -35,8 +35,15 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
         reservation_service: AbstractReservationService,
         customer_ticket_selector: AbstractCustomerTicketSelector,
         reservation_selector: AbstractReservationSelector,
+        daily_reservation_service: AbstractDailyReservationService,
     ):
-        super().__init__(customer_pet_selector, reservation_service, reservation_selector)
+        super().__init__(
+            customer_pet_selector,
+            reservation_service,
+            reservation_selector,
+            daily_reservation_service,
+            customer_ticket_selector,
+        )
         self._customer_pet_selector = customer_pet_selector
         self._customer_ticket_selector = customer_ticket_selector
         self._reservation_selector = reservation_selector
@@ -60,8 +67,7 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
         """
         # 해당 고객이 주어진 티켓 타입과 티켓 아이디에 해당하는 티켓을 소유하고 있는지 검증
         check_object_or_not_found(
-            self._customer_ticket_selector.get_for_all_day_or_time_ticket_type(
-                customer=customer,
+            self.load_booking_context(customer, pet_kindergarden, reservation_data).get_customer_ticket(
                 ticket_type=reservation_data["ticket_type"],
                 ticket_id=reservation_data["ticket_id"],
             ),
@@ -77,7 +83,7 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
         """
         이 함수는 주어진 정보를 바탕으로 티켓(들)을 반환합니다.
         티켓 횟수 증감 처리를 낙관적 락을 통해 구현했습니다.
-        유저의 혼란을 방지하고자 재시도 로직은 구현하지 않았습니다.
+        다른 요청과 충돌하면 최신 잔여 횟수를 다시 확인하여 정해진 횟수만큼 재시도합니다.
 
         Args:
             customer (Customer): 영업 시작 시간
@@ -86,9 +92,10 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
         Returns:
             CustomerTicket: 고객 티켓 객체
         """
-        customer_ticket = self._customer_ticket_selector.get_with_ticket_by_id_and_customer_id(
-            customer_ticket_id=reservation_data["ticket_id"],
-            customer_id=customer.id,
+        # 예약 컨텍스트에서 조회한 티켓을 그대로 차감
+        customer_ticket = self.booking_context.get_customer_ticket(
+            ticket_type=reservation_data["ticket_type"],
+            ticket_id=reservation_data["ticket_id"],
         )
         if customer_ticket is None:
             raise ValidationException(
@@ -96,17 +103,39 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
                 code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_TICKET"),
             )
 
-        try:
-            customer_ticket.used_count += 1
-            customer_ticket.unused_count -= 1
-            customer_ticket.save(update_fields=["used_count", "unused_count", "updated_at", "version"])
-        except RecordModifiedError:
-            raise ValidationException(
-                detail=SYSTEM_CODE.message("CONFILCT_CUSTOMER_TICKET"),
-                code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
-            )
+        def use_ticket(ticket: CustomerTicket) -> bool:
+            if ticket.unused_count < 1:
+                return False
+            ticket.used_count += 1
+            ticket.unused_count -= 1
+            return True
 
-        return customer_ticket
+        return save_customer_ticket_with_retry(
+            customer_ticket=customer_ticket,
+            apply=use_ticket,
+            pet_kindergarden_id=self.booking_context.pet_kindergarden.id,
+            update_fields=["used_count", "unused_count", "updated_at", "version"],
+            conflict_code="CONFILCT_CUSTOMER_TICKET",
+        )
+
+    def get_reserved_period(
+        self,
+        pet_kindergarden: PetKindergarden,
+        reservation_data: dict[str, Any],
+    ) -> tuple[datetime, datetime]:
+        """
+        이 함수는 예약의 등원 일시와 하원 일시(영업 시작/종료 시간)를 반환합니다.
+
+        Args:
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation_data (dict[str, Any]): 사용자 입력
+
+        Returns:
+            tuple[datetime, datetime]: 등원 일시, 하원 일시
+        """
+        reserved_at = datetime.combine(reservation_data["reserved_date"].date(), pet_kindergarden.business_start_hour)
+        end_at = datetime.combine(reservation_data["reserved_date"].date(), pet_kindergarden.business_end_hour)
+        return reserved_at, end_at
 
     def handle_daily_reservations(
         self,
@@ -125,17 +154,22 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
         Returns:
             None
         """
-        reserved_at = datetime.combine(reservation_data["reserved_date"].date(), pet_kindergarden.business_start_hour)
-        daily_reservation, created = DailyReservation.objects.get_or_create(
+        reserved_at, _ = self.get_reserved_period(pet_kindergarden, reservation_data)
+        # 정원이 남아있을 때만 증가(정원 확인과 증가를 하나의 쿼리로 처리)
+        if self._daily_reservation_service.increase_pet_counts(
             pet_kindergarden_id=pet_kindergarden.id,
-            reserved_at=reserved_at,
-            defaults={"total_pet_count": 1, "all_day_pet_count": 1},
-        )
-        if not created:
-            DailyReservation.objects.filter(pet_kindergarden_id=pet_kindergarden.id, reserved_at=reserved_at).update(
-                time_pet_count=F("all_day_pet_count") + 1, total_pet_count=F("total_pet_count") + 1
+            reserved_ats=[reserved_at],
+            ticket_type=TicketType.ALL_DAY.value,
+            daily_pet_limit=pet_kindergarden.daily_pet_limit,
+        ):
+            raise ValidationException(
+                detail=SYSTEM_CODE.message("INVALID_RESERVED_AT"),
+                code=SYSTEM_CODE.code("INVALID_RESERVED_AT"),
             )
 
+        # 일일 예약 현황이 변경되었으므로 유치원 캘린더 캐시 만료
+        self._reservation_service.invalidate_pet_kindergarden_calendar(pet_kindergarden.id)
+
     def create_reservations(
         self,
         customer: Customer,
@@ -155,11 +189,7 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
         Returns:
             Reservation: 예약 객체
         """
-        reserved_at = datetime.combine(
-            reservation_data["reserved_date"].date(),
-            pet_kindergarden.business_start_hour,
-        )
-        end_at = datetime.combine(reservation_data["reserved_date"].date(), pet_kindergarden.business_end_hour)
+        reserved_at, end_at = self.get_reserved_period(pet_kindergarden, reservation_data)
         reservation = Reservation.objects.create(
             reserved_at=reserved_at,
             end_at=end_at,
@@ -209,15 +239,40 @@ class AllDayReservationStrategy(AbstractReservationStrategy):
         Returns:
             dict[str, Any]: 예약 정보 반환
         """
-        unused_count = self._customer_ticket_selector.get_by_customer_ticket_id_for_unused_count(customer_tickets.id)
-        pet_name = self._customer_pet_selector.get_by_pet_id_for_pet_name(reservation_data["pet_id"])
+        # 티켓은 버전 조건부 UPDATE로 저장했으므로 메모리의 잔여 횟수가 DB에 기록된 값과 같음
+        return self.build_reservation_info(
+            reservation_data,
+            customer_tickets.unused_count,
+            self.get_pet_name(reservation_data),
+            customer_tickets.expired_at,
+        )
+
+    def build_reservation_info(
+        self,
+        reservation_data: dict[str, Any],
+        remain_count: Optional[int],
+        pet_name: Optional[str],
+        ticket_expired_at: datetime,
+    ) -> dict[str, Any]:
+        """
+        이 함수는 예약 결과로 반환할 예약 정보를 구성합니다.
+
+        Args:
+            reservation_data (dict[str, Any]): 사용자 입력
+            remain_count (Optional[int]): 티켓 잔여 횟수
+            pet_name (Optional[str]): 반려동물 이름
+            ticket_expired_at (datetime): 티켓 만료일
+
+        Returns:
+            dict[str, Any]: 예약 정보
+        """
         reservation_info = {
             "attendance_date": reservation_data["reserved_date"],
             "usage_count": 1,
-            "remain_count": unused_count,
+            "remain_count": remain_count,
             "pet_name": pet_name,
             "ticket_type": reservation_data["ticket_type"],
-            "ticket_expired_at": customer_tickets.expired_at,
+            "ticket_expired_at": ticket_expired_at,
         }
 
         return reservation_info
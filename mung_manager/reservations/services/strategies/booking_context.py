@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from mung_manager_db.enum_types import TicketType
+from mung_manager_db.models import (
+    Customer,
+    CustomerPet,
+    CustomerTicket,
+    PetKindergarden,
+)
+
+
+class BookingContext:
+    """
+    이 클래스는 예약 한 건을 처리하는 데 필요한 데이터를 한 번에 조회하여 보관합니다.
+    검증과 예약 생성 단계는 셀렉터를 다시 호출하지 않고 이 객체를 참조합니다.
+    """
+
+    def __init__(
+        self,
+        customer: Customer,
+        pet_kindergarden: PetKindergarden,
+        customer_pet: Optional[CustomerPet],
+        customer_tickets: list[CustomerTicket],
+        reserved_dates: set[str],
+    ):
+        self.customer = customer
+        self.pet_kindergarden = pet_kindergarden
+        self.customer_pet = customer_pet
+        self.customer_tickets = customer_tickets
+        self.reserved_dates = reserved_dates
+
+    @staticmethod
+    def parse_ticket_type(ticket_type: str) -> tuple[str, int]:
+        """
+        이 함수는 사용자 입력 티켓 타입(예: "4시간", "종일", "호텔")을 티켓 타입과 이용 시간으로 나눕니다.
+
+        Args:
+            ticket_type (str): 사용자 입력 티켓 타입
+
+        Returns:
+            tuple[str, int]: 티켓 타입, 이용 시간(시간권이 아니면 0)
+        """
+        if ticket_type.endswith(TicketType.TIME.value):
+            return ticket_type[-2:], int(ticket_type[:-2])
+        return ticket_type, 0
+
+    def get_customer_tickets_by_ticket_type(self, ticket_type: str) -> list[CustomerTicket]:
+        """
+        이 함수는 주어진 티켓 타입의 사용 가능한 고객 티켓 목록을 만료일 순으로 반환합니다.
+
+        Args:
+            ticket_type (str): 사용자 입력 티켓 타입
+
+        Returns:
+            list[CustomerTicket]: 만료일, 아이디 오름차순으로 정렬된 고객 티켓 목록
+        """
+        type_value, time_value = self.parse_ticket_type(ticket_type)
+        return sorted(
+            (
+                customer_ticket
+                for customer_ticket in self.customer_tickets
+                if customer_ticket.ticket.ticket_type == type_value and customer_ticket.ticket.usage_time == time_value
+            ),
+            key=lambda customer_ticket: (customer_ticket.expired_at, customer_ticket.id),
+        )
+
+    def get_customer_ticket(self, ticket_type: str, ticket_id: Optional[int]) -> Optional[CustomerTicket]:
+        """
+        이 함수는 주어진 티켓 타입과 티켓 아이디에 해당하는 사용 가능한 고객 티켓을 반환합니다.
+
+        Args:
+            ticket_type (str): 사용자 입력 티켓 타입
+            ticket_id (Optional[int]): 고객 티켓 아이디
+
+        Returns:
+            Optional[CustomerTicket]: 사용 가능한 티켓이 없으면 None 반환
+        """
+        for customer_ticket in self.get_customer_tickets_by_ticket_type(ticket_type):
+            if customer_ticket.id == ticket_id:
+                return customer_ticket
+        return None
+
+    def get_ticket_end_date(self, ticket_type: str, ticket_id: Optional[int]) -> Optional[datetime]:
+        """
+        이 함수는 예약 가능한 날짜를 검색할 종료 날짜를 반환합니다.
+
+        Args:
+            ticket_type (str): 사용자 입력 티켓 타입
+            ticket_id (Optional[int]): 고객 티켓 아이디(호텔권일 경우 불필요)
+
+        Returns:
+            Optional[datetime]: 호텔권은 가장 늦은 만료일의 다음 날, 시간/종일권은 티켓의 만료일(티켓이 없으면 None)
+        """
+        if ticket_type == TicketType.HOTEL.value:
+            hotel_tickets = self.get_customer_tickets_by_ticket_type(ticket_type)
+            if not hotel_tickets:
+                return None
+            return max(customer_ticket.expired_at for customer_ticket in hotel_tickets) + timedelta(days=1)
+
+        customer_ticket = self.get_customer_ticket(ticket_type, ticket_id)
+        return customer_ticket.expired_at if customer_ticket is not None else None
@@ -0,0 +1,90 @@
+from typing import Any
+
+from django.db import DatabaseError, connection
+
+from mung_manager.reservations.booking_functions import (
+    BOOKING_FUNCTION_ERROR_CODES,
+    BOOKING_FUNCTION_NAME,
+)
+from mung_manager.reservations.services.strategies.abstract_strategy import (
+    AbstractSingleDayReservationStrategy,
+)
+from mung_manager.reservations.services.strategies.all_day_reservation_strategy import (
+    AllDayReservationStrategy,
+)
+from mung_manager.reservations.services.strategies.time_reservation_strategy import (
+    TimeReservationStrategy,
+)
+from mung_manager_commons.constants import SYSTEM_CODE
+from mung_manager_commons.errors import ValidationException
+from mung_manager_db.enum_types import TicketType
+from mung_manager_db.models import Customer, PetKindergarden
+
+
+class BookingFunctionReservationMixin(AbstractSingleDayReservationStrategy):
+    """
+    이 클래스는 예약의 쓰기 단계를 DB 함수(install_booking_function) 한 번의 호출로 처리합니다.
+    검증은 기존 전략의 로직을 그대로 사용하고, 기존 전략의 쓰기 단계(reserve)는 참조 구현으로 유지합니다.
+    """
+
+    BOOKING_TICKET_TYPE: str
+
+    def reserve(
+        self,
+        customer: Customer,
+        pet_kindergarden: PetKindergarden,
+        reservation_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        이 함수는 티켓 차감, 일별 예약 현황 증가, 예약 생성, 티켓 사용 로그 생성을 DB 함수로 처리합니다.
+
+        Args:
+            customer (Customer): 고객 객체
+            pet_kindergarden (PetKindergarden): 반려동물 유치원 객체
+            reservation_data (dict[str, Any]): 사용자 입력
+
+        Returns:
+            dict[str, Any]: 예약 생성 결과 반환
+        """
+        reserved_at, end_at = self.get_reserved_period(pet_kindergarden, reservation_data)
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT * FROM {BOOKING_FUNCTION_NAME}(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                    [
+                        customer.id,
+                        pet_kindergarden.id,
+                        reservation_data["pet_id"],
+                        reservation_data["ticket_id"],
+                        self.BOOKING_TICKET_TYPE,
+                        reserved_at,
+                        end_at,
+                        pet_kindergarden.daily_pet_limit,
+                        self._daily_reservation_service.get_shard(pet_kindergarden.id),
+                        self._daily_reservation_service.is_sharded(pet_kindergarden.id),
+                    ],
+                )
+                _, remain_count, pet_name, ticket_expired_at = cursor.fetchone()
+        except DatabaseError as e:
+            # DB 함수가 전달한 에러 코드는 검증 에러로 변환(트랜잭션은 호출한 쪽에서 롤백)
+            error_code = getattr(getattr(e.__cause__, "diag", None), "message_primary", None)
+            if error_code not in BOOKING_FUNCTION_ERROR_CODES:
+                raise
+            raise ValidationException(
+                detail=SYSTEM_CODE.message(error_code),
+                code=SYSTEM_CODE.code(error_code),
+            )
+
+        # 일일 예약 현황이 변경되었으므로 유치원 캘린더 캐시 만료
+        self._reservation_service.invalidate_pet_kindergarden_calendar(pet_kindergarden.id)
+
+        return self.build_reservation_info(reservation_data, remain_count, pet_name, ticket_expired_at)
+
+
+class TimeBookingFunctionReservationStrategy(BookingFunctionReservationMixin, TimeReservationStrategy):
+    BOOKING_TICKET_TYPE = TicketType.TIME.value
+
+
+class AllDayBookingFunctionReservationStrategy(BookingFunctionReservationMixin, AllDayReservationStrategy):
+    BOOKING_TICKET_TYPE = TicketType.ALL_DAY.value
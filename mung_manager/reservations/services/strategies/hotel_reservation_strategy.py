@@ -1,18 +1,17 @@
 from collections import defaultdict
 from datetime import datetime, timedelta
-from itertools import groupby
-from operator import itemgetter
 from typing import Any, Optional
 
-from concurrency.exceptions import RecordModifiedError
-from django.db.models import F
-
 from mung_manager.customers.selectors.abstracts import (
     AbstractCustomerPetSelector,
     AbstractCustomerTicketSelector,
 )
+from mung_manager.reservations.optimistic_locks import save_customer_ticket_with_retry
 from mung_manager.reservations.selectors.abstracts import AbstractReservationSelector
-from mung_manager.reservations.services.abstracts import AbstractReservationService
+from mung_manager.reservations.services.abstracts import (
+    AbstractDailyReservationService,
+    AbstractReservationService,
+)
 from mung_manager.reservations.services.strategies.abstract_strategy import (
     AbstractReservationStrategy,
 )
@@ -27,7 +26,6 @@ from mung_manager_db.models import (
     Customer,
     CustomerTicket,
     CustomerTicketUsageLog,
-    DailyReservation,
     PetKindergarden,
     Reservation,
 )
@@ -41,8 +39,15 @@ class HotelReservationStrategy(AbstractReservationStrategy):
         reservation_service: AbstractReservationService,
         customer_ticket_selector: AbstractCustomerTicketSelector,
         reservation_selector: AbstractReservationSelector,
+        daily_reservation_service: AbstractDailyReservationService,
     ):
-        super().__init__(customer_pet_selector, reservation_service, reservation_selector)
+        super().__init__(
+            customer_pet_selector,
+            reservation_service,
+            reservation_selector,
+            daily_reservation_service,
+            customer_ticket_selector,
+        )
         self._customer_pet_selector = customer_pet_selector
         self._customer_ticket_selector = customer_ticket_selector
         self._reservation_selector = reservation_selector
@@ -67,7 +72,9 @@ class HotelReservationStrategy(AbstractReservationStrategy):
         """
         # 사용 가능한 호텔 타입의 티켓이 존재하는지 검증
         check_object_or_not_found(
-            self._customer_ticket_selector.get_queryset_by_customer_for_hotel_ticket_type(customer=customer),
+            self.load_booking_context(customer, pet_kindergarden, reservation_data).get_customer_tickets_by_ticket_type(
+                TicketType.HOTEL.value
+            ),
             msg=SYSTEM_CODE.message("NOT_FOUND_TICKET"),
             code=SYSTEM_CODE.code("NOT_FOUND_TICKET"),
         )
@@ -80,17 +87,8 @@ class HotelReservationStrategy(AbstractReservationStrategy):
             )
 
         # 등원 날짜와 하원 날짜 사이에 포함된 날짜들이 예약할 수 있는 날짜인지 검증
-        available_dates = self._reservation_service.get_available_reservation_dates(
-            pet_kindergarden_id=pet_kindergarden.id,
-            customer=customer,
-            ticket_type=reservation_data["ticket_type"],
-            ticket_id=reservation_data.get("ticket_id"),
-        )
-        reserved_dates = self._reservation_selector.get_queryset_for_duplicate_reservation(
-            customer_id=customer.id,
-            customer_pet_id=reservation_data["pet_id"],
-            pet_kindergarden_id=pet_kindergarden.id,
-        )
+        available_dates = self.get_available_dates(customer, pet_kindergarden, reservation_data)
+        reserved_dates = self.get_reserved_dates(customer, pet_kindergarden, reservation_data)
         current_date = reservation_data["reserved_date"]
         while current_date <= reservation_data["end_date"]:
             # 휴일이거나 정원이 초과된 날인지 검증
@@ -117,6 +115,7 @@ class HotelReservationStrategy(AbstractReservationStrategy):
         """
         이 함수는 주어진 정보를 바탕으로 호텔 티켓 사용 현황을 반환합니다.
         티켓 횟수 증감 처리를 낙관적 락을 통해 구현했습니다.
+        다른 요청과 충돌하면 최신 잔여 횟수를 다시 확인하여 정해진 횟수만큼 재시도합니다.
 
         Args:
             customer (Customer): 고객 객체
@@ -130,37 +129,64 @@ class HotelReservationStrategy(AbstractReservationStrategy):
             self.reservation_dates.append(current_date)
             current_date += timedelta(days=1)
 
-        customer_tickets = defaultdict(list)
-        for date in self.reservation_dates:
-            available_tickets = (
-                self._customer_ticket_selector.get_queryset_by_customer_and_ticket_type_for_ticket_detail(
-                    customer, TicketType.HOTEL.value
-                )
+        # 예약 컨텍스트에서 조회한 사용 가능한 호텔 티켓을 메모리에서 날짜별로 배정
+        available_tickets = self.booking_context.get_customer_tickets_by_ticket_type(TicketType.HOTEL.value)
+        customer_tickets = self.plan_ticket_allocation(available_tickets, self.reservation_dates)
+
+        # 티켓별로 한 번씩만 차감
+        for customer_ticket, dates in customer_tickets.items():
+
+            def use_ticket(ticket: CustomerTicket, count: int = len(dates)) -> bool:
+                # 재시도 시 다른 요청이 사용한 만큼 잔여 횟수가 부족해질 수 있음
+                if ticket.unused_count < count:
+                    return False
+                ticket.unused_count -= count
+                ticket.used_count += count
+                return True
+
+            save_customer_ticket_with_retry(
+                customer_ticket=customer_ticket,
+                apply=use_ticket,
+                pet_kindergarden_id=self.booking_context.pet_kindergarden.id,
+                update_fields=["used_count", "unused_count", "updated_at", "version"],
+                conflict_code="CONFLICT_CUSTOMER_TICKET",
             )
 
-            if not available_tickets.exists():
-                raise ValidationException(
-                    detail=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER_TICKET"),
-                    code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_TICKET"),
-                )
+        return customer_tickets
 
-            available_ticket = available_tickets.filter(expired_at__gte=date).order_by("expired_at").first()
-            if available_ticket is None:
+    @staticmethod
+    def plan_ticket_allocation(
+        available_tickets: list[CustomerTicket], reservation_dates: list[datetime]
+    ) -> dict[CustomerTicket, list[datetime]]:
+        """
+        이 함수는 숙박하는 날짜마다 사용할 호텔 티켓을 배정합니다.
+        만료일이 가장 빠른 티켓부터 잔여 횟수만큼 사용하며, 해당 날짜에 만료된 티켓은 건너뜁니다.
+
+        Args:
+            available_tickets (list[CustomerTicket]): 만료일 오름차순으로 정렬된 사용 가능한 호텔 티켓 목록
+            reservation_dates (list[datetime]): 오름차순으로 정렬된 숙박 날짜 목록
+
+        Returns:
+            dict[CustomerTicket, list[datetime]]: 티켓별 사용 날짜 목록
+        """
+        customer_tickets: dict[CustomerTicket, list[datetime]] = defaultdict(list)
+        remain_counts = [ticket.unused_count for ticket in available_tickets]
+        index = 0
+        for date in reservation_dates:
+            # 날짜는 오름차순이므로 이미 만료되었거나 모두 사용한 티켓은 이후 날짜에도 사용할 수 없음
+            while index < len(available_tickets) and (
+                remain_counts[index] <= 0 or available_tickets[index].expired_at < date
+            ):
+                index += 1
+
+            if index == len(available_tickets):
                 raise ValidationException(
                     detail=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER_TICKET"),
                     code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_TICKET"),
                 )
 
-            try:
-                available_ticket.unused_count -= 1
-                available_ticket.used_count += 1
-                available_ticket.save(update_fields=["used_count", "unused_count", "updated_at", "version"])
-                customer_tickets[available_ticket].append(date)
-            except RecordModifiedError:
-                raise ValidationException(
-                    detail=SYSTEM_CODE.message("CONFLICT_CUSTOMER_TICKET"),
-                    code=SYSTEM_CODE.code("CONFLICT_CUSTOMER_TICKET"),
-                )
+            remain_counts[index] -= 1
+            customer_tickets[available_tickets[index]].append(date)
 
         return customer_tickets
 
@@ -181,32 +207,34 @@ class HotelReservationStrategy(AbstractReservationStrategy):
         Returns:
             None
         """
-        # 앞으로 예정된 날짜 목록(하원 날짜 포함)
-        hotel_type_reserved_dates = self._reservation_selector.get_queryset_for_hotel_type_reservation(
-            customer_id=customer.id,
-            customer_pet_id=reservation_data["pet_id"],
+        # 같은 반려동물의 다른 호텔 예약이 이미 차지하고 있는 날짜(연속된 예약의 하원일과 등원일)는 1회로 처리
+        # (취소 시에도 같은 기준으로 날짜를 제외하여 감소시킴)
+        daily_reservation_dates = self.reservation_dates + [self.reservation_dates[-1] + timedelta(days=1)]
+        occupied_dates = self._reservation_service.get_hotel_occupied_dates(
             pet_kindergarden_id=pet_kindergarden.id,
+            customer_pet_ids=[reservation_data["pet_id"]],
+            start_date=daily_reservation_dates[0].date(),
+            end_date=daily_reservation_dates[-1].date(),
+        ).get(reservation_data["pet_id"], set())
+        # 정원이 남아있는 날짜만 증가(정원 확인과 증가를 하나의 쿼리로 처리)
+        fully_booked_reserved_ats = self._daily_reservation_service.increase_pet_counts(
+            pet_kindergarden_id=pet_kindergarden.id,
+            reserved_ats=[
+                datetime.combine(date, pet_kindergarden.business_start_hour)
+                for date in daily_reservation_dates
+                if date.date() not in occupied_dates
+            ],
+            ticket_type=TicketType.HOTEL.value,
+            daily_pet_limit=pet_kindergarden.daily_pet_limit,
         )
-        hotel_type_full_reserved_dates = self.append_next_day_to_date_series(hotel_type_reserved_dates)
-
-        # 일일 예약 현황 업데이트(등하원 날짜가 겹치는 연속된 예약은 1회로 처리)
-        daily_reservation_dates = self.reservation_dates + [self.reservation_dates[-1] + timedelta(days=1)]
-        hotel_type_full_reserved_dates_exclude_current_reservation = [
-            date for date in daily_reservation_dates if date not in hotel_type_full_reserved_dates
-        ]
-        for date in daily_reservation_dates:
-            if date not in hotel_type_full_reserved_dates_exclude_current_reservation:
-                continue
-            reserved_at = datetime.combine(date, pet_kindergarden.business_start_hour)
-            daily_reservation, created = DailyReservation.objects.get_or_create(
-                pet_kindergarden_id=pet_kindergarden.id,
-                reserved_at=reserved_at,
-                defaults={"total_pet_count": 1, "hotel_pet_count": 1},
+        if fully_booked_reserved_ats:
+            raise ValidationException(
+                detail=SYSTEM_CODE.message("CANNOT_MAKE_RESERVATION"),
+                code=SYSTEM_CODE.code("CANNOT_MAKE_RESERVATION"),
             )
-            if not created:
-                DailyReservation.objects.filter(
-                    pet_kindergarden_id=pet_kindergarden.id, reserved_at=reserved_at
-                ).update(hotel_pet_count=F("hotel_pet_count") + 1, total_pet_count=F("total_pet_count") + 1)
+
+        # 일일 예약 현황이 변경되었으므로 유치원 캘린더 캐시 만료
+        self._reservation_service.invalidate_pet_kindergarden_calendar(pet_kindergarden.id)
 
     def create_reservations(
         self,
@@ -233,14 +261,15 @@ class HotelReservationStrategy(AbstractReservationStrategy):
                 code=SYSTEM_CODE.code("INVALID_PARAMETER_FORMAT"),
             )
 
-        reservations = []
         reserved_at = datetime.combine(self.reservation_dates[0], pet_kindergarden.business_start_hour)
         end_at = self.reservation_dates[-1] + timedelta(days=1)
-        parent_id = None
-        depth = 0
         is_extented = True if len(customer_tickets) > 1 else False
-        for ticket in customer_tickets:
-            reservation = Reservation.objects.create(
+
+        # 각 예약이 이전 예약을 부모로 가지므로 아이디를 미리 할당한 뒤 한 번에 생성
+        reservation_ids = self._reservation_selector.get_next_ids(len(customer_tickets))
+        reservations = [
+            Reservation(
+                id=reservation_ids[depth],
                 reserved_at=reserved_at,
                 end_at=end_at,
                 is_attended=None,
@@ -249,13 +278,14 @@ class HotelReservationStrategy(AbstractReservationStrategy):
                 customer_id=customer.id,
                 customer_pet_id=reservation_data["pet_id"],
                 customer_ticket_id=ticket.id,
-                parent_id=parent_id,
+                parent_id=reservation_ids[depth - 1] if depth > 0 else None,
+                root_id=reservation_ids[0] if is_extented else None,
                 depth=depth,
                 is_extented=is_extented,
             )
-            parent_id = reservation.id
-            depth += 1
-            reservations.append(reservation)
+            for depth, ticket in enumerate(customer_tickets)
+        ]
+        Reservation.objects.bulk_create(reservations)
 
         return reservations
 
@@ -274,12 +304,16 @@ class HotelReservationStrategy(AbstractReservationStrategy):
         Returns:
             None
         """
-        for index, ticket in enumerate(customer_tickets):
-            CustomerTicketUsageLog.objects.create(
-                customer_ticket_id=ticket.id,
-                reservation_id=reservations[index].id,
-                used_count=len(customer_tickets[ticket]),
-            )
+        CustomerTicketUsageLog.objects.bulk_create(
+            [
+                CustomerTicketUsageLog(
+                    customer_ticket_id=ticket.id,
+                    reservation_id=reservations[index].id,
+                    used_count=len(customer_tickets[ticket]),
+                )
+                for index, ticket in enumerate(customer_tickets)
+            ]
+        )
 
     def get_reservation_info(
         self,
@@ -296,16 +330,16 @@ class HotelReservationStrategy(AbstractReservationStrategy):
         Returns:
             dict[str, Any]: 예약 정보 반환
         """
+        # 티켓은 버전 조건부 UPDATE로 저장했으므로 메모리의 잔여 횟수가 DB에 기록된 값과 같음
         unused_count = 0
         ticket_expiration_dates = []
         for customer_ticket in customer_tickets:
-            count = self._customer_ticket_selector.get_by_customer_ticket_id_for_unused_count(customer_ticket.id)
-            unused_count += count if count is not None else 0
+            unused_count += customer_ticket.unused_count
 
             if customer_ticket.unused_count > 0:
                 ticket_expiration_dates.append(customer_ticket.expired_at)
 
-        pet_name = self._customer_pet_selector.get_by_pet_id_for_pet_name(reservation_data["pet_id"])
+        pet_name = self.get_pet_name(reservation_data)
         reservation_info = {
             "attendance_date": reservation_data["reserved_date"],
             "end_date": reservation_data["end_date"],
@@ -317,24 +351,3 @@ class HotelReservationStrategy(AbstractReservationStrategy):
         }
 
         return reservation_info
-
-    @staticmethod
-    def append_next_day_to_date_series(date_strings: list[str]) -> list[datetime]:
-        """
-        이 함수는 연속된 날짜들을 찾아내고, 각 연속 구간의 끝에 하루를 추가합니다.
-
-        Args:
-            date_strings (list[str]): 고객 객체
-
-        Returns:
-            list[datetime]: DateTime 객체 리스트 반환
-        """
-        dates = sorted(datetime.strptime(date_str, "%Y-%m-%d") for date_str in date_strings)
-
-        extended_dates = []
-        for k, g in groupby(enumerate(dates), lambda x: x[0] - x[1].toordinal()):
-            group = list(map(itemgetter(1), g))
-            extended_dates.extend(group)
-            extended_dates.append(group[-1] + timedelta(days=1))
-
-        return extended_dates
@@ -1,3 +1,5 @@
+from django.conf import settings
+
 from mung_manager.customers.selectors.abstracts import (
     AbstractCustomerPetSelector,
     AbstractCustomerTicketSelector,
@@ -6,13 +8,20 @@ from mung_manager.reservations.selectors.abstracts import (
     AbstractDailyReservationSelector,
     AbstractReservationSelector,
 )
-from mung_manager.reservations.services.abstracts import AbstractReservationService
+from mung_manager.reservations.services.abstracts import (
+    AbstractDailyReservationService,
+    AbstractReservationService,
+)
 from mung_manager.reservations.services.strategies.abstract_strategy import (
     AbstractReservationStrategy,
 )
 from mung_manager.reservations.services.strategies.all_day_reservation_strategy import (
     AllDayReservationStrategy,
 )
+from mung_manager.reservations.services.strategies.booking_function_reservation_strategy import (
+    AllDayBookingFunctionReservationStrategy,
+    TimeBookingFunctionReservationStrategy,
+)
 from mung_manager.reservations.services.strategies.hotel_reservation_strategy import (
     HotelReservationStrategy,
 )
@@ -29,11 +38,13 @@ class ReservationStrategyFactory:
         customer_ticket_selector: AbstractCustomerTicketSelector,
         daily_reservation_selector: AbstractDailyReservationSelector,
         reservation_selector: AbstractReservationSelector,
+        daily_reservation_service: AbstractDailyReservationService,
     ):
         self._customer_pet_selector = customer_pet_selector
         self._customer_ticket_selector = customer_ticket_selector
         self._daily_reservation_selector = daily_reservation_selector
         self._reservation_selector = reservation_selector
+        self._daily_reservation_service = daily_reservation_service
 
     def create_strategy(  # type: ignore
         self,
@@ -50,20 +61,30 @@ class ReservationStrategyFactory:
         Returns:
             AbstractReservationStrategy: 구현한 전략 패턴 구현체 반환
         """
+        # 설정이 켜져 있으면 시간권/종일권 예약의 쓰기 단계를 DB 함수로 처리
+        booking_function_enabled = settings.RESERVATION_BOOKING_FUNCTION_ENABLED
 
         if ticket_type == TicketType.TIME.value:
-            return TimeReservationStrategy(
+            time_strategy_class = (
+                TimeBookingFunctionReservationStrategy if booking_function_enabled else TimeReservationStrategy
+            )
+            return time_strategy_class(
                 customer_pet_selector=self._customer_pet_selector,
                 reservation_service=reservation_service,
                 customer_ticket_selector=self._customer_ticket_selector,
                 reservation_selector=self._reservation_selector,
+                daily_reservation_service=self._daily_reservation_service,
             )
         elif ticket_type == TicketType.ALL_DAY.value:
-            return AllDayReservationStrategy(
+            all_day_strategy_class = (
+                AllDayBookingFunctionReservationStrategy if booking_function_enabled else AllDayReservationStrategy
+            )
+            return all_day_strategy_class(
                 customer_pet_selector=self._customer_pet_selector,
                 reservation_service=reservation_service,
                 customer_ticket_selector=self._customer_ticket_selector,
                 reservation_selector=self._reservation_selector,
+                daily_reservation_service=self._daily_reservation_service,
             )
         elif ticket_type == TicketType.HOTEL.value:
             return HotelReservationStrategy(
@@ -71,4 +92,5 @@ class ReservationStrategyFactory:
                 reservation_service=reservation_service,
                 customer_ticket_selector=self._customer_ticket_selector,
                 reservation_selector=self._reservation_selector,
+                daily_reservation_service=self._daily_reservation_service,
             )
@@ -109,3 +109,55 @@ def send_alimtalk_on_ticket_low(
     except Exception as exc:
         logger.error(f"Failed to send Alimtalk message: {exc}")
         raise self.retry(exc=exc)
+
+
+@shared_task
+def refresh_pet_kindergarden_calendar_cache(pet_kindergarden_id: int) -> None:
+    """
+    이 테스크는 만료된 반려동물 유치원 캘린더 캐시를 재검증합니다.
+
+    Args:
+        pet_kindergarden_id (int): 반려동물 유치원 아이디
+    """
+    # 예약 서비스가 이 모듈을 참조하고 있으므로 순환 참조를 피하기 위해 함수 내부에서 가져옵니다.
+    from mung_manager.reservations.containers import ReservationContainer
+
+    reservation_service = ReservationContainer.reservation_service()
+    reservation_service.refresh_pet_kindergarden_calendar(pet_kindergarden_id=pet_kindergarden_id)
+
+
+@shared_task(name="refresh_pet_kindergarden_calendar_caches")
+def refresh_pet_kindergarden_calendar_caches(pet_kindergarden_ids: list[int]) -> None:
+    """
+    이 테스크는 여러 반려동물 유치원의 캘린더 캐시를 미리 생성합니다.
+    한 유치원의 생성이 실패하더라도 나머지 유치원은 계속 처리합니다.
+
+    Args:
+        pet_kindergarden_ids (list[int]): 반려동물 유치원 아이디 목록
+    """
+    # 예약 서비스가 이 모듈을 참조하고 있으므로 순환 참조를 피하기 위해 함수 내부에서 가져옵니다.
+    from mung_manager.reservations.containers import ReservationContainer
+
+    reservation_service = ReservationContainer.reservation_service()
+    for pet_kindergarden_id in pet_kindergarden_ids:
+        try:
+            reservation_service.refresh_pet_kindergarden_calendar(pet_kindergarden_id=pet_kindergarden_id)
+        except Exception as exc:
+            logger.error(f"Failed to warm pet kindergarden calendar cache({pet_kindergarden_id}): {exc}")
+
+
+@shared_task(name="compact_daily_reservation_shards")
+def compact_daily_reservation_shards() -> None:
+    """
+    이 테스크는 샤드 행으로 나뉜 일별 예약 현황을 반려동물 유치원별로 하나의 행으로 합칩니다.
+    한 유치원의 압축이 실패하더라도 나머지 유치원은 계속 처리합니다.
+    """
+    from mung_manager.reservations.containers import ReservationContainer
+
+    daily_reservation_service = ReservationContainer.daily_reservation_service()
+    for pet_kindergarden_id in daily_reservation_service.get_pet_kindergarden_ids_for_sharded():
+        try:
+            compacted_count = daily_reservation_service.compact_pet_counts(pet_kindergarden_id=pet_kindergarden_id)
+            logger.info(f"Compacted daily reservation shards({pet_kindergarden_id}): {compacted_count} days")
+        except Exception as exc:
+            logger.error(f"Failed to compact daily reservation shards({pet_kindergarden_id}): {exc}")
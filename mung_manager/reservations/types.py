@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import TypedDict
 
 attendance_type = TypedDict(
@@ -24,3 +24,25 @@ is_expired_type = TypedDict(
         "is_expired": bool,
     },
 )
+
+day_off_rule_type = TypedDict(
+    "day_off_rule_type",
+    {
+        "rule_type": str,
+        "weekday": int | None,
+        "month": int | None,
+        "day": int | None,
+        "excluded_at": date | None,
+    },
+)
+
+pet_kindergarden_calendar_type = TypedDict(
+    "pet_kindergarden_calendar_type",
+    {
+        "reservation_availability_option": str | None,
+        "start_ordinal": int,
+        "end_ordinal": int,
+        "closed_ordinals": set[int],
+        "day_off_rules": list[day_off_rule_type],
+    },
+)
@@ -68,3 +68,20 @@ ErrorReservationNotFoundSchema = OpenApiExample(
     status_codes=["404"],
     response_only=True,
 )
+
+ErrorIdempotencyRequestInProgressSchema = OpenApiExample(
+    name="409(idempotency_request_in_progress)",
+    summary="[Conflict]: Idempotency Request In Progress",
+    description="""
+    같은 Idempotency-Key로 보낸 요청이 아직 처리 중일 때 반환되는 응답입니다.
+    """,
+    value={
+        "success": False,
+        "statusCode": 409,
+        "code": "idempotency_request_in_progress",
+        "message": "A request with the same Idempotency-Key is still in progress, please try again later.",
+        "data": {},
+    },
+    status_codes=["409"],
+    response_only=True,
+)
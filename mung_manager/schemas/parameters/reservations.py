@@ -0,0 +1,12 @@
+from drf_spectacular.openapi import OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
+
+from mung_manager.reservations.idempotency import IDEMPOTENCY_KEY_HEADER
+
+ParameterIdempotencyKeySchema = OpenApiParameter(
+    name=IDEMPOTENCY_KEY_HEADER,
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description="요청을 식별하는 고유 키(같은 키로 재시도하면 처음 처리한 응답을 반환)",
+)
@@ -6,6 +6,7 @@ from celery import Celery
 from celery.schedules import crontab
 
 from config.django.base import SERVER_ENV
+from config.settings.reservations import DAILY_RESERVATION_SHARDING_ENABLED
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", SERVER_ENV)
 
@@ -22,4 +23,20 @@ app.conf.beat_schedule = {
         "task": "send_alimtalk_on_five_day_left",
         "schedule": crontab(hour="15", minute="0"),
     },
+    # 자정 이후 날짜가 바뀐 캘린더와 영업 시작 전 캘린더를 미리 생성
+    "warm_pet_kindergarden_calendar_caches_after_midnight": {
+        "task": "warm_pet_kindergarden_calendar_caches",
+        "schedule": crontab(hour="0", minute="5"),
+    },
+    "warm_pet_kindergarden_calendar_caches_before_business_hours": {
+        "task": "warm_pet_kindergarden_calendar_caches",
+        "schedule": crontab(hour="8", minute="30"),
+    },
 }
+
+# 샤드 행으로 나뉜 일별 예약 현황을 주기적으로 압축(샤딩이 설정된 경우에만)
+if DAILY_RESERVATION_SHARDING_ENABLED:
+    app.conf.beat_schedule["compact_daily_reservation_shards"] = {
+        "task": "compact_daily_reservation_shards",
+        "schedule": crontab(minute="*/10"),
+    }
@@ -1,7 +1,9 @@
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.conf import settings
 
 from mung_manager.customers.containers import CustomerContainer
+from mung_manager.reservations.tasks import refresh_pet_kindergarden_calendar_caches
 from mung_manager_commons.request_manager import NaverCloudAlimtalkManager
 
 logger = get_task_logger(__name__)
@@ -79,3 +81,19 @@ def send_alimtalk_on_five_day_left(self) -> None:
     except Exception as exc:
         logger.error(f"Failed to send Alimtalk message: {exc}")
         raise self.retry(exc=exc)
+
+
+@shared_task(name="warm_pet_kindergarden_calendar_caches")
+def warm_pet_kindergarden_calendar_caches() -> None:
+    """
+    이 테스크는 예약 가능한 티켓이 있는 반려동물 유치원의 캘린더 캐시를 미리 생성합니다.
+    유치원 목록을 PET_KINDERGARDEN_CALENDAR_CACHE_WARM_CHUNK_SIZE 단위로 나누어 여러 워커에 분산합니다.
+    """
+    customer_ticket_selector = CustomerContainer.customer_ticket_selector()
+    pet_kindergarden_ids = list(customer_ticket_selector.get_queryset_for_pet_kindergarden_ids_with_available_ticket())
+
+    chunk_size = settings.PET_KINDERGARDEN_CALENDAR_CACHE_WARM_CHUNK_SIZE
+    for i in range(0, len(pet_kindergarden_ids), chunk_size):
+        refresh_pet_kindergarden_calendar_caches.delay(pet_kindergarden_ids=pet_kindergarden_ids[i : i + chunk_size])
+
+    logger.info(f"Dispatched pet kindergarden calendar cache warm-up for {len(pet_kindergarden_ids)} kindergartens")
@@ -0,0 +1,90 @@
+import itertools
+import uuid
+from datetime import date, time
+from decimal import Decimal
+from typing import Any, Callable
+
+import pytest
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.db import models
+from django.utils import timezone
+
+_sequence = itertools.count(1)
+
+
+def _get_required_value(field: models.Field) -> Any:
+    """
+    이 함수는 테스트 객체를 생성할 때 값이 주어지지 않은 필수 필드에 넣을 값을 반환합니다.
+
+    Args:
+        field (models.Field): 모델 필드
+
+    Returns:
+        Any: 필드 타입에 맞는 값
+    """
+    if field.is_relation:
+        return create_instance(field.related_model).pk
+    if field.choices:
+        return field.choices[0][0]
+
+    number = next(_sequence)
+    if getattr(field, "geom_type", None) == "POINT":
+        return Point(127.0, 37.5)
+    if isinstance(field, models.BooleanField):
+        return False
+    if isinstance(field, models.DecimalField):
+        return Decimal(0)
+    if isinstance(field, (models.IntegerField, models.FloatField)):
+        return number
+    if isinstance(field, models.DateTimeField):
+        return timezone.now()
+    if isinstance(field, models.DateField):
+        return date.today()
+    if isinstance(field, models.TimeField):
+        return time(9)
+    if isinstance(field, models.UUIDField):
+        return uuid.uuid4()
+    if isinstance(field, models.JSONField):
+        return {}
+    if isinstance(field, models.EmailField):
+        return f"user{number}@example.com"
+    if isinstance(field, (models.CharField, models.TextField)):
+        value = f"{field.name}{number}"
+        return value[-field.max_length :] if field.max_length else value
+    return None
+
+
+def create_instance(model: type[models.Model], **values: Any) -> Any:
+    """
+    이 함수는 주어진 값으로 모델 객체를 생성하고, 주어지지 않은 필수 필드(NULL 불가, 기본값 없음)는 타입에 맞는 값으로 채웁니다.
+    관계 필드는 연결된 모델 객체를 함께 생성합니다.
+
+    Args:
+        model (type[models.Model]): 모델 클래스
+        **values (Any): 필드 이름별 값
+
+    Returns:
+        Any: 생성된 모델 객체
+    """
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.null or field.has_default() or field.name in values or field.attname in values:
+            continue
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            continue
+        values[field.attname] = _get_required_value(field)
+
+    return model.objects.create(**values)
+
+
+@pytest.fixture
+def model_factory() -> Callable[..., Any]:
+    return create_instance
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # 테스트는 Redis 없이 실행되도록 로컬 메모리 캐시 사용
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    yield
+    cache.clear()
@@ -0,0 +1,76 @@
+from datetime import datetime, time, timedelta
+from typing import Any, Callable
+
+from mung_manager_db.enum_types import TicketType
+from mung_manager_db.models import (
+    Customer,
+    CustomerPet,
+    CustomerTicket,
+    PetKindergarden,
+    Ticket,
+)
+
+RESERVED_DATE = datetime.combine(datetime.now().date() + timedelta(days=3), time.min)
+
+RESERVATION_DATA_BY_TICKET_TYPE = {
+    TicketType.TIME.value: {
+        "ticket_type": f"4{TicketType.TIME.value}",
+        "reserved_date": RESERVED_DATE,
+        "attendance_time": time(10),
+    },
+    TicketType.ALL_DAY.value: {
+        "ticket_type": TicketType.ALL_DAY.value,
+        "reserved_date": RESERVED_DATE,
+    },
+    TicketType.HOTEL.value: {
+        "ticket_type": TicketType.HOTEL.value,
+        "reserved_date": RESERVED_DATE,
+        "end_date": RESERVED_DATE + timedelta(days=2),
+    },
+}
+
+
+def create_booking(model_factory: Callable[..., Any], ticket_type: str, daily_pet_limit: int = -1) -> dict[str, Any]:
+    """
+    이 함수는 예약 한 건에 필요한 유치원, 고객, 반려동물, 티켓과 사용자 입력을 생성합니다.
+
+    Args:
+        model_factory (Callable[..., Any]): 모델 객체 생성 함수
+        ticket_type (str): 티켓 타입(시간, 종일, 호텔)
+        daily_pet_limit (int): 하루 정원(-1이면 제한 없음)
+
+    Returns:
+        dict[str, Any]: 고객, 유치원, 고객 티켓, 사용자 입력
+    """
+    pet_kindergarden = model_factory(
+        PetKindergarden,
+        business_start_hour=time(9),
+        business_end_hour=time(18),
+        daily_pet_limit=daily_pet_limit,
+    )
+    customer = model_factory(Customer, pet_kindergarden=pet_kindergarden, is_active=True)
+    customer_pet = model_factory(CustomerPet, customer=customer, name="멍멍이", is_deleted=False)
+    ticket = model_factory(
+        Ticket,
+        pet_kindergarden=pet_kindergarden,
+        ticket_type=ticket_type,
+        usage_time=4 if ticket_type == TicketType.TIME.value else 0,
+    )
+    customer_ticket = model_factory(
+        CustomerTicket,
+        customer=customer,
+        ticket=ticket,
+        used_count=0,
+        unused_count=5,
+        expired_at=datetime.now() + timedelta(days=30),
+    )
+    return {
+        "customer": customer,
+        "pet_kindergarden": pet_kindergarden,
+        "customer_ticket": customer_ticket,
+        "reservation_data": {
+            **RESERVATION_DATA_BY_TICKET_TYPE[ticket_type],
+            "pet_id": customer_pet.id,
+            "ticket_id": None if ticket_type == TicketType.HOTEL.value else customer_ticket.id,
+        },
+    }
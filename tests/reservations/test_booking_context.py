@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+import pytest
+
+from mung_manager.reservations.containers import ReservationContainer
+from mung_manager_db.enum_types import ReservationStatus, TicketType
+from mung_manager_db.models import CustomerTicket, Reservation
+from tests.reservations.factories import RESERVED_DATE, create_booking
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("ticket_type", [TicketType.TIME.value, TicketType.ALL_DAY.value, TicketType.HOTEL.value])
+@pytest.mark.parametrize("extra_count", [0, 5])
+def test_load_booking_context_runs_fixed_number_of_queries(
+    django_assert_num_queries, model_factory, ticket_type, extra_count
+):
+    booking = create_booking(model_factory, ticket_type)
+    customer_ticket = booking["customer_ticket"]
+    # 티켓과 기존 예약 수가 늘어나도 쿼리 수는 같아야 함
+    for index in range(extra_count):
+        model_factory(
+            CustomerTicket,
+            customer=booking["customer"],
+            ticket=customer_ticket.ticket,
+            used_count=0,
+            unused_count=1,
+            expired_at=customer_ticket.expired_at + timedelta(days=index),
+        )
+        model_factory(
+            Reservation,
+            customer=booking["customer"],
+            customer_pet_id=booking["reservation_data"]["pet_id"],
+            customer_ticket=customer_ticket,
+            pet_kindergarden=booking["pet_kindergarden"],
+            reserved_at=RESERVED_DATE + timedelta(days=10 + index, hours=9),
+            end_at=RESERVED_DATE + timedelta(days=10 + index, hours=18),
+            reservation_status=ReservationStatus.COMPLETED.value,
+        )
+    strategy = ReservationContainer.reservation_service().get_strategy(ticket_type)
+
+    # 반려동물, 사용 가능한 티켓(티켓 정보 포함), 이미 예약한 날짜
+    with django_assert_num_queries(3):
+        booking_context = strategy.load_booking_context(
+            booking["customer"], booking["pet_kindergarden"], booking["reservation_data"]
+        )
+        assert [ticket.ticket.ticket_type for ticket in booking_context.customer_tickets] == [ticket_type] * (
+            extra_count + 1
+        )
+
+    # 같은 예약을 처리하는 동안에는 다시 조회하지 않음
+    with django_assert_num_queries(0):
+        strategy.load_booking_context(booking["customer"], booking["pet_kindergarden"], booking["reservation_data"])
+        assert strategy.booking_context is booking_context
+    assert len(booking_context.reserved_dates) == extra_count
+
+
+def test_booking_context_is_required_before_write_phase():
+    strategy = ReservationContainer.reservation_service().get_strategy(TicketType.TIME.value)
+
+    with pytest.raises(RuntimeError):
+        strategy.booking_context
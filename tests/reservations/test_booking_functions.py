@@ -0,0 +1,218 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+import pytest
+from django.db import transaction
+from django.db.models import F
+
+from mung_manager.reservations.containers import ReservationContainer
+from mung_manager.reservations.services.strategies.booking_function_reservation_strategy import (
+    BookingFunctionReservationMixin,
+)
+from mung_manager_commons.constants import SYSTEM_CODE
+from mung_manager_commons.errors import ValidationException
+from mung_manager_db.enum_types import TicketType
+from mung_manager_db.models import (
+    CustomerTicket,
+    CustomerTicketUsageLog,
+    DailyReservation,
+    Reservation,
+)
+from tests.reservations.factories import RESERVED_DATE, create_booking
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def send_alimtalk_on_ticket_low(mocker):
+    return mocker.patch("mung_manager.reservations.services.reservations.send_alimtalk_on_ticket_low")
+
+
+def book(booking: dict[str, Any], before_reserve: Optional[Callable[[], None]] = None) -> Optional[str]:
+    """
+    이 함수는 예약을 검증하고 생성하며, 검증 에러가 발생하면 해당 트랜잭션을 롤백하고 에러 코드를 반환합니다.
+
+    Args:
+        booking (dict[str, Any]): create_booking 반환값
+        before_reserve (Optional[Callable[[], None]]): 검증과 쓰기 단계 사이에 실행할 함수(동시 요청 재현용)
+
+    Returns:
+        Optional[str]: 에러 코드(성공하면 None)
+    """
+    reservation_service = ReservationContainer.reservation_service()
+    strategy = reservation_service.get_strategy(booking["reservation_data"]["ticket_type"][-2:])
+    try:
+        with transaction.atomic():
+            strategy.validate(booking["customer"], booking["pet_kindergarden"], booking["reservation_data"])
+            if before_reserve is not None:
+                before_reserve()
+            strategy.reserve(booking["customer"], booking["pet_kindergarden"], booking["reservation_data"])
+    except ValidationException as e:
+        return e.get_codes()
+    return None
+
+
+def get_snapshot(booking: dict[str, Any]) -> dict[str, list[tuple]]:
+    """
+    이 함수는 예약 결과로 변경된 행을 아이디 없이 비교할 수 있는 형태로 조회합니다.
+
+    Args:
+        booking (dict[str, Any]): create_booking 반환값
+
+    Returns:
+        dict[str, list[tuple]]: 예약, 일별 예약 현황, 고객 티켓, 티켓 사용 로그
+    """
+    pet_kindergarden_id = booking["pet_kindergarden"].id
+    return {
+        "reservations": list(
+            Reservation.objects.filter(pet_kindergarden_id=pet_kindergarden_id)
+            .order_by("reserved_at")
+            .values_list("reserved_at", "end_at", "reservation_status", "is_attended", "customer_pet__name")
+        ),
+        "daily_reservations": list(
+            DailyReservation.objects.filter(pet_kindergarden_id=pet_kindergarden_id)
+            .order_by("reserved_at")
+            .values_list("reserved_at", "total_pet_count", "time_pet_count", "all_day_pet_count", "hotel_pet_count")
+        ),
+        "customer_tickets": list(
+            CustomerTicket.objects.filter(customer=booking["customer"])
+            .order_by("id")
+            .values_list("used_count", "unused_count")
+        ),
+        "customer_ticket_usage_logs": list(
+            CustomerTicketUsageLog.objects.filter(customer_ticket__customer=booking["customer"])
+            .order_by("reservation__reserved_at")
+            .values_list("reservation__reserved_at", "used_count")
+        ),
+    }
+
+
+def run_on_both_paths(
+    settings,
+    model_factory: Callable[..., Any],
+    ticket_type: str,
+    daily_pet_limit: int = -1,
+    prepare: Optional[Callable[[dict[str, Any]], Optional[Callable[[], None]]]] = None,
+) -> dict[bool, tuple[Optional[str], dict[str, list[tuple]]]]:
+    """
+    이 함수는 같은 예약을 파이썬 전략과 DB 함수로 각각 처리하고 에러 코드와 결과 행을 반환합니다.
+
+    Args:
+        settings: pytest-django settings 픽스처
+        model_factory (Callable[..., Any]): 모델 객체 생성 함수
+        ticket_type (str): 티켓 타입(시간, 종일, 호텔)
+        daily_pet_limit (int): 하루 정원(-1이면 제한 없음)
+        prepare (Optional[Callable]): 예약 데이터를 받아 검증과 쓰기 단계 사이에 실행할 함수를 반환하는 함수
+
+    Returns:
+        dict[bool, tuple[Optional[str], dict[str, list[tuple]]]]: DB 함수 사용 여부별 에러 코드와 결과 행
+    """
+    results = {}
+    for booking_function_enabled in [False, True]:
+        settings.RESERVATION_BOOKING_FUNCTION_ENABLED = booking_function_enabled
+        booking = create_booking(model_factory, ticket_type, daily_pet_limit)
+        before_reserve = prepare(booking) if prepare is not None else None
+        results[booking_function_enabled] = (book(booking, before_reserve), get_snapshot(booking))
+    return results
+
+
+@pytest.mark.parametrize("ticket_type", [TicketType.TIME.value, TicketType.ALL_DAY.value])
+def test_booking_function_creates_same_rows_as_python_strategy(settings, model_factory, ticket_type):
+    results = run_on_both_paths(settings, model_factory, ticket_type)
+
+    error_code, snapshot = results[False]
+    assert error_code is None
+    assert snapshot["reservations"]
+    assert results[True] == results[False]
+
+
+@pytest.mark.parametrize("ticket_type", [TicketType.TIME.value, TicketType.ALL_DAY.value])
+def test_strategy_factory_uses_booking_function_only_when_enabled(settings, ticket_type):
+    reservation_service = ReservationContainer.reservation_service()
+
+    settings.RESERVATION_BOOKING_FUNCTION_ENABLED = True
+    assert isinstance(reservation_service.get_strategy(ticket_type), BookingFunctionReservationMixin)
+
+    settings.RESERVATION_BOOKING_FUNCTION_ENABLED = False
+    assert not isinstance(reservation_service.get_strategy(ticket_type), BookingFunctionReservationMixin)
+
+
+def test_hotel_strategy_does_not_use_booking_function(settings):
+    settings.RESERVATION_BOOKING_FUNCTION_ENABLED = True
+
+    strategy = ReservationContainer.reservation_service().get_strategy(TicketType.HOTEL.value)
+
+    assert not isinstance(strategy, BookingFunctionReservationMixin)
+
+
+@pytest.mark.parametrize("ticket_type", [TicketType.TIME.value, TicketType.ALL_DAY.value])
+def test_booking_function_rejects_fully_booked_day_like_python_strategy(settings, model_factory, ticket_type):
+    def prepare(booking: dict[str, Any]) -> Callable[[], None]:
+        # 검증 이후 다른 예약이 정원을 모두 채운 상황
+        return lambda: model_factory(
+            DailyReservation,
+            pet_kindergarden=booking["pet_kindergarden"],
+            reserved_at=RESERVED_DATE.replace(hour=7),
+            total_pet_count=1,
+            time_pet_count=1,
+            all_day_pet_count=0,
+            hotel_pet_count=0,
+        )
+
+    results = run_on_both_paths(settings, model_factory, ticket_type, daily_pet_limit=1, prepare=prepare)
+
+    error_code, snapshot = results[False]
+    assert error_code == SYSTEM_CODE.code("INVALID_RESERVED_AT")
+    assert snapshot["reservations"] == []
+    assert snapshot["customer_tickets"] == [(0, 5)]
+    assert results[True] == results[False]
+
+
+@pytest.mark.parametrize("ticket_type", [TicketType.TIME.value, TicketType.ALL_DAY.value])
+def test_booking_function_rejects_ticket_used_up_after_validation_like_python_strategy(
+    settings, model_factory, ticket_type
+):
+    def prepare(booking: dict[str, Any]) -> Callable[[], None]:
+        # 검증 이후 다른 예약이 티켓의 잔여 횟수를 모두 사용한 상황
+        return lambda: CustomerTicket.objects.filter(id=booking["customer_ticket"].id).update(
+            used_count=F("used_count") + F("unused_count"),
+            unused_count=0,
+            version=F("version") + 1,
+        )
+
+    results = run_on_both_paths(settings, model_factory, ticket_type, prepare=prepare)
+
+    error_code, snapshot = results[False]
+    assert error_code == SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_TICKET")
+    assert snapshot["reservations"] == []
+    assert snapshot["daily_reservations"] == []
+    assert results[True] == results[False]
+
+
+@pytest.mark.parametrize("ticket_type", [TicketType.TIME.value, TicketType.ALL_DAY.value])
+def test_booking_function_uses_ticket_modified_after_validation_like_python_strategy(
+    settings, model_factory, ticket_type
+):
+    def prepare(booking: dict[str, Any]) -> Callable[[], None]:
+        # 검증 이후 다른 요청이 잔여 횟수는 남긴 채 티켓을 수정(버전만 증가)한 상황
+        return lambda: CustomerTicket.objects.filter(id=booking["customer_ticket"].id).update(version=F("version") + 1)
+
+    results = run_on_both_paths(settings, model_factory, ticket_type, prepare=prepare)
+
+    error_code, snapshot = results[False]
+    assert error_code is None
+    assert snapshot["customer_tickets"] == [(1, 4)]
+    assert results[True] == results[False]
+
+
+def test_booking_function_rejects_expired_ticket(settings, model_factory):
+    settings.RESERVATION_BOOKING_FUNCTION_ENABLED = True
+    booking = create_booking(model_factory, TicketType.TIME.value)
+
+    def expire_ticket() -> None:
+        CustomerTicket.objects.filter(id=booking["customer_ticket"].id).update(
+            expired_at=datetime.now() - timedelta(days=1)
+        )
+
+    assert book(booking, before_reserve=expire_ticket) == SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_TICKET")
+    assert get_snapshot(booking)["reservations"] == []
@@ -0,0 +1,23 @@
+import threading
+
+from mung_manager.reservations.caches import SingleFlight
+
+
+def test_single_flight_falls_back_when_leader_hangs():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def hang() -> str:
+        started.set()
+        release.wait(5)
+        return "leader"
+
+    leader = threading.Thread(target=lambda: single_flight.do("key", hang))
+    leader.start()
+    started.wait(5)
+    try:
+        assert single_flight.do("key", hang, timeout=0.01, fallback=lambda: "fallback") == "fallback"
+    finally:
+        release.set()
+        leader.join()
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+import pytest
+
+from mung_manager.reservations.services.daily_reservations import (
+    DailyReservationService,
+)
+from mung_manager_db.enum_types import TicketType
+from mung_manager_db.models import DailyReservation, PetKindergarden
+from tests.reservations.factories import RESERVED_DATE
+
+pytestmark = pytest.mark.django_db
+
+
+def test_decrease_pet_counts_decrements_duplicates_across_shards_in_one_query(django_assert_num_queries, model_factory):
+    pet_kindergarden = model_factory(PetKindergarden)
+    reserved_at = RESERVED_DATE.replace(hour=10)
+    for shard, pet_count in [(0, 2), (1, 1), (2, 1)]:
+        model_factory(
+            DailyReservation,
+            pet_kindergarden=pet_kindergarden,
+            reserved_at=reserved_at,
+            shard=shard,
+            total_pet_count=pet_count,
+            time_pet_count=pet_count,
+            all_day_pet_count=0,
+            hotel_pet_count=0,
+        )
+
+    with django_assert_num_queries(1):
+        DailyReservationService().decrease_pet_counts(
+            pet_kindergarden_id=pet_kindergarden.id,
+            reserved_ats=[reserved_at] * 3,
+            ticket_type=TicketType.TIME.value,
+        )
+
+    assert sorted(
+        DailyReservation.objects.filter(pet_kindergarden=pet_kindergarden).values_list(
+            "total_pet_count", "time_pet_count"
+        )
+    ) == [(0, 0), (0, 0), (1, 1)]
+
+
+def test_decrease_pet_counts_matches_all_day_rows_by_date(model_factory):
+    pet_kindergarden = model_factory(PetKindergarden)
+    model_factory(
+        DailyReservation,
+        pet_kindergarden=pet_kindergarden,
+        reserved_at=RESERVED_DATE.replace(hour=9),
+        shard=0,
+        total_pet_count=3,
+        time_pet_count=0,
+        all_day_pet_count=3,
+        hotel_pet_count=0,
+    )
+
+    # 예약 이후 영업 시작 시간이 변경되어도 같은 날짜의 행을 감소
+    DailyReservationService().decrease_pet_counts(
+        pet_kindergarden_id=pet_kindergarden.id,
+        reserved_ats=[RESERVED_DATE.replace(hour=10)] * 2 + [RESERVED_DATE + timedelta(days=1, hours=10)],
+        ticket_type=TicketType.ALL_DAY.value,
+    )
+
+    assert list(
+        DailyReservation.objects.filter(pet_kindergarden=pet_kindergarden).values_list(
+            "total_pet_count", "all_day_pet_count"
+        )
+    ) == [(1, 1)]
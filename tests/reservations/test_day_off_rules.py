@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from mung_manager.reservations.containers import ReservationContainer
+from mung_manager_db.models import PetKindergarden
+
+pytestmark = pytest.mark.django_db
+
+
+def test_day_off_rules_are_read_from_cached_calendar(django_assert_num_queries, model_factory):
+    pet_kindergarden = model_factory(PetKindergarden)
+    reservation_service = ReservationContainer.reservation_service()
+    reservation_service.get_pet_kindergarden_calendar(pet_kindergarden.id, timezone.now().date() + timedelta(days=7))
+
+    # 캘린더 캐시가 신선하면 반복 휴무 규칙을 다시 조회하지 않음
+    with django_assert_num_queries(0):
+        day_off_rules = reservation_service.get_day_off_rules(pet_kindergarden.id)
+
+    assert day_off_rules == []
@@ -0,0 +1,83 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from mung_manager.reservations.idempotency import (
+    IDEMPOTENCY_REPLAYED_HEADER,
+    IdempotencyStore,
+)
+from mung_manager_commons.constants import SYSTEM_CODE
+from mung_manager_commons.errors import ValidationException
+
+SCOPE = "reservation_create"
+
+
+def create_request() -> Request:
+    request = Request(
+        APIRequestFactory().post("/customers/reservations", {"pet_id": 1}, format="json", HTTP_IDEMPOTENCY_KEY="key"),
+        parsers=[JSONParser()],
+    )
+    request.pet_kindergarden = SimpleNamespace(id=1)
+    request.user = SimpleNamespace(id=1)
+    return request
+
+
+def test_duplicate_request_replays_stored_response():
+    idempotency_store = IdempotencyStore()
+    handled_count = 0
+
+    def handler() -> Response:
+        nonlocal handled_count
+        handled_count += 1
+        return Response(data={"reservation_id": 1}, status=status.HTTP_201_CREATED)
+
+    idempotency_store.run(create_request(), SCOPE, handler)
+    response = idempotency_store.run(create_request(), SCOPE, handler)
+
+    assert handled_count == 1
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data == {"reservation_id": 1}
+    assert response[IDEMPOTENCY_REPLAYED_HEADER] == "true"
+
+
+def test_duplicate_request_does_not_run_while_first_request_is_processing(settings):
+    settings.IDEMPOTENCY_WAIT_TIMEOUT = 0
+    idempotency_store = IdempotencyStore()
+    request = create_request()
+    # 먼저 도착한 요청이 아직 처리 중인 상태
+    cache.add(
+        idempotency_store._get_key(request, SCOPE, "key"),
+        {"status": IdempotencyStore.PROCESSING, "fingerprint": idempotency_store._get_fingerprint(request)},
+    )
+
+    def handler() -> Response:
+        raise AssertionError("duplicate request must not be handled")
+
+    with pytest.raises(ValidationException) as e:
+        idempotency_store.run(request, SCOPE, handler)
+
+    assert e.value.get_codes() == SYSTEM_CODE.code("IDEMPOTENCY_REQUEST_IN_PROGRESS")
+
+
+def test_claim_is_extended_while_handler_runs_longer_than_lock_timeout(settings):
+    settings.IDEMPOTENCY_LOCK_TIMEOUT = 0.3
+    idempotency_store = IdempotencyStore()
+    request = create_request()
+    key = idempotency_store._get_key(request, SCOPE, "key")
+
+    def handler() -> Response:
+        time.sleep(0.6)
+        # 선점 유지 시간이 지나도 처리 중인 동안에는 선점이 남아 있어야 함
+        assert cache.get(key)["status"] == IdempotencyStore.PROCESSING
+        return Response(data={"reservation_id": 1}, status=status.HTTP_201_CREATED)
+
+    idempotency_store.run(request, SCOPE, handler)
+
+    assert cache.get(key)["status"] == IdempotencyStore.COMPLETED
@@ -0,0 +1,45 @@
+import pytest
+from django.db import transaction
+
+from mung_manager.reservations.optimistic_locks import (
+    CustomerTicketLockConflict,
+    run_with_customer_ticket_lock_retry,
+)
+from mung_manager_commons.constants import SYSTEM_CODE
+from mung_manager_commons.errors import ValidationException
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def test_run_with_customer_ticket_lock_retry_sleeps_outside_transaction(settings, mocker):
+    settings.CUSTOMER_TICKET_LOCK_MAX_RETRIES = 3
+    in_atomic_block_on_sleep = []
+    mocker.patch(
+        "mung_manager.reservations.optimistic_locks.time.sleep",
+        side_effect=lambda _: in_atomic_block_on_sleep.append(transaction.get_connection().in_atomic_block),
+    )
+    attempts = []
+
+    def write() -> str:
+        attempts.append(transaction.get_connection().in_atomic_block)
+        if len(attempts) < 3:
+            raise CustomerTicketLockConflict("CONFLICT_CUSTOMER_TICKET")
+        return "reserved"
+
+    assert run_with_customer_ticket_lock_retry(write, pet_kindergarden_id=1) == "reserved"
+    # 매 시도는 트랜잭션 안에서, 대기는 트랜잭션(잠금)을 해제한 뒤에 실행
+    assert attempts == [True, True, True]
+    assert in_atomic_block_on_sleep == [False, False]
+
+
+def test_run_with_customer_ticket_lock_retry_raises_conflict_code_after_max_retries(settings, mocker):
+    settings.CUSTOMER_TICKET_LOCK_MAX_RETRIES = 1
+    mocker.patch("mung_manager.reservations.optimistic_locks.time.sleep")
+
+    def write() -> str:
+        raise CustomerTicketLockConflict("CONFLICT_CUSTOMER_TICKET")
+
+    with pytest.raises(ValidationException) as e:
+        run_with_customer_ticket_lock_retry(write, pet_kindergarden_id=1)
+
+    assert e.value.get_codes() == SYSTEM_CODE.code("CONFLICT_CUSTOMER_TICKET")